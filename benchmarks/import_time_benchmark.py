@@ -0,0 +1,60 @@
+"""Time spent importing the SDK packages, measured with :code:`python -X importtime` in fresh interpreters.
+
+Importing :code:`horiba_sdk.devices` only imports the lightweight modules, the device manager and its dependencies
+(numpy, websockets, psutil) are imported on first use. Reports the import time of the package alone and with the
+:class:`DeviceManager`. Only the imports done by the statement are counted, not the ones done when the interpreter
+starts.
+
+Usage::
+
+    python benchmarks/import_time_benchmark.py
+"""
+
+import subprocess
+import sys
+
+REPETITIONS: int = 5
+STATEMENTS: tuple[str, ...] = (
+    'import horiba_sdk',
+    'import horiba_sdk.devices',
+    'import horiba_sdk.sync.devices',
+    'from horiba_sdk.devices import DeviceManager',
+    'from horiba_sdk.sync.devices import DeviceManager',
+)
+_MARKER: str = 'horiba_sdk import time benchmark: statement starts'
+
+
+def _import_time_in_us(statement: str) -> int:
+    # the marker separates the imports of the statement from the ones done when the interpreter starts, both are
+    # written to stderr in the order they happen
+    code: str = f'import sys; sys.stderr.write({_MARKER!r} + "\\n"); sys.stderr.flush(); {statement}'
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True
+    )
+    lines: list[str] = completed.stderr.splitlines()
+    import_time_us: int = 0
+    for line in lines[lines.index(_MARKER) + 1 :]:
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, module = line.split('|')
+        # nested imports are indented, their time is already included in the one of the top level import
+        if not module.startswith('  '):
+            import_time_us += int(cumulative_us)
+    return import_time_us
+
+
+def _best_import_time_in_us(statement: str) -> int:
+    return min(_import_time_in_us(statement) for _ in range(REPETITIONS))
+
+
+def main() -> None:
+    for statement in STATEMENTS:
+        _import_time_in_us(statement)  # warms up the bytecode cache
+
+    print(f'{"statement":<55}{"import time [ms]":>18}')
+    for statement in STATEMENTS:
+        print(f'{statement:<55}{_best_import_time_in_us(statement) / 1000:>18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Per-message cost of the JSON codecs used by :class:`Command` and :class:`JSONResponse`.
+
+Measures the encoding of a typical command and the decoding of a small getter reply and of a full 1024x256 image
+acquisition reply, for every installed codec.
+
+Usage::
+
+    python benchmarks/json_codec_benchmark.py
+"""
+
+import json
+import timeit
+
+from horiba_sdk.communication import (
+    Command,
+    JSONCodec,
+    JSONResponse,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    json_codec,
+    set_json_codec,
+)
+
+
+def _installed_codecs() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [StdlibJSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print('orjson is not installed, only the stdlib codec is measured')
+    return codecs
+
+
+def _time_per_call_in_us(function, repetitions: int) -> float:
+    return min(timeit.repeat(function, number=repetitions, repeat=5)) / repetitions * 1e6
+
+
+def main() -> None:
+    getter_reply: str = json.dumps({'id': 1, 'command': 'ccd_getGain', 'results': {'token': 2}, 'errors': []})
+    image = [[(x * y) % 65536 for x in range(1024)] for y in range(256)]
+    roi = {'roiIndex': 1, 'xOrigin': 0, 'yOrigin': 0, 'xSize': 1024, 'ySize': 256, 'xBinning': 1, 'yBinning': 1}
+    acquisition_reply: str = json.dumps(
+        {
+            'id': 2,
+            'command': 'ccd_getAcquisitionData',
+            'results': {
+                'acquisition': [{'acqIndex': 1, 'roi': [{**roi, 'xData': [list(range(1024))], 'yData': image}]}]
+            },
+            'errors': [],
+        }
+    )
+    command: Command = Command('ccd_setRoi', {'index': 0, 'roiIndex': 1, 'xOrigin': 0, 'xSize': 1024, 'ySize': 256})
+
+    previous_codec: JSONCodec = json_codec()
+    print(f'{"codec":<20}{"encode command":>20}{"decode getter reply":>25}{"decode 1024x256 image":>25}')
+    for codec in _installed_codecs():
+        set_json_codec(codec)
+        encode_us = _time_per_call_in_us(command.json, 10000)
+        decode_getter_us = _time_per_call_in_us(lambda: JSONResponse(getter_reply), 10000)
+        decode_image_us = _time_per_call_in_us(lambda: JSONResponse(acquisition_reply), 10)
+        print(
+            f'{type(codec).__name__:<20}{encode_us:>17.2f} us{decode_getter_us:>22.2f} us'
+            f'{decode_image_us / 1000:>22.2f} ms'
+        )
+    set_json_codec(previous_codec)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Acquisition throughput of concurrent clients of the :class:`ICLSimulatorServer`, without hardware.
+
+Each client runs its own :class:`DeviceManager` with binary messages enabled and acquires 1024x128 images from its own
+simulated CCD in a loop, an image frame of 512 KiB stays below the 1 MiB message size limit of the websocket client.
+Reports the acquisitions per second and the data rate for an increasing number of clients.
+
+Usage::
+
+    python benchmarks/simulator_throughput_benchmark.py
+"""
+
+import asyncio
+import sys
+import time
+
+from loguru import logger
+
+from horiba_sdk.core.acquisition_format import AcquisitionFormat
+from horiba_sdk.devices import DeviceManager, ICLSimulator, ICLSimulatorServer
+
+ACQUISITIONS_PER_CLIENT: int = 20
+CLIENT_COUNTS: tuple[int, ...] = (1, 2, 4, 8)
+
+
+async def _run_client(port: int, ccd_index: int) -> int:
+    device_manager: DeviceManager = DeviceManager(start_icl=False, icl_port=str(port))
+    await device_manager.start()
+    received_bytes: int = 0
+    try:
+        ccd = device_manager.charge_coupled_devices[ccd_index]
+        await ccd.open()
+        await ccd.set_exposure_time(1)
+        await ccd.set_acquisition_format(1, AcquisitionFormat.IMAGE)
+        await ccd.set_region_of_interest(1, 0, 0, 1024, 128, 1, 1)
+        for _ in range(ACQUISITIONS_PER_CLIENT):
+            acquisitions = await ccd.acquire(timeout=10)
+            roi = acquisitions[0].regions_of_interest[0]
+            received_bytes += roi.x_data.nbytes + roi.y_data.nbytes
+        await ccd.close()
+    finally:
+        await device_manager.stop()
+    return received_bytes
+
+
+async def _measure(client_count: int) -> tuple[float, float]:
+    async with ICLSimulatorServer(simulator=ICLSimulator(ccd_count=client_count)) as server:
+        start: float = time.perf_counter()
+        received_bytes = await asyncio.gather(*(_run_client(server.port, index) for index in range(client_count)))
+        elapsed_s: float = time.perf_counter() - start
+    return client_count * ACQUISITIONS_PER_CLIENT / elapsed_s, sum(received_bytes) / elapsed_s / 1e6
+
+
+def main() -> None:
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    print(f'{"clients":<10}{"acquisitions/s":>18}{"MB/s":>10}')
+    for client_count in CLIENT_COUNTS:
+        acquisitions_per_s, megabytes_per_s = asyncio.run(_measure(client_count))
+        print(f'{client_count:<10}{acquisitions_per_s:>18.1f}{megabytes_per_s:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Cost of stitching the segments of a broadband range scan.
+
+Compares the pairwise, list based :class:`LinearSpectraStitch` of the examples with
+:func:`horiba_sdk.core.stitching.stitch_linear` for 50 to 500 segments of 1024 pixels overlapping by 10 pixels.
+
+Usage::
+
+    PYTHONPATH=. python benchmarks/stitching_benchmark.py
+"""
+
+import timeit
+from functools import partial
+
+import numpy as np
+import numpy.typing as npt
+
+from examples.asynchronous_examples.linear_spectra_stitch import LinearSpectraStitch
+from horiba_sdk.core.stitching import stitch_linear
+
+_PIXELS: int = 1024
+_PIXEL_OVERLAP: int = 10
+_DISPERSION_NM_PER_PIXEL: float = 0.05
+
+
+def _segments(count: int) -> list[tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]]:
+    rng = np.random.default_rng(0)
+    segments = []
+    for index in range(count):
+        first_pixel: int = index * (_PIXELS - _PIXEL_OVERLAP)
+        x_values = 200.0 + (first_pixel + np.arange(_PIXELS)) * _DISPERSION_NM_PER_PIXEL
+        segments.append((x_values, rng.poisson(600, _PIXELS).astype(np.float64)))
+    return segments
+
+
+def _time_in_ms(function, repetitions: int) -> float:
+    return min(timeit.repeat(function, number=repetitions, repeat=3)) / repetitions * 1e3
+
+
+def main() -> None:
+    print(f'{"segments":>10}{"LinearSpectraStitch":>25}{"stitch_linear":>20}{"speedup":>12}')
+    for count in (50, 100, 200, 500):
+        segments = _segments(count)
+        segments_as_lists = [[x_values.tolist(), y_values.tolist()] for x_values, y_values in segments]
+        pairwise_ms = _time_in_ms(partial(LinearSpectraStitch, segments_as_lists), 1)
+        vectorized_ms = _time_in_ms(partial(stitch_linear, segments), 10)
+        print(f'{count:>10}{pairwise_ms:>22.1f} ms{vectorized_ms:>17.2f} ms{pairwise_ms / vectorized_ms:>11.0f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Round-trip time of commands sent with the sync :class:`WebsocketCommunicator` against the fake ICL server.
+
+Measures a single getter and a sequence of 50 getters, like a typical device setup.
+
+Usage::
+
+    python benchmarks/sync_round_trip_benchmark.py
+"""
+
+import statistics
+import sys
+import threading
+import time
+
+from loguru import logger
+
+from horiba_sdk.communication import Command
+from horiba_sdk.sync.communication import WebsocketCommunicator
+from horiba_sdk.sync.devices.fake_icl_server import FakeICLServer
+
+HOST: str = 'localhost'
+PORT: int = 8767
+
+
+def _time_in_ms(function, repetitions: int) -> list[float]:
+    durations: list[float] = []
+    for _ in range(repetitions):
+        start: float = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main() -> None:
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    server: FakeICLServer = FakeICLServer(fake_icl_host=HOST, fake_icl_port=PORT)
+    server_thread: threading.Thread = threading.Thread(target=server.start)
+    server_thread.start()
+    time.sleep(0.5)
+
+    communicator: WebsocketCommunicator = WebsocketCommunicator(f'ws://{HOST}:{PORT}')
+    communicator.open()
+    try:
+        single_ms = _time_in_ms(lambda: communicator.request_with_response(Command('icl_info', {})), 50)
+        setup_ms = _time_in_ms(
+            lambda: [communicator.request_with_response(Command('ccd_getGain', {'index': 0})) for _ in range(50)], 5
+        )
+    finally:
+        communicator.close()
+        server.stop()
+        server_thread.join()
+
+    print(f'single command round-trip: median {statistics.median(single_ms):.2f} ms, max {max(single_ms):.2f} ms')
+    print(f'50 sequential commands:    median {statistics.median(setup_ms):.2f} ms, max {max(setup_ms):.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
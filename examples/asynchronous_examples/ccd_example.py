@@ -33,17 +33,9 @@ async def main():
         logger.info(await ccd.get_temperature())
         await ccd.set_region_of_interest()  # Set default ROI, if you want a custom ROI, pass the parameters
         logger.info(await ccd.get_speed())
-        if await ccd.get_acquisition_ready():
-            await ccd.set_acquisition_start(open_shutter=True)
-            await asyncio.sleep(1)  # Wait a short period for the acquisition to start
-            # Poll for acquisition status
-            acquisition_busy = True
-            while acquisition_busy:
-                acquisition_busy = await ccd.get_acquisition_busy()
-                await asyncio.sleep(0.3)
-                logger.info('Acquisition busy')
-
-            logger.info(await ccd.get_acquisition_data())
+        acquisitions = await ccd.acquire(open_shutter=True)
+        roi = acquisitions[0].regions_of_interest[0]
+        logger.info(f'x: {roi.x_data}, y: {roi.y_data}')
     finally:
         await ccd.close()
 
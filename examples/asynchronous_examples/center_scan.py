@@ -90,19 +90,13 @@ async def plot_values(target_wavelength, xy_data):
 
 
 async def wait_for_ccd(ccd):
-    acquisition_busy = True
-    while acquisition_busy:
-        acquisition_busy = await ccd.get_acquisition_busy()
-        await asyncio.sleep(1)
-        logger.info('Acquisition busy')
+    report = await ccd.wait_until_idle()
+    logger.info(f'CCD idle after {report.polls} polls')
 
 
 async def wait_for_mono(mono):
-    mono_busy = True
-    while mono_busy:
-        mono_busy = await mono.is_busy()
-        await asyncio.sleep(1)
-        logger.info('Mono busy...')
+    report = await mono.wait_until_idle()
+    logger.info(f'Mono idle after {report.polls} polls')
 
 
 if __name__ == '__main__':
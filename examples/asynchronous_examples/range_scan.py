@@ -4,10 +4,10 @@ import asyncio
 import matplotlib.pyplot as plt
 from loguru import logger
 
-from examples.asynchronous_examples.linear_spectra_stitch import LinearSpectraStitch
 from horiba_sdk.core.acquisition_format import AcquisitionFormat
 from horiba_sdk.core.timer_resolution import TimerResolution
 from horiba_sdk.core.x_axis_conversion_type import XAxisConversionType
+from horiba_sdk.devices import RangeScan
 from horiba_sdk.devices.device_manager import DeviceManager
 from horiba_sdk.devices.single_devices.monochromator import Monochromator
 
@@ -49,25 +49,12 @@ async def main():
         await ccd.set_acquisition_format(1, AcquisitionFormat.IMAGE)
         await ccd.set_region_of_interest()  # Set default ROI, if you want a custom ROI, pass the parameters
 
-        center_wavelengths = await ccd.range_mode_center_wavelengths(mono.id(), start_wavelength, end_wavelength, 10)
-        logger.info(f'Number of captures: {len(center_wavelengths)}')
-
-        captures = []
-        for center_wavelength in center_wavelengths:
-            await mono.move_to_target_wavelength(center_wavelength)
-            await wait_for_mono(mono)
-            mono_wavelength = await mono.get_current_wavelength()
-            logger.info(f'Mono wavelength {mono_wavelength}')
-
-            await ccd.set_center_wavelength(mono_wavelength)
-
-            xy_data = await capture(ccd)
-            captures.append(xy_data)
-
-        stitch = LinearSpectraStitch(
-            captures
-        )  # You can implement your own stitching by subclassing the SpectraStitch interface
-        spectrum = stitch.stitched_spectra()
+        scan = RangeScan(ccd, mono, start_wavelength, end_wavelength, pixel_overlap=10)
+        result = await scan.run()
+        for step in result.steps:
+            logger.info(step)
+        logger.info(f'Range scan of {len(result.steps)} steps done in {result.elapsed_s:.1f}s')
+        spectrum = [result.x_data, result.y_data]
 
     finally:
         await ccd.close()
@@ -80,31 +67,8 @@ async def main():
     await plot_values(start_wavelength, end_wavelength, spectrum)
 
 
-async def capture(ccd):
-    xy_data = [[0], [0]]
-    if await ccd.get_acquisition_ready():
-        await ccd.set_acquisition_start(open_shutter=True)
-        await asyncio.sleep(1)  # Wait a short period for the acquisition to start
-        await wait_for_ccd(ccd)
-
-        raw_data = await ccd.get_acquisition_data()
-        print(raw_data)
-        # for AcquisitionFormat.SPECTRA:
-        # xy_data = raw_data[0]['roi'][0]['xyData']
-        # for AcquisitionFormat.IMAGE:
-        xy_data = [raw_data[0]['roi'][0]['xData'][0], raw_data[0]['roi'][0]['yData'][0]]
-        logger.info(xy_data)
-    else:
-        raise Exception('CCD not ready for acquisition')
-    return xy_data
-
-
 async def plot_values(start_wavelength, end_wavelength, xy_data):
-    x_values = [data[0] for data in xy_data]
-    y_values = [data[1] for data in xy_data]
-    # for AcquisitionFormat.IMAGE:
-    # x_values = xy_data[0]
-    # y_values = xy_data[1]
+    x_values, y_values = xy_data
     # Plotting the data
     plt.plot(x_values, y_values, linestyle='-')
     plt.title(f'Range Scan {start_wavelength}-{end_wavelength}[nm] vs. Intensity')
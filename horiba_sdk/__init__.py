@@ -1,15 +1,28 @@
 # mypy: disable-error-code="attr-defined"
-"""'horiba-sdk' is a package that provides source code for the development with Horiba devices"""
+"""'horiba-sdk' is a package that provides source code for the development with Horiba devices
+
+The subpackages are imported lazily: importing :code:`horiba_sdk` or one of its packages only loads the modules, and
+their dependencies, of the names that are actually used.
+"""
+
+from typing import Any
 
 __version__ = '0.2.0'  # It MUST match the version in pyproject.toml file
-from importlib import metadata as importlib_metadata
 
 
 def get_version() -> str:
+    from importlib import metadata as importlib_metadata
+
     try:
         return importlib_metadata.version(__name__)
     except importlib_metadata.PackageNotFoundError:  # pragma: no cover
         return 'unknown'
 
 
-version: str = get_version()
+def __getattr__(name: str) -> Any:
+    # the installed version is only looked up when requested, importlib.metadata is slow to import
+    if name == 'version':
+        version: str = get_version()
+        globals()['version'] = version
+        return version
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -27,18 +27,64 @@ response = await ws.receive()
 await ws.disconnect()
 """
 
+from typing import TYPE_CHECKING
+
+from horiba_sdk.core.lazy_import import lazy_attributes
+
 # Necessary to make Python treat the directory as a package
 from .abstract_communicator import AbstractCommunicator
 from .communication_exception import CommunicationException
-from .messages import BinaryResponse, Command, JSONResponse, Response
-from .websocket_communicator import WebsocketCommunicator
+from .messages import (
+    BinaryResponse,
+    Command,
+    JSONCodec,
+    JSONResponse,
+    OrjsonCodec,
+    Response,
+    StdlibJSONCodec,
+    json_codec,
+    set_json_codec,
+)
+
+if TYPE_CHECKING:
+    from .binary_frame import BinaryElementType, BinaryFrame, BinaryMessageType
+    from .message_log_policy import MessageLogPolicy
+    from .message_queue import MessageQueuePolicy, MessageQueueStatistics, QueueOverflowPolicy
+    from .websocket_communicator import WebsocketCommunicator
 
 __all__ = [
     'AbstractCommunicator',
     'WebsocketCommunicator',
     'CommunicationException',
+    'MessageLogPolicy',
+    'MessageQueuePolicy',
+    'MessageQueueStatistics',
+    'QueueOverflowPolicy',
     'Command',
     'Response',
     'JSONResponse',
     'BinaryResponse',
+    'JSONCodec',
+    'StdlibJSONCodec',
+    'OrjsonCodec',
+    'json_codec',
+    'set_json_codec',
+    'BinaryFrame',
+    'BinaryMessageType',
+    'BinaryElementType',
 ]
+
+# numpy, loguru and websockets are only imported once the binary frames, the queues or the communicator are used
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'BinaryElementType': '.binary_frame',
+        'BinaryFrame': '.binary_frame',
+        'BinaryMessageType': '.binary_frame',
+        'MessageLogPolicy': '.message_log_policy',
+        'MessageQueuePolicy': '.message_queue',
+        'MessageQueueStatistics': '.message_queue',
+        'QueueOverflowPolicy': '.message_queue',
+        'WebsocketCommunicator': '.websocket_communicator',
+    },
+)
@@ -39,6 +39,20 @@ class AbstractCommunicator(ABC):
         """
         pass
 
+    @abstractmethod
+    async def request_with_responses(self, commands: list[Command], timeout: int = 5) -> list[Response]:
+        """
+        Abstract method to send several commands back-to-back and fetch their responses.
+
+        Args:
+            commands (list[Command]): Commands for which responses are desired, sent in the given order
+            timeout (int, optional): Timeout [s] for waiting for all responses. Defaults to 5
+
+        Returns:
+            list[Response]: The responses, in the same order as the commands.
+        """
+        pass
+
     @abstractmethod
     async def binary_response(self) -> BinaryResponse:
         """
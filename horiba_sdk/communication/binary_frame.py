@@ -0,0 +1,158 @@
+import struct
+from enum import Enum
+from typing import Any, final
+
+import numpy as np
+import numpy.typing as npt
+
+
+@final
+class BinaryMessageType(Enum):
+    """Types of binary messages sent by the ICL when the binary mode is enabled."""
+
+    LOG = 0
+    INFORMATION = 1
+    DATA = 2
+
+
+@final
+class BinaryElementType(Enum):
+    """Types of the elements contained in the payload of a binary message."""
+
+    CHAR = 0
+    INT16 = 1
+    UINT16 = 2
+    INT32 = 3
+    UINT32 = 4
+    FLOAT32 = 5
+    FLOAT64 = 6
+
+
+_ELEMENT_DTYPES: dict[BinaryElementType, np.dtype[Any]] = {
+    BinaryElementType.CHAR: np.dtype('<u1'),
+    BinaryElementType.INT16: np.dtype('<i2'),
+    BinaryElementType.UINT16: np.dtype('<u2'),
+    BinaryElementType.INT32: np.dtype('<i4'),
+    BinaryElementType.UINT32: np.dtype('<u4'),
+    BinaryElementType.FLOAT32: np.dtype('<f4'),
+    BinaryElementType.FLOAT64: np.dtype('<f8'),
+}
+
+
+@final
+class BinaryFrame:
+    """Represents a binary message (frame) received from the ICL.
+
+    A frame consists of an 18 bytes little-endian header followed by the payload:
+
+    ====== ====== =============
+    offset size   field
+    ====== ====== =============
+    0      2      magic number
+    2      2      message type
+    4      2      element type
+    6      4      element count
+    10     2      tag 1
+    12     2      tag 2
+    14     2      tag 3
+    16     2      tag 4
+    18     ...    payload
+    ====== ====== =============
+
+    The payload is kept as a :class:`memoryview` of the received message, :meth:`data` interprets it as a typed numpy
+    array without copying it.
+
+    Attributes:
+        magic_number (int): Magic number of the frame
+        message_type (BinaryMessageType): Type of the message
+        element_type (BinaryElementType): Type of the elements in the payload
+        element_count (int): Number of elements in the payload
+        tags (tuple[int, int, int, int]): The four tags of the frame. For data frames, tag 1 is the index of the device
+            the data belongs to, tag 2 the acquisition index, tag 3 the ROI index and tag 4 the axis (0 = X, 1 = Y).
+        payload (memoryview): The payload of the frame
+    """
+
+    HEADER: struct.Struct = struct.Struct('<HHHI4H')
+
+    def __init__(
+        self,
+        magic_number: int,
+        message_type: BinaryMessageType,
+        element_type: BinaryElementType,
+        element_count: int,
+        tags: tuple[int, int, int, int],
+        payload: memoryview,
+    ) -> None:
+        self.magic_number = magic_number
+        self.message_type = message_type
+        self.element_type = element_type
+        self.element_count = element_count
+        self.tags = tags
+        self.payload = payload
+
+    @classmethod
+    def from_bytes(cls, message: bytes) -> 'BinaryFrame':
+        """Parses a binary message received from the ICL.
+
+        Args:
+            message (bytes): The binary message
+
+        Returns:
+            BinaryFrame: The parsed frame, whose payload references the given message
+
+        Raises:
+            Exception: When the message is shorter than the header, has an unknown message or element type, or when
+            its payload is smaller than announced by the element count
+        """
+        if len(message) < cls.HEADER.size:
+            raise Exception(f'Binary message too short: {len(message)} < {cls.HEADER.size} bytes')
+
+        magic_number, message_type, element_type, element_count, *tags = cls.HEADER.unpack_from(message)
+        frame = cls(
+            magic_number,
+            BinaryMessageType(message_type),
+            BinaryElementType(element_type),
+            element_count,
+            (tags[0], tags[1], tags[2], tags[3]),
+            memoryview(message)[cls.HEADER.size :],
+        )
+
+        expected_size: int = element_count * frame.dtype.itemsize
+        if len(frame.payload) < expected_size:
+            raise Exception(f'Binary payload too short: {len(frame.payload)} < {expected_size} bytes')
+
+        return frame
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Numpy data type of the payload elements.
+
+        Returns:
+            np.dtype: data type of the elements
+        """
+        return _ELEMENT_DTYPES[self.element_type]
+
+    @property
+    def device_index(self) -> int:
+        """Index of the device the frame belongs to.
+
+        Returns:
+            int: device index
+        """
+        return self.tags[0]
+
+    def data(self) -> npt.NDArray[Any]:
+        """Payload as a read-only numpy array that shares the memory of the received message.
+
+        Returns:
+            numpy.ndarray: the payload elements
+        """
+        return np.frombuffer(self.payload, dtype=self.dtype, count=self.element_count)
+
+    def text(self) -> str:
+        """Payload decoded as text, used for log and information messages.
+
+        Returns:
+            str: the payload as text
+        """
+        return bytes(self.payload[: self.element_count * self.dtype.itemsize]).decode(errors='replace')
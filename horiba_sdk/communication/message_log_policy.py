@@ -0,0 +1,54 @@
+from itertools import count
+from typing import Union, final
+
+from loguru import logger
+
+
+@final
+class MessageLogPolicy:
+    """Controls how the communicators log the messages exchanged with the ICL.
+
+    Messages are logged on the hot path of the communication, a single acquisition reply can be several megabytes.
+    Therefore:
+
+    - the message is only formatted when a log handler accepts the level, see loguru's :code:`opt(lazy=True)`,
+    - the message is truncated to :code:`max_length` characters (or bytes),
+    - only one message out of :code:`sample_every` is logged,
+    - logging can be switched off completely with :code:`enabled`, which skips all the logging work.
+
+    The policy can be changed at runtime, e.g.::
+
+        communicator.log_policy.enabled = False
+
+    Attributes:
+        enabled (bool): If False, no message is logged at all
+        level (str): Level used to log the messages
+        max_length (int): Maximum number of characters (or bytes) of a message that are logged. 0 means no limit
+        sample_every (int): Only one out of `sample_every` messages is logged
+    """
+
+    def __init__(self, enabled: bool = True, level: str = 'DEBUG', max_length: int = 200, sample_every: int = 1):
+        self.enabled = enabled
+        self.level = level
+        self.max_length = max_length
+        self.sample_every = sample_every
+        self._message_counter = count()
+
+    def log(self, description: str, message: Union[str, bytes]) -> None:
+        """Logs the message according to the policy.
+
+        Args:
+            description (str): Description of the message, e.g. 'Received message'
+            message (Union[str, bytes]): The message
+        """
+        if not self.enabled:
+            return
+        if self.sample_every > 1 and next(self._message_counter) % self.sample_every != 0:
+            return
+
+        logger.opt(lazy=True, depth=1).log(self.level, '{}: {}', lambda: description, lambda: self._truncate(message))
+
+    def _truncate(self, message: Union[str, bytes]) -> str:
+        if 0 < self.max_length < len(message):
+            return f'{message[: self.max_length]!r}... ({len(message)} in total)'
+        return repr(message)
@@ -0,0 +1,166 @@
+import asyncio
+import queue
+from enum import Enum
+from typing import TypeVar, final
+
+from loguru import logger
+
+from .communication_exception import CommunicationException
+
+T = TypeVar('T')
+
+
+class QueueOverflowPolicy(Enum):
+    """What happens when a message arrives while the message queue is full."""
+
+    BLOCK = 0
+    """The receiver waits until the consumer made room. Back-pressure is applied to the connection."""
+    DROP_OLDEST = 1
+    """The oldest message in the queue is discarded to make room for the new one."""
+    RAISE = 2
+    """The new message is rejected with a :class:`CommunicationException`."""
+
+
+@final
+class MessageQueuePolicy:
+    """Bounds a message queue of the communicators and decides what happens when it is full.
+
+    Without a bound, a slow consumer lets the queues of received messages grow without limit during long
+    acquisitions. Example::
+
+        policy = MessageQueuePolicy(max_size=100, overflow=QueueOverflowPolicy.DROP_OLDEST)
+        communicator = WebsocketCommunicator(binary_queue_policy=policy)
+
+    Attributes:
+        max_size (int): Maximum number of messages in the queue. 0 means no limit
+        overflow (QueueOverflowPolicy): What happens when a message arrives while the queue is full
+    """
+
+    def __init__(self, max_size: int = 1000, overflow: QueueOverflowPolicy = QueueOverflowPolicy.BLOCK):
+        if max_size < 0:
+            raise ValueError(f'max_size must be positive or 0, got {max_size}')
+        self.max_size = max_size
+        self.overflow = overflow
+
+
+@final
+class MessageQueueStatistics:
+    """Snapshot of the counters of a message queue.
+
+    Attributes:
+        depth (int): Number of messages currently in the queue
+        max_depth (int): Highest number of messages that were in the queue at the same time
+        dropped (int): Number of messages that were discarded or rejected because the queue was full
+    """
+
+    def __init__(self, depth: int, max_depth: int, dropped: int):
+        self.depth = depth
+        self.max_depth = max_depth
+        self.dropped = dropped
+
+    def __repr__(self) -> str:
+        return f'MessageQueueStatistics(depth={self.depth}, max_depth={self.max_depth}, dropped={self.dropped})'
+
+
+class AsyncMessageQueue(asyncio.Queue[T]):
+    """:class:`asyncio.Queue` bounded according to a :class:`MessageQueuePolicy`, with depth and drop counters."""
+
+    def __init__(self, policy: MessageQueuePolicy):
+        super().__init__(maxsize=policy.max_size)
+        self.policy = policy
+        self._max_depth: int = 0
+        self._dropped: int = 0
+
+    async def put_message(self, item: T) -> None:
+        """Puts the item in the queue, applying the overflow policy if the queue is full.
+
+        Args:
+            item: The item to put in the queue
+
+        Raises:
+            CommunicationException: When the queue is full and the overflow policy is :code:`RAISE`
+        """
+        if self.full():
+            if self.policy.overflow == QueueOverflowPolicy.RAISE:
+                self._dropped += 1
+                raise CommunicationException(None, f'message queue full ({self.maxsize} messages)')
+            if self.policy.overflow == QueueOverflowPolicy.DROP_OLDEST:
+                self.get_nowait()
+                self._dropped += 1
+                logger.warning(f'Message queue full ({self.maxsize} messages), dropped the oldest message')
+
+        await super().put(item)
+        self._max_depth = max(self._max_depth, self.qsize())
+
+    def statistics(self) -> MessageQueueStatistics:
+        """Returns the counters of the queue.
+
+        Returns:
+            MessageQueueStatistics: Depth, maximal depth and number of dropped messages
+        """
+        return MessageQueueStatistics(self.qsize(), self._max_depth, self._dropped)
+
+
+class MessageQueue(queue.Queue[T]):
+    """Thread-safe :class:`queue.Queue` bounded according to a :class:`MessageQueuePolicy`, with depth and drop
+    counters."""
+
+    def __init__(self, policy: MessageQueuePolicy):
+        super().__init__(maxsize=policy.max_size)
+        self.policy = policy
+        self._max_depth: int = 0
+        self._dropped: int = 0
+
+    def put_message(self, item: T) -> None:
+        """Puts the item in the queue, applying the overflow policy if the queue is full.
+
+        Args:
+            item: The item to put in the queue
+
+        Raises:
+            CommunicationException: When the queue is full and the overflow policy is :code:`RAISE`
+        """
+        if self.policy.overflow == QueueOverflowPolicy.BLOCK:
+            self.put(item)
+        else:
+            while True:
+                try:
+                    self.put_nowait(item)
+                    break
+                except queue.Full:
+                    if self.policy.overflow == QueueOverflowPolicy.RAISE:
+                        with self.mutex:
+                            self._dropped += 1
+                        raise CommunicationException(None, f'message queue full ({self.maxsize} messages)') from None
+                    try:
+                        self.get_nowait()
+                    except queue.Empty:
+                        # the consumer made room in between
+                        continue
+                    with self.mutex:
+                        self._dropped += 1
+                    logger.warning(f'Message queue full ({self.maxsize} messages), dropped the oldest message')
+
+        with self.mutex:
+            self._max_depth = max(self._max_depth, self._qsize())
+
+    def clear(self) -> int:
+        """Discards all the items in the queue and wakes up the producers waiting for room.
+
+        Returns:
+            int: Number of discarded items
+        """
+        with self.mutex:
+            discarded: int = self._qsize()
+            self.queue.clear()
+            self.not_full.notify_all()
+            return discarded
+
+    def statistics(self) -> MessageQueueStatistics:
+        """Returns the counters of the queue.
+
+        Returns:
+            MessageQueueStatistics: Depth, maximal depth and number of dropped messages
+        """
+        with self.mutex:
+            return MessageQueueStatistics(self._qsize(), self._max_depth, self._dropped)
@@ -1,6 +1,100 @@
 import json
+from abc import ABC, abstractmethod
 from itertools import count
-from typing import Any, Dict, List, Optional, final
+from typing import Any, Dict, List, Optional, Union, final
+
+from overrides import override
+
+
+class JSONCodec(ABC):
+    """Encodes and decodes the JSON messages exchanged with the ICL."""
+
+    @abstractmethod
+    def encode(self, data: Any) -> str:
+        """Encodes the data to a JSON string."""
+        pass
+
+    @abstractmethod
+    def decode(self, message: Union[str, bytes]) -> Any:
+        """Decodes a JSON string."""
+        pass
+
+
+@final
+class StdlibJSONCodec(JSONCodec):
+    """JSON codec based on the :mod:`json` module of the standard library."""
+
+    @override
+    def encode(self, data: Any) -> str:
+        return json.dumps(data, default=_json_default)
+
+    @override
+    def decode(self, message: Union[str, bytes]) -> Any:
+        return json.loads(message)
+
+
+@final
+class OrjsonCodec(JSONCodec):
+    """JSON codec based on `orjson <https://github.com/ijl/orjson>`_, available when orjson is installed.
+
+    Like :class:`StdlibJSONCodec`, it encodes numpy scalars and arrays and dictionaries with non-string keys.
+
+    .. note:: The encoded JSON is compact, i.e. without whitespace between the elements.
+    """
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options: int = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    @override
+    def encode(self, data: Any) -> str:
+        return self._orjson.dumps(data, default=_json_default, option=self._options).decode()
+
+    @override
+    def decode(self, message: Union[str, bytes]) -> Any:
+        return self._orjson.loads(message)
+
+
+def _json_default(value: Any) -> Any:
+    """Converts the values the JSON encoders do not support natively, e.g. numpy scalars and arrays."""
+    # duck typed to avoid importing numpy with the communication package
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _default_json_codec() -> JSONCodec:
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibJSONCodec()
+
+
+_json_codec: JSONCodec = _default_json_codec()
+
+
+def json_codec() -> JSONCodec:
+    """Returns the JSON codec used by :class:`Command` and :class:`JSONResponse`.
+
+    By default, the fastest installed codec is used: :class:`OrjsonCodec` when orjson is installed
+    (:code:`pip install orjson`), :class:`StdlibJSONCodec` otherwise.
+
+    Returns:
+        JSONCodec: the JSON codec in use
+    """
+    return _json_codec
+
+
+def set_json_codec(codec: JSONCodec) -> None:
+    """Sets the JSON codec used by :class:`Command` and :class:`JSONResponse`.
+
+    Args:
+        codec (JSONCodec): the JSON codec to use
+    """
+    global _json_codec
+    _json_codec = codec
 
 
 class Command:
@@ -28,7 +122,7 @@ class Command:
 
     def json(self) -> str:
         """Converts the command object to a JSON string."""
-        return json.dumps({'id': self.id, 'command': self.command, 'parameters': self.parameters})
+        return _json_codec.encode({'id': self.id, 'command': self.command, 'parameters': self.parameters})
 
 
 class Response:
@@ -60,7 +154,7 @@ class JSONResponse(Response):
     """
 
     def __init__(self, json_response: str):
-        data = json.loads(json_response)
+        data = _json_codec.decode(json_response)
         super().__init__(id=data['id'], command=data['command'], results=data.get('results'), errors=data.get('errors'))
 
 
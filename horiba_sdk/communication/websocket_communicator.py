@@ -1,5 +1,8 @@
 import asyncio
 import contextlib
+import inspect
+from collections.abc import Iterable
+from concurrent.futures import Executor
 from types import TracebackType
 from typing import Any, Callable, Optional, final
 
@@ -10,8 +13,13 @@ from websockets.legacy.client import WebSocketClientProtocol
 
 from .abstract_communicator import AbstractCommunicator
 from .communication_exception import CommunicationException
+from .message_log_policy import MessageLogPolicy
+from .message_queue import AsyncMessageQueue, MessageQueuePolicy, MessageQueueStatistics, QueueOverflowPolicy
 from .messages import BinaryResponse, Command, JSONResponse, Response
 
+# bound of the ids of the timed out commands whose late reply is still awaited, the oldest ids are forgotten first
+_MAX_EXPIRED_COMMAND_IDS: int = 1000
+
 
 @final
 class WebsocketCommunicator(AbstractCommunicator):
@@ -19,6 +27,12 @@ class WebsocketCommunicator(AbstractCommunicator):
     The WebsocketCommunicator implements the `horiba_sdk.communication.AbstractCommunicator` via websockets.
     A background task listens continuously for incoming binary data.
 
+    Responses are correlated to their command through the command id. Each call to :meth:`request_with_response`
+    registers a future in a table of pending requests that is resolved by the listening task as soon as the reply
+    with the matching id arrives. Several coroutines can therefore share the same connection and have commands in
+    flight concurrently. Replies arriving after their request timed out are discarded instead of being handed to
+    the next caller.
+
     It supports Asynchronous Context Managers and can be used like the following::
 
         websocket_communicator: WebsocketCommunicator = WebsocketCommunicator(uri)
@@ -30,15 +44,45 @@ class WebsocketCommunicator(AbstractCommunicator):
             response = await websocket_communicator.response()
             # do something with the response...
 
+    The logging of the exchanged messages is controlled by the :class:`horiba_sdk.communication.MessageLogPolicy`
+    given at construction, available as :attr:`log_policy`.
+
+    The queues of received messages are bounded by the :class:`horiba_sdk.communication.MessageQueuePolicy` given at
+    construction. By default, the JSON responses not claimed by a request are bounded to 1000 and the oldest is
+    dropped on overflow, the binary messages are bounded to 1000 and the listening task waits for the consumer on
+    overflow. See :meth:`message_queue_statistics` for the depth and the drop counters of the queues.
+
+    With the :code:`RAISE` overflow policy, only the message arriving while its queue is full is rejected, the
+    listening task keeps running.
+
+    .. warning:: With the :code:`BLOCK` overflow policy, a full queue stops the listening task until the queue is
+                 consumed, including the reception of the responses to pending requests.
     """
 
-    def __init__(self, uri: str = 'ws://127.0.0.1:25010') -> None:
+    def __init__(
+        self,
+        uri: str = 'ws://127.0.0.1:25010',
+        log_policy: Optional[MessageLogPolicy] = None,
+        json_queue_policy: Optional[MessageQueuePolicy] = None,
+        binary_queue_policy: Optional[MessageQueuePolicy] = None,
+    ) -> None:
         self.uri: str = uri
+        self.log_policy: MessageLogPolicy = log_policy if log_policy is not None else MessageLogPolicy()
         self.websocket: Optional[WebSocketClientProtocol] = None
         self.listen_task: Optional[asyncio.Task[Any]] = None
-        self.json_message_queue: asyncio.Queue[str] = asyncio.Queue()
-        self.binary_message_queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self.json_message_queue: AsyncMessageQueue[str] = AsyncMessageQueue(
+            json_queue_policy
+            if json_queue_policy is not None
+            else MessageQueuePolicy(overflow=QueueOverflowPolicy.DROP_OLDEST)
+        )
+        self._pending_responses: dict[int, asyncio.Future[Response]] = {}
+        self._expired_command_ids: dict[int, None] = {}
+        self.binary_message_queue: AsyncMessageQueue[bytes] = AsyncMessageQueue(
+            binary_queue_policy if binary_queue_policy is not None else MessageQueuePolicy()
+        )
         self.binary_message_callback: Optional[Callable[[bytes], Any]] = None
+        self._binary_message_executor: Optional[Executor] = None
+        self.binary_message_task: Optional[asyncio.Task[Any]] = None
         self.icl_info: dict[str, Any] = {}
 
     async def __aenter__(self) -> 'WebsocketCommunicator':
@@ -71,6 +115,7 @@ class WebsocketCommunicator(AbstractCommunicator):
 
         logger.debug(f'Websocket connection established to {self.uri}')
         self.listen_task = asyncio.create_task(self._receive_data())
+        self.binary_message_task = asyncio.create_task(self._dispatch_binary_messages())
 
     async def send(self, command: Command) -> None:
         """
@@ -88,8 +133,9 @@ class WebsocketCommunicator(AbstractCommunicator):
 
         try:
             # mypy cannot infer the check from self.opened() done above
-            logger.debug(f'Sending JSON command: {command.json()}')
-            await self.websocket.send(command.json())  # type: ignore
+            message: str = command.json()
+            self.log_policy.log('Sending JSON command', message)
+            await self.websocket.send(message)  # type: ignore
         except websockets.exceptions.ConnectionClosed as e:
             raise CommunicationException(None, 'Trying to send data while websocket is closed') from e
 
@@ -104,7 +150,7 @@ class WebsocketCommunicator(AbstractCommunicator):
         return self.websocket is not None and self.websocket.open
 
     async def response(self) -> Response:
-        """Fetches the next response
+        """Fetches the next response that does not belong to a pending :meth:`request_with_response` call.
 
         Returns:
             Response: The response from the server
@@ -133,7 +179,7 @@ class WebsocketCommunicator(AbstractCommunicator):
         """
         try:
             response: bytes = await self.binary_message_queue.get()
-            logger.debug(f'Received binary response: {response!r}')
+            self.log_policy.log('Received binary response', response)
             return BinaryResponse(response)
         except asyncio.CancelledError as e:
             raise CommunicationException(None, 'Response reception was canceled') from e
@@ -150,6 +196,7 @@ class WebsocketCommunicator(AbstractCommunicator):
             raise CommunicationException(None, 'cannot close already closed websocket')
         if self.binary_message_callback:
             self.binary_message_callback = None
+        self._fail_pending_responses(CommunicationException(None, 'websocket closed while waiting for response'))
         if self.websocket:
             logger.debug('Waiting websocket close...')
             await self.websocket.close()
@@ -162,30 +209,127 @@ class WebsocketCommunicator(AbstractCommunicator):
                 logger.debug('Await listening task...')
                 await self.listen_task
 
+        if self.binary_message_task:
+            logger.debug('Canceling binary message task...')
+            self.binary_message_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.binary_message_task
+            self.binary_message_task = None
+
         logger.debug('Websocket connection closed')
 
-    def register_binary_message_callback(self, callback: Callable[[bytes], Any]) -> None:
-        """Registers a callback to be called with every incoming binary message."""
+    def message_queue_statistics(self) -> dict[str, MessageQueueStatistics]:
+        """Returns the depth and the drop counters of the queues of received messages.
+
+        Returns:
+            dict[str, MessageQueueStatistics]: The statistics of :attr:`json_message_queue` and
+            :attr:`binary_message_queue`, by name of the queue
+        """
+        return {
+            'json_message_queue': self.json_message_queue.statistics(),
+            'binary_message_queue': self.binary_message_queue.statistics(),
+        }
+
+    def register_binary_message_callback(
+        self, callback: Callable[[bytes], Any], executor: Optional[Executor] = None
+    ) -> None:
+        """Registers a callback to be called with every incoming binary message.
+
+        The binary messages are put in :attr:`binary_message_queue` by the listening task and handed to the callback,
+        in order, by a separate task. A slow callback therefore does not delay the responses to the commands, as long
+        as the queue is not full.
+
+        Args:
+            callback (Callable[[bytes], Any]): Function or coroutine function called with every binary message
+            executor (Optional[Executor], optional): If given, the callback is run in this executor instead of the
+                event loop. Use it for CPU-heavy, non-coroutine callbacks. Defaults to None
+        """
         logger.info('Binary message callback registered.')
         self.binary_message_callback = callback
+        self._binary_message_executor = executor
 
     async def _receive_data(self) -> None:
         try:
             async for message in self.websocket:  # type: ignore
-                logger.info(f'Received message: {message!r}')
+                self.log_policy.log('Received message', message)
                 if isinstance(message, str):
-                    await self.json_message_queue.put(message)
+                    await self._dispatch_json_message(message)
                 elif isinstance(message, bytes):
                     if self.binary_message_callback:
-                        await asyncio.create_task(self.binary_message_callback(message))  # Call the callback
+                        try:
+                            await self.binary_message_queue.put_message(message)
+                        except CommunicationException as e:
+                            # only this message is rejected, it is counted in the queue statistics
+                            logger.warning(f'Rejected binary message: {e.message}')
                 else:
                     raise CommunicationException(None, f'Unknown type of message {type(message)}')
         except websockets.ConnectionClosedOK:
             logger.debug('websocket connection terminated properly')
+            self._fail_pending_responses(CommunicationException(None, 'connection terminated'))
         except websockets.ConnectionClosedError as e:
+            self._fail_pending_responses(CommunicationException(None, 'connection terminated with error'))
             raise CommunicationException(None, 'connection terminated with error') from e
         except Exception as e:
+            self._fail_pending_responses(CommunicationException(None, 'failure to process binary data'))
             raise CommunicationException(None, 'failure to process binary data') from e
+        finally:
+            # no binary message will arrive anymore
+            if self.binary_message_task:
+                self.binary_message_task.cancel()
+
+    async def _dispatch_binary_messages(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            message: bytes = await self.binary_message_queue.get()
+            callback = self.binary_message_callback
+            if callback is None:
+                continue
+            try:
+                if self._binary_message_executor is not None:
+                    result = await loop.run_in_executor(self._binary_message_executor, callback, message)
+                else:
+                    result = callback(message)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f'Binary message callback failed: {e!r}')
+
+    def _expire_command_ids(self, command_ids: Iterable[int]) -> None:
+        # the ids are kept in insertion order, so that the oldest are forgotten when the ICL never replies
+        for command_id in command_ids:
+            self._expired_command_ids[command_id] = None
+        while len(self._expired_command_ids) > _MAX_EXPIRED_COMMAND_IDS:
+            del self._expired_command_ids[next(iter(self._expired_command_ids))]
+
+    async def _dispatch_json_message(self, message: str) -> None:
+        try:
+            response: JSONResponse = JSONResponse(message)
+        except (ValueError, KeyError) as e:
+            logger.error(f'Discarding malformed response: {e!r}')
+            return
+
+        pending_response = self._pending_responses.pop(response.id, None)
+        if pending_response is not None:
+            if not pending_response.done():
+                pending_response.set_result(response)
+            return
+
+        if response.id in self._expired_command_ids:
+            del self._expired_command_ids[response.id]
+            logger.warning(f'Discarding late response to command #{response.id} ({response.command})')
+            return
+
+        try:
+            await self.json_message_queue.put_message(message)
+        except CommunicationException as e:
+            # only this response is rejected, it is counted in the queue statistics
+            logger.warning(f'Rejected response to command #{response.id} ({response.command}): {e.message}')
+
+    def _fail_pending_responses(self, exception: CommunicationException) -> None:
+        for pending_response in self._pending_responses.values():
+            if not pending_response.done():
+                pending_response.set_exception(exception)
+        self._pending_responses.clear()
 
     @override
     async def request_with_response(self, command: Command, timeout: int = 5) -> Response:
@@ -200,14 +344,54 @@ class WebsocketCommunicator(AbstractCommunicator):
             Response: The response corresponding to the sent command.
 
         Raises:
-            Exception: When an error occurred with the communication channel
+            CommunicationException: When an error occurred with the communication channel or no response with the id
+            of the command arrived within the timeout
         """
-        # send the command with the send function and wait a maximum of 5 seconds for the response
-        await self.send(command)
+        responses: list[Response] = await self.request_with_responses([command], timeout)
+        return responses[0]
+
+    @override
+    async def request_with_responses(self, commands: list[Command], timeout: int = 5) -> list[Response]:
+        """
+        Sends the commands back-to-back without waiting for the individual replies and collects the responses.
+
+        The whole batch costs roughly one round-trip instead of one per command.
+
+        Args:
+            commands (list[Command]): Commands for which responses are desired, sent in the given order
+            timeout (int): Maximum time to wait for all the responses
+
+        Returns:
+            list[Response]: The responses, in the same order as the commands.
+
+        Raises:
+            CommunicationException: When an error occurred with the communication channel or not all responses
+            arrived within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        pending_responses: list[asyncio.Future[Response]] = []
+        for command in commands:
+            pending_response: asyncio.Future[Response] = loop.create_future()
+            self._pending_responses[command.id] = pending_response
+            pending_responses.append(pending_response)
+
         try:
+            for command in commands:
+                await self.send(command)
             async with asyncio.timeout(timeout):
-                response: Response = await self.response()
+                responses: list[Response] = await asyncio.gather(*pending_responses)
         except TimeoutError as te:
-            raise CommunicationException(None, f'Timeout of {timeout}s while waiting for response.') from te
-
-        return response
+            expired_command_ids = [
+                command.id
+                for command, pending_response in zip(commands, pending_responses)
+                if pending_response.cancelled() or not pending_response.done()
+            ]
+            self._expire_command_ids(expired_command_ids)
+            raise CommunicationException(
+                None, f'Timeout of {timeout}s while waiting for response to commands {expired_command_ids}.'
+            ) from te
+        finally:
+            for command in commands:
+                self._pending_responses.pop(command.id, None)
+
+        return responses
@@ -0,0 +1,156 @@
+from typing import Any, Optional, final
+
+import numpy as np
+import numpy.typing as npt
+
+
+@final
+class RegionOfInterestData:
+    """Data of one region of interest (ROI) of an acquisition.
+
+    The data is stored row-wise: a spectrum is a single row, an image has one row per binned line of the ROI.
+
+    Attributes:
+        roi_index (int): One based index of the region of interest
+        x_origin (int): ROI's X origin
+        y_origin (int): ROI's Y origin
+        x_size (int): ROI's X size
+        y_size (int): ROI's Y size
+        x_binning (int): ROI's X bin
+        y_binning (int): ROI's Y bin
+        x_data (numpy.ndarray): X axis values (pixels or wavelengths, depending on the X axis conversion type)
+        y_data (numpy.ndarray): Measured counts
+    """
+
+    def __init__(
+        self,
+        roi_index: int,
+        x_origin: int,
+        y_origin: int,
+        x_size: int,
+        y_size: int,
+        x_binning: int,
+        y_binning: int,
+        x_data: npt.NDArray[Any],
+        y_data: npt.NDArray[Any],
+    ) -> None:
+        self.roi_index = roi_index
+        self.x_origin = x_origin
+        self.y_origin = y_origin
+        self.x_size = x_size
+        self.y_size = y_size
+        self.x_binning = x_binning
+        self.y_binning = y_binning
+        self.x_data = x_data
+        self.y_data = y_data
+
+    @classmethod
+    def from_json(
+        cls, roi: dict[str, Any], x_data: Optional[Any] = None, y_data: Optional[Any] = None
+    ) -> 'RegionOfInterestData':
+        """Creates the ROI data from the ROI description returned by the ICL.
+
+        Args:
+            roi (dict[str, Any]): ROI description as found in the result of :code:`ccd_getAcquisitionData`
+            x_data (optional): X axis values, taken from :code:`xData` of the description if not given
+            y_data (optional): counts, taken from :code:`yData` of the description if not given
+
+        Returns:
+            RegionOfInterestData: the ROI data
+        """
+        x_size: int = int(roi['xSize'])
+        x_binning: int = int(roi['xBinning'])
+        columns: int = max(x_size // max(x_binning, 1), 1)
+        return cls(
+            roi_index=int(roi['roiIndex']),
+            x_origin=int(roi['xOrigin']),
+            y_origin=int(roi['yOrigin']),
+            x_size=x_size,
+            y_size=int(roi['ySize']),
+            x_binning=x_binning,
+            y_binning=int(roi['yBinning']),
+            x_data=np.asarray(roi.get('xData', []) if x_data is None else x_data).reshape(-1, columns),
+            y_data=np.asarray(roi.get('yData', []) if y_data is None else y_data).reshape(-1, columns),
+        )
+
+
+@final
+class AcquisitionData:
+    """Data of one acquisition of the CCD, split by region of interest.
+
+    Attributes:
+        acquisition_index (int): One based index of the acquisition
+        regions_of_interest (list[RegionOfInterestData]): data of each region of interest
+        timestamp (Optional[str]): time when all the programmed acquisitions completed, when provided by the ICL
+    """
+
+    def __init__(
+        self, acquisition_index: int, regions_of_interest: list[RegionOfInterestData], timestamp: Optional[str] = None
+    ) -> None:
+        self.acquisition_index = acquisition_index
+        self.regions_of_interest = regions_of_interest
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_json(cls, acquisition: dict[str, Any]) -> 'AcquisitionData':
+        """Creates the acquisition data from an acquisition returned by :code:`ccd_getAcquisitionData`.
+
+        Args:
+            acquisition (dict[str, Any]): one element of the acquisition list returned by the ICL
+
+        Returns:
+            AcquisitionData: the acquisition data
+        """
+        return cls(
+            acquisition_index=int(acquisition['acqIndex']),
+            regions_of_interest=[RegionOfInterestData.from_json(roi) for roi in acquisition['roi']],
+            timestamp=acquisition.get('timestamp'),
+        )
+
+
+@final
+class AcquisitionRingBuffer:
+    """Preallocated storage for the counts of the last :code:`size` frames of a stream.
+
+    Each region of interest of each acquisition gets its own ring of :code:`size` slots, allocated when the first frame
+    arrives and again only when the shape or the data type of the counts changes. Storing a frame copies its counts in
+    the next slot and replaces :code:`y_data` of the frame with a view on that slot, so the buffer caps the memory
+    retained by a long stream at :code:`size` frames of counts. It does not avoid allocations: the counts of each frame
+    are still decoded into a new array before being copied, and :code:`x_data` is not buffered.
+
+    The view stays valid until :code:`size` more frames have been stored, after which the slot is overwritten. Copy
+    the counts of frames that must be kept longer.
+
+    Attributes:
+        size (int): Number of frames kept
+        frames_stored (int): Number of frames stored since the buffer was created
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError(f'The ring buffer needs at least one slot, got {size}')
+        self.size = size
+        self.frames_stored: int = 0
+        self._slots: dict[tuple[int, int], npt.NDArray[Any]] = {}
+
+    def store(self, acquisitions: list[AcquisitionData]) -> list[AcquisitionData]:
+        """Copies the counts of the frame in the next slot of the ring.
+
+        Args:
+            acquisitions (list[AcquisitionData]): The frame, as returned by the acquisition of the CCD
+
+        Returns:
+            list[AcquisitionData]: The same acquisitions, with :code:`y_data` pointing into the ring buffer
+        """
+        slot: int = self.frames_stored % self.size
+        for acquisition_position, acquisition in enumerate(acquisitions):
+            for roi_position, roi in enumerate(acquisition.regions_of_interest):
+                key: tuple[int, int] = (acquisition_position, roi_position)
+                ring: Optional[npt.NDArray[Any]] = self._slots.get(key)
+                if ring is None or ring.shape[1:] != roi.y_data.shape or ring.dtype != roi.y_data.dtype:
+                    ring = np.empty((self.size, *roi.y_data.shape), dtype=roi.y_data.dtype)
+                    self._slots[key] = ring
+                ring[slot] = roi.y_data
+                roi.y_data = ring[slot]
+        self.frames_stored += 1
+        return acquisitions
@@ -0,0 +1,201 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, final
+
+
+def _frozen(value: Any) -> Any:
+    """Returns a read-only copy of a JSON value, objects become read-only mappings and arrays become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _frozen(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(item) for item in value)
+    return value
+
+
+@final
+class TriggerEvent:
+    """Event of a trigger input or signal output address, with its supported signal types.
+
+    Attributes:
+        token (int): Token of the event
+        name (str): Name of the event, e.g. 'Once - Start All'
+        signal_types (Mapping[int, str]): Names of the supported signal types, by token
+    """
+
+    def __init__(self, token: int, name: str, signal_types: Mapping[int, str]) -> None:
+        self._token = token
+        self._name = name
+        self._signal_types: Mapping[int, str] = MappingProxyType(dict(signal_types))
+
+    @property
+    def token(self) -> int:
+        return self._token
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def signal_types(self) -> Mapping[int, str]:
+        return self._signal_types
+
+    @classmethod
+    def from_json(cls, event: dict[str, Any]) -> 'TriggerEvent':
+        signal_types: dict[int, str] = {
+            int(signal_type['token']): signal_type['name'] for signal_type in event.get('types', [])
+        }
+        return cls(int(event['token']), event['name'], signal_types)
+
+
+@final
+class TriggerAddress:
+    """Trigger input or signal output address, with its supported events.
+
+    Attributes:
+        token (int): Token of the address
+        name (str): Name of the address, e.g. 'Trigger Input'
+        events (Mapping[int, TriggerEvent]): Supported events, by token
+    """
+
+    def __init__(self, token: int, name: str, events: Mapping[int, TriggerEvent]) -> None:
+        self._token = token
+        self._name = name
+        self._events: Mapping[int, TriggerEvent] = MappingProxyType(dict(events))
+
+    @property
+    def token(self) -> int:
+        return self._token
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def events(self) -> Mapping[int, TriggerEvent]:
+        return self._events
+
+    @classmethod
+    def from_json(cls, address: dict[str, Any]) -> 'TriggerAddress':
+        events: dict[int, TriggerEvent] = {
+            int(event['token']): TriggerEvent.from_json(event) for event in address.get('events', [])
+        }
+        return cls(int(address['token']), address['name'], events)
+
+
+@final
+class ChargeCoupledDeviceConfiguration:
+    """Immutable, token-indexed view of the configuration returned by :code:`ccd_getConfig`.
+
+    The configuration is parsed once when the CCD is opened, see
+    :meth:`horiba_sdk.devices.single_devices.ChargeCoupledDevice.configuration`. All lookups by token are done in
+    constant time.
+
+    Attributes:
+        gains (Mapping[int, str]): Descriptions of the available gains, by token
+        speeds (Mapping[int, str]): Descriptions of the available speeds, by token
+        triggers (Mapping[int, TriggerAddress]): Trigger input addresses, by token
+        signals (Mapping[int, TriggerAddress]): Signal output addresses, by token
+        supported_features (frozenset[str]): Names of the supported features, e.g. 'cf_Triggers'
+        raw (Mapping[str, Any]): The configuration as returned by the ICL, frozen: its objects are read-only mappings
+            and its arrays are tuples
+    """
+
+    def __init__(self, configuration: dict[str, Any]) -> None:
+        self._raw: Mapping[str, Any] = _frozen(configuration)
+        self._gains: Mapping[int, str] = MappingProxyType(
+            {int(gain['token']): gain['info'].strip() for gain in configuration.get('gains', [])}
+        )
+        self._speeds: Mapping[int, str] = MappingProxyType(
+            {int(speed['token']): speed['info'].strip() for speed in configuration.get('speeds', [])}
+        )
+        self._triggers: Mapping[int, TriggerAddress] = MappingProxyType(
+            {int(trigger['token']): TriggerAddress.from_json(trigger) for trigger in configuration.get('triggers', [])}
+        )
+        self._signals: Mapping[int, TriggerAddress] = MappingProxyType(
+            {int(signal['token']): TriggerAddress.from_json(signal) for signal in configuration.get('signals', [])}
+        )
+        self._supported_features: frozenset[str] = frozenset(
+            feature
+            for feature, supported in configuration.get('supportedFeatures', {}).items()
+            if str(supported).lower() == 'true'
+        )
+
+    @property
+    def gains(self) -> Mapping[int, str]:
+        return self._gains
+
+    @property
+    def speeds(self) -> Mapping[int, str]:
+        return self._speeds
+
+    @property
+    def triggers(self) -> Mapping[int, TriggerAddress]:
+        return self._triggers
+
+    @property
+    def signals(self) -> Mapping[int, TriggerAddress]:
+        return self._signals
+
+    @property
+    def supported_features(self) -> frozenset[str]:
+        return self._supported_features
+
+    @property
+    def raw(self) -> Mapping[str, Any]:
+        return self._raw
+
+    def supports(self, feature: str) -> bool:
+        """Returns if the CCD supports the feature.
+
+        Args:
+            feature (str): Name of the feature as found in :code:`supportedFeatures`, e.g. 'cf_Triggers'
+
+        Returns:
+            bool: True if the feature is supported
+        """
+        return feature in self._supported_features
+
+    def validate_gain(self, gain_token: int) -> None:
+        """Checks that the gain token is available.
+
+        Raises:
+            Exception: When the gain token is not found in the configuration
+        """
+        if gain_token not in self._gains:
+            raise Exception(f'Gain token {gain_token} not found in the configuration')
+
+    def validate_speed(self, speed_token: int) -> None:
+        """Checks that the speed token is available.
+
+        Raises:
+            Exception: When the speed token is not found in the configuration
+        """
+        if speed_token not in self._speeds:
+            raise Exception(f'Speed token {speed_token} not found in the configuration')
+
+    def validate_trigger_input(self, address: int, event: int, signal_type: int) -> None:
+        """Checks that the trigger input address, event and signal type are supported.
+
+        Raises:
+            Exception: When the address, the event or the signal type is not found in the configuration
+        """
+        trigger: TriggerAddress = self._lookup(self._triggers, address, 'Trigger address')
+        trigger_event: TriggerEvent = self._lookup(trigger.events, event, 'Trigger event')
+        self._lookup(trigger_event.signal_types, signal_type, 'Trigger signal type')
+
+    def validate_signal_output(self, address: int, event: int, signal_type: int) -> None:
+        """Checks that the signal output address, event and signal type are supported.
+
+        Raises:
+            Exception: When the address, the event or the signal type is not found in the configuration
+        """
+        signal: TriggerAddress = self._lookup(self._signals, address, 'Signal address')
+        signal_event: TriggerEvent = self._lookup(signal.events, event, 'Signal event')
+        self._lookup(signal_event.signal_types, signal_type, 'Signal type')
+
+    @staticmethod
+    def _lookup(tokens: Mapping[int, Any], token: int, description: str) -> Any:
+        try:
+            return tokens[token]
+        except KeyError:
+            raise Exception(f'{description} {token} not found in the configuration') from None
@@ -0,0 +1,72 @@
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Optional, final
+
+from horiba_sdk.communication.messages import Command, Response
+
+# commands queued by the batches in progress, by id of the device. Being a context variable, a batch only captures the
+# commands issued by the task or the thread that opened it, not those of other coroutines using the same device.
+_batches: ContextVar[Mapping[int, list[Command]]] = ContextVar(
+    'horiba_sdk_command_batches', default=MappingProxyType({})
+)
+
+
+@final
+class BatchedResponse(Response):
+    """Response returned for a command queued in a batch, the command is only sent when the batch is.
+
+    Reading its results raises, so that a getter called inside a batch fails with a clear error.
+    """
+
+    def __init__(self, command: Command) -> None:
+        super().__init__(command.id, command.command)
+
+    @property
+    def results(self) -> dict[str, Any]:
+        raise Exception(
+            f'{self.command} returns a value from the device and cannot be used inside a batch, '
+            'its response is only received when the batch is sent'
+        )
+
+    @results.setter
+    def results(self, _results: dict[str, Any]) -> None:
+        pass
+
+
+def batched_commands(device_key: int) -> Optional[list[Command]]:
+    """Returns the commands queued by the batch in progress for the device, in the current context.
+
+    Args:
+        device_key (int): Identifies the device, :code:`id(device)`
+
+    Returns:
+        Optional[list[Command]]: The queued commands, None when no batch is in progress
+    """
+    return _batches.get().get(device_key)
+
+
+@contextmanager
+def command_batch(device_key: int) -> Iterator[list[Command]]:
+    """Opens a batch for the device in the current context, the batch is closed on exit, even on error.
+
+    Args:
+        device_key (int): Identifies the device, :code:`id(device)`
+
+    Yields:
+        list[Command]: The list receiving the commands queued by the batch
+
+    Raises:
+        Exception: When a batch is already in progress for the device in the current context
+    """
+    batches: Mapping[int, list[Command]] = _batches.get()
+    if device_key in batches:
+        raise Exception('A batch is already in progress for this device')
+
+    commands: list[Command] = []
+    token = _batches.set(MappingProxyType({**batches, device_key: commands}))
+    try:
+        yield commands
+    finally:
+        _batches.reset(token)
@@ -0,0 +1,14 @@
+from enum import Enum
+from typing import final
+
+
+@final
+class DataRetrievalMethod(Enum):
+    """
+    Enumeration of the ways the ICL delivers the data of an acquisition.
+
+    .. note:: The binary method requires the binary messages to be enabled in the DeviceManager.
+    """
+
+    JSON = 0
+    BINARY = 1
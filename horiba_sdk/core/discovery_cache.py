@@ -0,0 +1,146 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, final
+
+from loguru import logger
+
+
+@final
+class DiscoveryCache:
+    """On-disk cache of the discovered devices and of the CCD configurations.
+
+    The hardware topology of a setup rarely changes between two runs. With a cache, the device managers only send the
+    cheap :code:`ccd_listCount`/:code:`ccd_list` and :code:`mono_listCount`/:code:`mono_list` commands when starting
+    and skip the enumeration of the devices by :code:`ccd_discover`/:code:`mono_discover` if the ICL still lists the
+    same devices, with the same serial numbers, as the last full discovery. The CCDs read their configuration from the
+    cache, by serial number, instead of sending :code:`ccd_getConfig` when they are opened. Example::
+
+        device_manager = DeviceManager(discovery_cache=DiscoveryCache())
+
+    Call :meth:`clear` after changing the hardware, e.g. plugging an additional device, to force a full discovery.
+
+    The cache is stored as json, by default in :code:`~/.horiba_sdk/discovery_cache.json`. An unreadable cache file
+    is ignored and overwritten.
+    """
+
+    _VERSION: int = 1
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Args:
+            path (Optional[Path], optional): Path of the cache file. Defaults to
+                :code:`~/.horiba_sdk/discovery_cache.json`
+        """
+        self._path: Path = path if path is not None else Path.home() / '.horiba_sdk' / 'discovery_cache.json'
+        self._devices: dict[str, list[dict[str, Any]]] = {}
+        self._configurations: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def devices(self, device_type: str) -> Optional[list[dict[str, Any]]]:
+        """Returns the devices found by the last full discovery.
+
+        Args:
+            device_type (str): Type of the devices, e.g. 'ccd' or 'mono'
+
+        Returns:
+            Optional[list[dict[str, Any]]]: The devices as listed by the ICL, None if they were never discovered
+        """
+        return self._devices.get(device_type)
+
+    def store_devices(self, device_type: str, devices: list[dict[str, Any]]) -> None:
+        """Stores the devices found by a full discovery and writes the cache file.
+
+        Args:
+            device_type (str): Type of the devices, e.g. 'ccd' or 'mono'
+            devices (list[dict[str, Any]]): The devices as listed by the ICL
+        """
+        self._devices[device_type] = devices
+        self._save()
+
+    def matches(self, device_type: str, devices: list[dict[str, Any]]) -> bool:
+        """Checks if the devices currently listed by the ICL are the ones of the last full discovery.
+
+        The devices are compared by index, type and serial number. An empty list never matches, so that newly
+        connected devices are looked for as long as none was found.
+
+        Args:
+            device_type (str): Type of the devices, e.g. 'ccd' or 'mono'
+            devices (list[dict[str, Any]]): The devices as listed by the ICL
+
+        Returns:
+            bool: True if the devices match the cached ones
+        """
+        cached_devices: Optional[list[dict[str, Any]]] = self._devices.get(device_type)
+        if not cached_devices or len(cached_devices) != len(devices):
+            return False
+        return all(
+            _fingerprint(cached_device) == _fingerprint(device)
+            for cached_device, device in zip(cached_devices, devices)
+        )
+
+    def configuration(self, serial_number: str) -> Optional[dict[str, Any]]:
+        """Returns the cached configuration of a CCD.
+
+        Args:
+            serial_number (str): Serial number of the CCD
+
+        Returns:
+            Optional[dict[str, Any]]: The configuration as returned by :code:`ccd_getConfig`, None if not cached
+        """
+        return self._configurations.get(serial_number)
+
+    def store_configuration(self, serial_number: str, configuration: dict[str, Any]) -> None:
+        """Stores the configuration of a CCD and writes the cache file.
+
+        Args:
+            serial_number (str): Serial number of the CCD
+            configuration (dict[str, Any]): The configuration as returned by :code:`ccd_getConfig`
+        """
+        self._configurations[serial_number] = configuration
+        self._save()
+
+    def clear(self) -> None:
+        """Forgets the cached devices and configurations and removes the cache file."""
+        self._devices.clear()
+        self._configurations.clear()
+        self._path.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        if not self._path.is_file():
+            return
+        try:
+            with open(self._path) as file:
+                content: dict[str, Any] = json.load(file)
+            if content.get('version') != self._VERSION:
+                logger.info(f'Ignoring discovery cache {self._path} of version {content.get("version")}')
+                return
+            self._devices = dict(content.get('devices', {}))
+            self._configurations = dict(content.get('configurations', {}))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f'Ignoring unreadable discovery cache {self._path}: {e}')
+
+    def _save(self) -> None:
+        content: dict[str, Any] = {
+            'version': self._VERSION,
+            'devices': self._devices,
+            'configurations': self._configurations,
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            # written to a temporary file first so that a concurrent reader never sees a partial cache
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=self._path.parent, suffix='.tmp')
+            with os.fdopen(file_descriptor, 'w') as file:
+                json.dump(content, file)
+            os.replace(temporary_path, self._path)
+        except OSError as e:
+            logger.warning(f'Failed to write the discovery cache {self._path}: {e}')
+
+
+def _fingerprint(device: dict[str, Any]) -> tuple[Any, Any, Any]:
+    return device.get('index'), device.get('deviceType'), str(device.get('serialNumber', '')).strip()
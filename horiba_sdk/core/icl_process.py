@@ -0,0 +1,152 @@
+import socket
+import time
+from pathlib import Path
+from typing import Optional, final
+
+from loguru import logger
+
+ICL_EXECUTABLE: str = r'C:\Program Files\HORIBA Scientific\SDK\icl.exe'
+ICL_PROCESS_NAME: str = 'icl.exe'
+
+
+@final
+class ICLProcessMonitor:
+    """Tells if the ICL is running, walking through all the processes of the computer only as a last resort.
+
+    The ICL is considered running when, in this order:
+
+    1. its websocket port accepts connections,
+    2. the process recorded in the pid file, written when the SDK starts the ICL, is still an :code:`icl.exe`,
+    3. a process named :code:`icl.exe` is found with :code:`psutil`, e.g. an ICL started outside of the SDK that
+       does not accept connections yet.
+
+    The pid file is removed when the ICL is stopped or when the recorded process is gone. The device managers
+    additionally check the handle of the process they spawned themselves before asking the monitor.
+
+    All the methods block, the async device manager calls them in a worker thread.
+    """
+
+    def __init__(self, host: str, port: str, pid_file: Optional[Path] = None) -> None:
+        """
+        Args:
+            host (str): Host of the ICL websocket
+            port (str): Port of the ICL websocket
+            pid_file (Optional[Path], optional): Path of the pid file. Defaults to :code:`~/.horiba_sdk/icl.pid`
+        """
+        self._host: str = host
+        self._port: int = int(port)
+        self._pid_file: Path = pid_file if pid_file is not None else Path.home() / '.horiba_sdk' / 'icl.pid'
+
+    @property
+    def pid_file(self) -> Path:
+        return self._pid_file
+
+    def accepts_connections(self, timeout_in_s: float = 0.2) -> bool:
+        """Checks if the websocket port of the ICL accepts connections.
+
+        Args:
+            timeout_in_s (float, optional): Timeout of the connection attempt. Defaults to 0.2
+
+        Returns:
+            bool: True if a connection could be established
+        """
+        try:
+            with socket.create_connection((self._host, self._port), timeout=timeout_in_s):
+                return True
+        except OSError:
+            return False
+
+    def store_pid(self, pid: int) -> None:
+        """Records the pid of an ICL started by the SDK.
+
+        Args:
+            pid (int): Process id of the ICL
+        """
+        try:
+            self._pid_file.parent.mkdir(parents=True, exist_ok=True)
+            self._pid_file.write_text(str(pid))
+        except OSError as e:
+            logger.warning(f'Failed to write the ICL pid file {self._pid_file}: {e}')
+
+    def clear_pid(self) -> None:
+        """Forgets the recorded pid by removing the pid file."""
+        try:
+            self._pid_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f'Failed to remove the ICL pid file {self._pid_file}: {e}')
+
+    def recorded_pid(self) -> Optional[int]:
+        """Returns the pid of the ICL last started by the SDK.
+
+        Returns:
+            Optional[int]: The pid, None if none is recorded
+        """
+        try:
+            content: str = self._pid_file.read_text().strip()
+        except OSError:
+            return None
+        return int(content) if content.isdigit() else None
+
+    def is_running(self) -> bool:
+        """Checks if the ICL is running, see the class documentation for the checks done.
+
+        Returns:
+            bool: True if the ICL is running
+        """
+        if self.accepts_connections():
+            return True
+
+        pid: Optional[int] = self.recorded_pid()
+        if pid is not None:
+            if _is_icl_process(pid):
+                return True
+            logger.debug(f'The ICL recorded in {self._pid_file} with pid {pid} is gone')
+            self.clear_pid()
+
+        logger.debug('No running ICL recorded, looking for the ICL among the running processes')
+        import psutil  # only needed as a fallback, it is slow to import
+
+        return ICL_PROCESS_NAME in (process.info['name'] for process in psutil.process_iter(['name']))
+
+    def wait_until_ready(self, timeout_in_s: float, poll_interval_in_s: float = 0.1) -> bool:
+        """Waits until the websocket port of the ICL accepts connections.
+
+        Args:
+            timeout_in_s (float): Maximum time to wait, in seconds
+            poll_interval_in_s (float, optional): Time between two connection attempts. Defaults to 0.1
+
+        Returns:
+            bool: True if the ICL accepts connections, False if the timeout expired before
+        """
+        deadline: float = time.monotonic() + timeout_in_s
+        while not self.accepts_connections():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval_in_s)
+        return True
+
+    def wait_until_stopped(self, timeout_in_s: float, poll_interval_in_s: float = 0.1) -> bool:
+        """Waits until the websocket port of the ICL no longer accepts connections.
+
+        Args:
+            timeout_in_s (float): Maximum time to wait, in seconds
+            poll_interval_in_s (float, optional): Time between two connection attempts. Defaults to 0.1
+
+        Returns:
+            bool: True if the ICL stopped accepting connections, False if the timeout expired before
+        """
+        deadline: float = time.monotonic() + timeout_in_s
+        while self.accepts_connections():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval_in_s)
+        return True
+
+
+def _is_icl_process(pid: int) -> bool:
+    import psutil
+
+    try:
+        return bool(psutil.Process(pid).name() == ICL_PROCESS_NAME)
+    except psutil.Error:
+        return False
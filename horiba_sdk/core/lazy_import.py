@@ -0,0 +1,33 @@
+import importlib
+import sys
+from typing import Any, Callable, Optional
+
+
+def lazy_attributes(package: str, attributes: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Creates the module level :code:`__getattr__` and :code:`__dir__` of a package exposing names lazily.
+
+    The module defining a name is only imported when the name is accessed for the first time, the name is then set on
+    the package so that later accesses do not go through :code:`__getattr__` anymore. Example::
+
+        __getattr__, __dir__ = lazy_attributes(__name__, {'DeviceManager': '.device_manager'})
+
+    Args:
+        package (str): Name of the package, i.e. :code:`__name__` in its :code:`__init__.py`
+        attributes (dict[str, str]): Module defining each name, relative to the package
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The :code:`__getattr__` and :code:`__dir__` functions
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name: Optional[str] = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        value: Any = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *attributes})
+
+    return __getattr__, __dir__
@@ -0,0 +1,57 @@
+from collections.abc import Iterator
+from typing import final
+
+
+@final
+class PollingSchedule:
+    """Intervals between two polls of the busy state of a device.
+
+    The first poll happens shortly after the expected duration of the operation, the interval then grows by
+    :code:`backoff_factor` up to :code:`max_interval_s`. Short operations are therefore detected within a few
+    milliseconds, long ones do not flood the ICL with requests.
+
+    Attributes:
+        initial_interval_s (float): Interval before the second poll, in seconds
+        backoff_factor (float): Factor applied to the interval after each poll
+        max_interval_s (float): Maximum interval, in seconds
+    """
+
+    def __init__(self, initial_interval_s: float = 0.01, backoff_factor: float = 1.5, max_interval_s: float = 0.5):
+        if initial_interval_s <= 0 or max_interval_s < initial_interval_s or backoff_factor < 1:
+            raise ValueError(
+                f'Invalid polling schedule: initial interval {initial_interval_s}s, '
+                f'maximum interval {max_interval_s}s, backoff factor {backoff_factor}'
+            )
+        self.initial_interval_s = initial_interval_s
+        self.backoff_factor = backoff_factor
+        self.max_interval_s = max_interval_s
+
+    def intervals(self) -> Iterator[float]:
+        """Yields the successive intervals between two polls, in seconds."""
+        interval_s: float = self.initial_interval_s
+        while True:
+            yield interval_s
+            interval_s = min(interval_s * self.backoff_factor, self.max_interval_s)
+
+
+@final
+class IdleWaitReport:
+    """Report of a wait until a device became idle.
+
+    Attributes:
+        polls (int): Number of times the busy state was requested
+        elapsed_s (float): Time from the start of the wait until the device was seen idle, in seconds
+        detection_latency_s (float): Upper bound of the time between the device becoming idle and the wait noticing
+            it, i.e. the time since the last poll that still saw the device busy, in seconds
+    """
+
+    def __init__(self, polls: int, elapsed_s: float, detection_latency_s: float):
+        self.polls = polls
+        self.elapsed_s = elapsed_s
+        self.detection_latency_s = detection_latency_s
+
+    def __repr__(self) -> str:
+        return (
+            f'IdleWaitReport(polls={self.polls}, elapsed_s={self.elapsed_s:.3f}, '
+            f'detection_latency_s={self.detection_latency_s:.3f})'
+        )
@@ -0,0 +1,63 @@
+from typing import Any, final
+
+import numpy as np
+import numpy.typing as npt
+
+
+@final
+class RangeScanStepTiming:
+    """Time spent in each phase of one step of a range scan.
+
+    The readout of a step runs while the monochromator moves to the next center wavelength, the time the move takes
+    beyond the readout shows up in :code:`move_s` of the next step.
+
+    Attributes:
+        center_wavelength (float): Center wavelength requested for the step, in nm
+        mono_wavelength (float): Wavelength reported by the monochromator once it reached the position, in nm
+        move_s (float): Time waiting for the monochromator to reach the position and setting the center wavelength
+        acquisition_s (float): Time from the start of the acquisition until the CCD was idle again
+        readout_s (float): Time retrieving and decoding the data of the acquisition
+    """
+
+    def __init__(
+        self, center_wavelength: float, mono_wavelength: float, move_s: float, acquisition_s: float, readout_s: float
+    ) -> None:
+        self.center_wavelength = center_wavelength
+        self.mono_wavelength = mono_wavelength
+        self.move_s = move_s
+        self.acquisition_s = acquisition_s
+        self.readout_s = readout_s
+
+    def __repr__(self) -> str:
+        return (
+            f'RangeScanStepTiming(center_wavelength={self.center_wavelength}, move_s={self.move_s:.3f}, '
+            f'acquisition_s={self.acquisition_s:.3f}, readout_s={self.readout_s:.3f})'
+        )
+
+
+@final
+class RangeScanResult:
+    """Stitched spectrum of a range scan, with the segments it was made of and the timings of each step.
+
+    Attributes:
+        x_data (numpy.ndarray): Wavelengths of the stitched spectrum
+        y_data (numpy.ndarray): Counts of the stitched spectrum
+        segments (list[tuple[numpy.ndarray, numpy.ndarray]]): x and y values measured at each center wavelength, only
+            filled when the scan was run with :code:`keep_segments=True`
+        steps (list[RangeScanStepTiming]): Timings of each step
+        elapsed_s (float): Duration of the whole scan, in seconds
+    """
+
+    def __init__(
+        self,
+        x_data: npt.NDArray[np.float64],
+        y_data: npt.NDArray[np.float64],
+        segments: list[tuple[npt.NDArray[Any], npt.NDArray[Any]]],
+        steps: list[RangeScanStepTiming],
+        elapsed_s: float,
+    ) -> None:
+        self.x_data = x_data
+        self.y_data = y_data
+        self.segments = segments
+        self.steps = steps
+        self.elapsed_s = elapsed_s
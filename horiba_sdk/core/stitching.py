@@ -0,0 +1,193 @@
+from collections.abc import Sequence
+from typing import final
+
+import numpy as np
+import numpy.typing as npt
+
+
+def stitch_linear(
+    segments: Sequence[tuple[npt.ArrayLike, npt.ArrayLike]],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Stitches overlapping spectra into a single spectrum.
+
+    In the overlap of two neighbouring segments, the counts of the second segment are linearly interpolated on the
+    wavelengths of the first one and both are averaged. Outside of the overlaps, the values are kept as measured.
+
+    All the segments are processed at once: the overlaps and the interpolations are computed on the concatenated
+    segments, so the cost grows linearly with the number of segments.
+
+    .. warning:: Each segment must overlap the next one, and only its neighbours
+
+    Args:
+        segments (Sequence[tuple[ArrayLike, ArrayLike]]): Spectra to stitch, as (x values, y values), ordered by
+            increasing wavelength. The x values of each segment must be increasing
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: x and y values of the stitched spectrum
+
+    Raises:
+        Exception: When no segment is given or when two neighbouring segments do not overlap
+    """
+    if not segments:
+        raise Exception('No spectrum to stitch')
+
+    x_segments: list[npt.NDArray[np.float64]] = [np.asarray(x, dtype=np.float64).ravel() for x, _ in segments]
+    y_segments: list[npt.NDArray[np.float64]] = [np.asarray(y, dtype=np.float64).ravel() for _, y in segments]
+    if len(segments) == 1:
+        return x_segments[0].copy(), y_segments[0].copy()
+
+    lengths: npt.NDArray[np.intp] = np.array([len(x) for x in x_segments])
+    if np.any(lengths == 0):
+        raise Exception(f'Segment {int(np.argmin(lengths))} is empty')
+    x_all: npt.NDArray[np.float64] = np.concatenate(x_segments)
+    y_all: npt.NDArray[np.float64] = np.concatenate(y_segments)
+    segment_of: npt.NDArray[np.intp] = np.repeat(np.arange(len(lengths)), lengths)
+    ends: npt.NDArray[np.intp] = np.cumsum(lengths)
+    firsts: npt.NDArray[np.float64] = x_all[ends - lengths]
+    lasts: npt.NDArray[np.float64] = x_all[ends - 1]
+
+    # overlap k lies between segment k and segment k + 1
+    overlap_starts: npt.NDArray[np.float64] = np.maximum(firsts[:-1], firsts[1:])
+    overlap_ends: npt.NDArray[np.float64] = np.minimum(lasts[:-1], lasts[1:])
+    disjoint: npt.NDArray[np.intp] = np.flatnonzero(overlap_starts >= overlap_ends)
+    if disjoint.size:
+        k: int = int(disjoint[0])
+        raise Exception(
+            f'No overlapping region between the spectra [{firsts[k]}, {lasts[k]}] and [{firsts[k + 1]}, {lasts[k + 1]}]'
+        )
+
+    last_segment: int = len(lengths) - 1
+    next_overlap: npt.NDArray[np.intp] = np.minimum(segment_of, last_segment - 1)
+    previous_overlap: npt.NDArray[np.intp] = np.maximum(segment_of - 1, 0)
+    in_next_overlap = (
+        (segment_of < last_segment) & (x_all >= overlap_starts[next_overlap]) & (x_all <= overlap_ends[next_overlap])
+    )
+    in_previous_overlap = (
+        (segment_of > 0) & (x_all >= overlap_starts[previous_overlap]) & (x_all <= overlap_ends[previous_overlap])
+    )
+
+    # The points of a segment inside its previous overlap are the interpolation nodes of that overlap. Shifting each
+    # segment by a multiple of the whole span keeps the nodes of all the overlaps sorted in one array, so a single
+    # np.interp call interpolates every overlap.
+    span: float = float(x_all.max() - x_all.min()) + 1.0
+    node_segments: npt.NDArray[np.intp] = segment_of[in_previous_overlap]
+    nodes: npt.NDArray[np.float64] = x_all[in_previous_overlap] + node_segments * span
+    node_values: npt.NDArray[np.float64] = y_all[in_previous_overlap]
+    last_nodes: npt.NDArray[np.float64] = np.full(len(lengths), -np.inf)
+    np.maximum.at(last_nodes, node_segments, nodes)
+
+    target_segments: npt.NDArray[np.intp] = segment_of[in_next_overlap] + 1
+    queries: npt.NDArray[np.float64] = np.minimum(
+        x_all[in_next_overlap] + target_segments * span, last_nodes[target_segments]
+    )
+    y_stitched: npt.NDArray[np.float64] = y_all.copy()
+    y_stitched[in_next_overlap] = (y_all[in_next_overlap] + np.interp(queries, nodes, node_values)) / 2
+
+    keep = ~in_previous_overlap
+    x_stitched: npt.NDArray[np.float64] = x_all[keep]
+    y_stitched = y_stitched[keep]
+    if np.any(np.diff(x_stitched) < 0):
+        order: npt.NDArray[np.intp] = np.argsort(x_stitched, kind='stable')
+        x_stitched, y_stitched = x_stitched[order], y_stitched[order]
+    return x_stitched, y_stitched
+
+
+@final
+class IncrementalLinearStitch:
+    """Stitches overlapping spectra as they arrive, one segment at a time.
+
+    Each new segment is only merged with the end of the spectrum stitched so far, with the same linear model as
+    :func:`stitch_linear`: the result after the last segment is the same. The raw segments are not kept, only the
+    stitched spectrum, which grows in a buffer whose capacity doubles when it is full.
+
+    Example::
+
+        stitch = IncrementalLinearStitch()
+        for x_values, y_values in segments:
+            stitch.add_segment(x_values, y_values)
+            x_data, y_data = stitch.spectrum()  # e.g. update a live display
+
+    .. warning:: The segments must be added by increasing wavelength, and each one must overlap the previous one
+
+    Attributes:
+        segment_count (int): Number of segments added so far
+    """
+
+    def __init__(self, initial_capacity: int = 4096) -> None:
+        if initial_capacity < 1:
+            raise ValueError(f'The initial capacity must be positive, got {initial_capacity}')
+        self.segment_count: int = 0
+        self._x: npt.NDArray[np.float64] = np.empty(initial_capacity, dtype=np.float64)
+        self._y: npt.NDArray[np.float64] = np.empty(initial_capacity, dtype=np.float64)
+        self._size: int = 0
+        # start of the values of the last segment, which still change when the next segment overlaps them
+        self._tail_start: int = 0
+        self._last_segment_first: float = 0.0
+        self._last_segment_last: float = 0.0
+
+    def add_segment(self, x_values: npt.ArrayLike, y_values: npt.ArrayLike) -> None:
+        """Merges the segment with the end of the spectrum stitched so far.
+
+        Args:
+            x_values (ArrayLike): Increasing x values of the segment
+            y_values (ArrayLike): y values of the segment
+
+        Raises:
+            Exception: When the segment is empty, starts before the previous one or does not overlap it
+        """
+        x_segment: npt.NDArray[np.float64] = np.asarray(x_values, dtype=np.float64).ravel()
+        y_segment: npt.NDArray[np.float64] = np.asarray(y_values, dtype=np.float64).ravel()
+        if x_segment.size == 0:
+            raise Exception('The segment is empty')
+
+        if self.segment_count == 0:
+            self._append(x_segment, y_segment)
+        else:
+            if x_segment[0] < self._last_segment_first:
+                raise Exception(
+                    f'The segment starting at {x_segment[0]} starts before the previous one, '
+                    f'starting at {self._last_segment_first}'
+                )
+            overlap_start: float = float(x_segment[0])
+            overlap_end: float = min(self._last_segment_last, float(x_segment[-1]))
+            if overlap_start >= overlap_end:
+                raise Exception(
+                    f'No overlapping region between the spectra [{self._last_segment_first}, '
+                    f'{self._last_segment_last}] and [{x_segment[0]}, {x_segment[-1]}]'
+                )
+
+            x_tail: npt.NDArray[np.float64] = self._x[self._tail_start : self._size]
+            y_tail: npt.NDArray[np.float64] = self._y[self._tail_start : self._size]
+            in_tail_overlap = (x_tail >= overlap_start) & (x_tail <= overlap_end)
+            in_segment_overlap = x_segment <= overlap_end
+            y_tail[in_tail_overlap] = (
+                y_tail[in_tail_overlap]
+                + np.interp(x_tail[in_tail_overlap], x_segment[in_segment_overlap], y_segment[in_segment_overlap])
+            ) / 2
+            self._tail_start = self._size
+            self._append(x_segment[~in_segment_overlap], y_segment[~in_segment_overlap])
+
+        self._last_segment_first = float(x_segment[0])
+        self._last_segment_last = float(x_segment[-1])
+        self.segment_count += 1
+
+    def spectrum(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Returns the spectrum stitched so far.
+
+        The values of the last segment that lie in its overlap with the next segment are not averaged yet.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: x and y values of the stitched spectrum. They are views on the
+            internal buffer, copy them to keep them while more segments are added
+        """
+        return self._x[: self._size], self._y[: self._size]
+
+    def _append(self, x_values: npt.NDArray[np.float64], y_values: npt.NDArray[np.float64]) -> None:
+        required: int = self._size + x_values.size
+        if required > self._x.size:
+            capacity: int = max(required, 2 * self._x.size)
+            self._x = np.concatenate((self._x[: self._size], np.empty(capacity - self._size, dtype=np.float64)))
+            self._y = np.concatenate((self._y[: self._size], np.empty(capacity - self._size, dtype=np.float64)))
+        self._x[self._size : required] = x_values
+        self._y[self._size : required] = y_values
+        self._size = required
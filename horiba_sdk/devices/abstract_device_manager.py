@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from horiba_sdk.communication import AbstractCommunicator
+from horiba_sdk.devices.opened_devices import OpenedDevices
 from horiba_sdk.devices.single_devices import ChargeCoupledDevice, Monochromator
 
 
@@ -66,3 +67,33 @@ class AbstractDeviceManager(ABC):
             List[ChargeCoupledDevice]: The detected CCDS.
         """
         pass
+
+    def open_all(self, timeout: float = 30) -> OpenedDevices:
+        """
+        Opens all the discovered devices concurrently, should be called after :meth:`discover_devices`.
+
+        The returned devices are opened when awaited or when entering them as an async context manager, the latter
+        also closes them on exit::
+
+            async with device_manager.open_all() as devices:
+                ccd = devices.charge_coupled_devices[0]
+
+        Args:
+            timeout (float): Timeout in seconds for opening each device.
+
+        Returns:
+            OpenedDevices: The devices to open
+        """
+        return OpenedDevices(self.charge_coupled_devices, self.monochromators, timeout)
+
+    async def close_all(self, timeout: float = 30) -> None:
+        """
+        Closes all the discovered devices concurrently.
+
+        Args:
+            timeout (float): Timeout in seconds for closing each device.
+
+        Raises:
+            Exception: When at least one device failed to close, all the other devices are closed nonetheless
+        """
+        await OpenedDevices(self.charge_coupled_devices, self.monochromators, timeout).close()
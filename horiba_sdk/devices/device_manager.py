@@ -36,17 +36,20 @@ import platform
 from pathlib import Path
 from typing import Optional, final
 
-import psutil
 from loguru import logger
 from overrides import override
 
 from horiba_sdk.communication import (
     AbstractCommunicator,
+    BinaryFrame,
+    BinaryMessageType,
     Command,
     CommunicationException,
     Response,
     WebsocketCommunicator,
 )
+from horiba_sdk.core.discovery_cache import DiscoveryCache
+from horiba_sdk.core.icl_process import ICL_EXECUTABLE, ICLProcessMonitor
 from horiba_sdk.devices import AbstractDeviceManager
 from horiba_sdk.devices.ccd_discovery import ChargeCoupledDevicesDiscovery
 from horiba_sdk.devices.monochromator_discovery import MonochromatorsDiscovery
@@ -66,6 +69,8 @@ class DeviceManager(AbstractDeviceManager):
         icl_ip: str = '127.0.0.1',
         icl_port: str = '25010',
         enable_binary_messages: bool = True,
+        discovery_cache: Optional[DiscoveryCache] = None,
+        icl_start_timeout: float = 30,
     ):
         """
         Initializes the DeviceManager with the specified communicator class.
@@ -75,6 +80,11 @@ class DeviceManager(AbstractDeviceManager):
             icl_ip (str) = '127.0.0.1': websocket IP
             icl_port (str) = '25010': websocket port
             enable_binary_messages (bool) = True: If True, binary messages are enabled.
+            discovery_cache (Optional[DiscoveryCache]) = None: If set, the device lists and the CCD configurations are
+                cached on disk and the enumeration of the devices is skipped when the ICL still lists the same devices,
+                see :class:`horiba_sdk.core.discovery_cache.DiscoveryCache`.
+            icl_start_timeout (float) = 30: Time in seconds to wait for a started ICL to accept connections, and for
+                the ICL to stop after its shutdown.
         """
         super().__init__()
         self._start_icl = start_icl
@@ -83,8 +93,12 @@ class DeviceManager(AbstractDeviceManager):
         self._icl_websocket_ip: str = icl_ip
         self._icl_websocket_port: str = icl_port
         self._icl_process: Optional[asyncio.subprocess.Process] = None
+        self._icl_process_monitor: ICLProcessMonitor = ICLProcessMonitor(icl_ip, icl_port)
+        self._icl_start_timeout: float = icl_start_timeout
         self._binary_messages: bool = enable_binary_messages
+        self._discovery_cache: Optional[DiscoveryCache] = discovery_cache
         self._charge_coupled_devices: list[ChargeCoupledDevice] = []
+        self._charge_coupled_devices_by_index: dict[int, ChargeCoupledDevice] = {}
         self._monochromators: list[Monochromator] = []
 
         error_list_path: Path = Path(str(importlib.resources.files('horiba_sdk.icl_error') / 'error_list.json'))
@@ -116,24 +130,32 @@ class DeviceManager(AbstractDeviceManager):
 
     async def start_icl(self) -> None:
         """
-        Starts the ICL software and establishes communication.
+        Starts the ICL software and waits until it accepts connections.
+
+        Raises:
+            Exception: When the ICL exits or does not accept connections within the start timeout
         """
         logger.info('Starting ICL software...')
-        # try:
         if platform.system() != 'Windows':
             logger.info('Only Windows is supported for ICL software. Skip starting of ICL...')
             return
 
-        icl_running = 'icl.exe' in (p.name() for p in psutil.process_iter())
-        if not icl_running:
+        # the monitor connects to the port and scans the processes, both block
+        if not await asyncio.to_thread(self._icl_process_monitor.is_running):
             logger.info('icl not running, starting it...')
-            # subprocess.Popen([r'C:\Program Files\HORIBA Scientific\SDK\icl.exe'])
-            self._icl_process = await asyncio.create_subprocess_exec(r'C:\Program Files\HORIBA Scientific\SDK\icl.exe')
-        # except subprocess.CalledProcessError:
-        #    logger.error('Failed to start ICL software.')
-        # TODO: [saga] is this the best way handle exceptions?
-        # except Exception as e:  # pylint: disable=broad-exception-caught
-        #     logger.error('Unexpected error: %s', e)
+            self._icl_process = await asyncio.create_subprocess_exec(ICL_EXECUTABLE)
+            self._icl_process_monitor.store_pid(self._icl_process.pid)
+
+        await self._wait_until_icl_ready()
+
+    async def _wait_until_icl_ready(self) -> None:
+        deadline: float = asyncio.get_running_loop().time() + self._icl_start_timeout
+        while not await asyncio.to_thread(self._icl_process_monitor.accepts_connections):
+            if self._icl_process is not None and self._icl_process.returncode is not None:
+                raise Exception(f'ICL software exited with code {self._icl_process.returncode} while starting')
+            if asyncio.get_running_loop().time() >= deadline:
+                raise Exception(f'ICL software did not accept connections within {self._icl_start_timeout}s')
+            await asyncio.sleep(0.1)
 
     async def _enable_binary_messages(self) -> None:
         bin_mode_command: Command = Command('icl_binMode', {'mode': 'all'})
@@ -172,51 +194,74 @@ class DeviceManager(AbstractDeviceManager):
             await self._icl_communicator.close()
 
         if self._icl_process is not None:
-            await self._icl_process.wait()
-        icl_running = 'icl.exe' in (p.name() for p in psutil.process_iter())
-        if icl_running:
+            try:
+                await asyncio.wait_for(self._icl_process.wait(), self._icl_start_timeout)
+            except asyncio.TimeoutError as e:
+                raise Exception('Failed to shutdown ICL software.') from e
+            self._icl_process = None
+        elif not await self._wait_until_icl_stopped():
             raise Exception('Failed to shutdown ICL software.')
+        self._icl_process_monitor.clear_pid()
 
         logger.info('icl_shutdown command sent')
 
-    def _format_icl_binary_to_string(self, message: bytes) -> str:
-        return ' '.join(format(byte, '02x') for byte in message[::-1])
+    async def _wait_until_icl_stopped(self) -> bool:
+        deadline: float = asyncio.get_running_loop().time() + self._icl_start_timeout
+        while await asyncio.to_thread(self._icl_process_monitor.accepts_connections):
+            if asyncio.get_running_loop().time() >= deadline:
+                return False
+            await asyncio.sleep(0.1)
+        return not await asyncio.to_thread(self._icl_process_monitor.is_running)
 
     async def _binary_message_callback(self, message: bytes) -> None:
-        # hex_data = ' '.join(format(byte, '02x') for byte in message)
-        # if len(message) < 18:
-        #     logger.warning(f'binary message not valid: {len(message)} < 16')
-        # logger.info(f'Received binary message: {hex_data}')
-        # logger.info(f'magic number: {self._format_icl_binary_to_string(message[:2])}')
-        # logger.info(f'message type: {self._format_icl_binary_to_string(message[2:4])}')
-        # logger.info(f'element type: {self._format_icl_binary_to_string(message[4:6])}')
-        # logger.info(f'element count: {self._format_icl_binary_to_string(message[6:10])}')
-        # logger.info(f'tag 1: {self._format_icl_binary_to_string(message[10:12])}')
-        # logger.info(f'tag 2: {self._format_icl_binary_to_string(message[12:14])}')
-        # logger.info(f'tag 3: {self._format_icl_binary_to_string(message[14:16])}')
-        # logger.info(f'tag 4: {self._format_icl_binary_to_string(message[16:18])}')
-        # logger.info(f'payload: {self._format_icl_binary_to_string(message[18:])}')
-        # logger.info(f'payload as string: {str(message[18:])}')
-        pass
+        try:
+            frame: BinaryFrame = BinaryFrame.from_bytes(message)
+        except Exception as e:
+            logger.warning(f'Discarding invalid binary message: {e}')
+            return
+
+        if frame.message_type != BinaryMessageType.DATA:
+            logger.info(f'ICL binary {frame.message_type.name.lower()} message: {frame.text()}')
+            return
+
+        ccd: Optional[ChargeCoupledDevice] = self._charge_coupled_devices_by_index.get(frame.device_index)
+        if ccd is None:
+            logger.warning(f'Discarding binary data frame for unknown CCD #{frame.device_index}')
+            return
+
+        ccd.receive_binary_frame(frame)
 
     @override
     async def discover_devices(self, error_on_no_device: bool = False) -> None:
         """
         Discovers the connected devices and saves them internally.
 
+        The CCDs and the monochromators are discovered concurrently.
+
         Args:
             error_on_no_device (bool): If True, an exception is raised if no device is connected.
         """
         ccds_discovery: ChargeCoupledDevicesDiscovery = ChargeCoupledDevicesDiscovery(
-            self._icl_communicator, self._icl_error_db
+            self._icl_communicator, self._icl_error_db, self._discovery_cache
         )
-        await ccds_discovery.execute(error_on_no_device)
-        self._charge_coupled_devices = ccds_discovery.charge_coupled_devices()
-
         monochromators_discovery: MonochromatorsDiscovery = MonochromatorsDiscovery(
-            self._icl_communicator, self._icl_error_db
+            self._icl_communicator, self._icl_error_db, self._discovery_cache
         )
-        await monochromators_discovery.execute(error_on_no_device)
+        if not self._icl_communicator.opened():
+            await self._icl_communicator.open()
+
+        # the discoveries of the device families overlap, all of them complete before an error is raised
+        results: tuple[Optional[BaseException], ...] = await asyncio.gather(
+            ccds_discovery.execute(error_on_no_device),
+            monochromators_discovery.execute(error_on_no_device),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        self._charge_coupled_devices = ccds_discovery.charge_coupled_devices()
+        self._charge_coupled_devices_by_index = {ccd.id(): ccd for ccd in self._charge_coupled_devices}
         self._monochromators = monochromators_discovery.monochromators()
 
     @property
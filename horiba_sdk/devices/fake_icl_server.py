@@ -35,18 +35,19 @@ class FakeICLServer:
                 await websocket.send(message)
 
             if command['command'].startswith('icl_'):
-                response = json.dumps(self.icl_responses[command['command']])
-                await websocket.send(response)
+                await websocket.send(self._response_for(self.icl_responses, command))
             elif command['command'].startswith('mono_'):
-                response = json.dumps(self.monochromator_responses[command['command']])
-                await websocket.send(response)
+                await websocket.send(self._response_for(self.monochromator_responses, command))
             elif command['command'].startswith('ccd_'):
-                response = json.dumps(self.ccd_responses[command['command']])
-                await websocket.send(response)
+                await websocket.send(self._response_for(self.ccd_responses, command))
             else:
                 logger.info('unknown command, responding with message')
                 await websocket.send(message)
 
+    def _response_for(self, responses, command):
+        response = {'command': command['command'], **responses[command['command']], 'id': command['id']}
+        return json.dumps(response)
+
     async def start(self):
         self._server = await websockets.serve(self.echo, self._fake_icl_host, self._fake_icl_port)
 
@@ -0,0 +1,760 @@
+"""
+Stateful simulation of the ICL, its CCDs and its monochromators.
+
+Unlike the canned responses of :class:`horiba_sdk.devices.fake_icl_server.FakeICLServer`, the simulator keeps the
+state of each device, models how long the acquisitions and the moves of the monochromators take and generates
+synthetic data of the size of the configured regions of interest. It is served over websockets by
+:class:`horiba_sdk.devices.icl_simulator_server.ICLSimulatorServer` and by its synchronous counterpart, so that
+applications and throughput benchmarks run without hardware.
+
+Commands that are not simulated are answered with the canned responses of
+:code:`horiba_sdk/devices/fake_responses/*.json`.
+"""
+
+import copy
+import importlib.resources
+import json
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Union, final
+
+import numpy as np
+import numpy.typing as npt
+
+from horiba_sdk.communication.binary_frame import BinaryElementType, BinaryFrame, BinaryMessageType
+from horiba_sdk.core.acquisition_format import AcquisitionFormat
+from horiba_sdk.core.timer_resolution import TimerResolution
+from horiba_sdk.core.x_axis_conversion_type import XAxisConversionType
+
+_BINARY_MAGIC_NUMBER: int = 0x1CE1
+
+# emission lines of a mercury argon lamp in nm and their relative intensity, used to shape the synthetic spectra
+_EMISSION_LINES: tuple[tuple[float, float], ...] = (
+    (253.65, 1.0),
+    (296.73, 0.15),
+    (365.02, 0.4),
+    (404.66, 0.35),
+    (435.83, 0.8),
+    (546.07, 0.9),
+    (576.96, 0.2),
+    (579.07, 0.2),
+    (696.54, 0.1),
+    (763.51, 0.25),
+    (811.53, 0.3),
+)
+
+
+class SimulatorError(Exception):
+    """Error answered to the client in the ICL format :code:`'[E];<error code>;<error string>'`."""
+
+    def __init__(self, code: int, text: str) -> None:
+        super().__init__(f'[E];{code};{text}')
+
+
+@final
+class SimulatedRegionOfInterest:
+    """Region of interest of a simulated CCD, as set by :code:`ccd_setRoi`."""
+
+    def __init__(self, x_origin: int, y_origin: int, x_size: int, y_size: int, x_bin: int, y_bin: int) -> None:
+        self.x_origin = x_origin
+        self.y_origin = y_origin
+        self.x_size = x_size
+        self.y_size = y_size
+        self.x_bin = max(x_bin, 1)
+        self.y_bin = max(y_bin, 1)
+
+    @property
+    def columns(self) -> int:
+        return max(self.x_size // self.x_bin, 1)
+
+    @property
+    def rows(self) -> int:
+        return max(self.y_size // self.y_bin, 1)
+
+
+@final
+class SimulatedChargeCoupledDevice:
+    """State of a simulated CCD."""
+
+    def __init__(self, index: int, serial_number: str, configuration: dict[str, Any]) -> None:
+        self.index = index
+        self.serial_number = serial_number
+        self.configuration = configuration
+        self.chip_width: int = int(configuration.get('chipWidth', 1024))
+        self.chip_height: int = int(configuration.get('chipHeight', 256))
+        self.opened: bool = False
+        self.busy_until: float = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        """Restores the settings the CCD has after being powered on."""
+        self.exposure_time: int = 0
+        self.timer_resolution: TimerResolution = TimerResolution._1000_MICROSECONDS
+        self.gain_token: int = 0
+        self.speed_token: int = 0
+        self.acquisition_count: int = 1
+        self.clean_count: int = 1
+        self.clean_count_mode: int = 238
+        self.acquisition_format: AcquisitionFormat = AcquisitionFormat.SPECTRA
+        self.x_axis_conversion_type: XAxisConversionType = XAxisConversionType.NONE
+        self.data_retrieval_method: int = 0
+        self.center_wavelength: float = 320.0
+        self.open_shutter: bool = True
+        self.regions_of_interest: dict[int, SimulatedRegionOfInterest] = {
+            1: SimulatedRegionOfInterest(0, 0, 1000, 200, 1, 200)
+        }
+
+    def snapshot(self) -> 'SimulatedChargeCoupledDevice':
+        """Returns a copy of the current settings, to generate data without holding the lock of the simulator.
+
+        The regions of interest are replaced by the commands, never modified, so they are shared with the copy.
+        """
+        snapshot: SimulatedChargeCoupledDevice = copy.copy(self)
+        snapshot.regions_of_interest = dict(self.regions_of_interest)
+        return snapshot
+
+    def exposure_s(self) -> float:
+        unit_s: float = 1e-3 if self.timer_resolution == TimerResolution._1000_MICROSECONDS else 1e-6
+        return self.exposure_time * unit_s
+
+
+@final
+class SimulatedMonochromator:
+    """State of a simulated monochromator, the wavelength moves linearly to its target."""
+
+    def __init__(self, index: int, serial_number: str) -> None:
+        self.index = index
+        self.serial_number = serial_number
+        self.opened: bool = False
+        self.start_wavelength: float = 320.0
+        self.target_wavelength: float = 320.0
+        self.move_start: float = 0.0
+        self.move_end: float = 0.0
+        self.accessories_busy_until: float = 0.0
+        self.grating_position: int = 1
+        self.filter_wheel_positions: dict[int, int] = {}
+        self.mirror_positions: dict[int, int] = {}
+        self.slit_positions_in_mm: dict[int, float] = {}
+        self.slit_step_positions: dict[int, int] = {}
+        self.shutter_opened: bool = False
+
+    def wavelength(self, now: float) -> float:
+        if now >= self.move_end or self.move_end <= self.move_start:
+            return self.target_wavelength
+        progress: float = (now - self.move_start) / (self.move_end - self.move_start)
+        return self.start_wavelength + (self.target_wavelength - self.start_wavelength) * progress
+
+    def is_busy(self, now: float) -> bool:
+        return now < self.move_end or now < self.accessories_busy_until
+
+
+@final
+class ICLSimulator:
+    """Simulated ICL holding the state of all the simulated devices.
+
+    The simulator is shared by all the clients of a server, each client gets its own :class:`ICLSimulatorSession`
+    which tracks the binary mode set by :code:`icl_binMode`. All the methods are thread safe. The commands are executed
+    one at a time, except the generation of the acquisition data which works on a copy of the settings of the CCD so
+    that several clients acquire at the same time.
+
+    Timing model:
+
+    - an acquisition keeps the CCD busy for the exposure time times the acquisition count, plus the readout of the
+      pixels of all the regions of interest,
+    - a monochromator moves at a constant speed, the accessories (grating, filter wheels, mirrors, slits) take a fixed
+      time to move.
+
+    The synthetic counts are a dark level plus the lines of a mercury argon lamp, scaled by the exposure time and the
+    gain. With an x axis conversion, the x data are wavelengths around the center wavelength of the CCD, otherwise
+    pixel positions.
+    """
+
+    def __init__(
+        self,
+        ccd_count: int = 1,
+        monochromator_count: int = 1,
+        move_speed_nm_per_s: float = 2000.0,
+        accessory_move_s: float = 0.05,
+        readout_s_per_pixel: float = 1e-8,
+        dispersion_nm_per_pixel: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            ccd_count (int, optional): Number of simulated CCDs. Defaults to 1
+            monochromator_count (int, optional): Number of simulated monochromators. Defaults to 1
+            move_speed_nm_per_s (float, optional): Speed of the monochromators. Defaults to 2000.0
+            accessory_move_s (float, optional): Time taken by a move of a monochromator accessory. Defaults to 0.05
+            readout_s_per_pixel (float, optional): Readout time of one pixel of the CCDs. Defaults to 1e-8
+            dispersion_nm_per_pixel (float, optional): Wavelength covered by one pixel of the CCDs. Defaults to 0.1
+            clock (Callable[[], float], optional): Monotonic clock in seconds. Defaults to :func:`time.monotonic`
+        """
+        self._move_speed_nm_per_s = move_speed_nm_per_s
+        self._accessory_move_s = accessory_move_s
+        self._readout_s_per_pixel = readout_s_per_pixel
+        self._dispersion_nm_per_pixel = dispersion_nm_per_pixel
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        fake_responses_path: Path = Path(str(importlib.resources.files('horiba_sdk.devices'))) / 'fake_responses'
+        self._canned_responses: dict[str, dict[str, Any]] = {}
+        for file_name in ('icl.json', 'ccd.json', 'monochromator.json'):
+            with open(fake_responses_path / file_name) as json_file:
+                self._canned_responses.update(json.load(json_file))
+
+        ccd_configuration: dict[str, Any] = self._canned_results('ccd_getConfig')['configuration']
+        ccd_serial_number: str = ccd_configuration.get('serialNumber', 'Camera SN:  2244')
+        self._charge_coupled_devices: list[SimulatedChargeCoupledDevice] = [
+            SimulatedChargeCoupledDevice(
+                index,
+                _numbered(ccd_serial_number, index),
+                {**ccd_configuration, 'serialNumber': _numbered(ccd_serial_number, index)},
+            )
+            for index in range(ccd_count)
+        ]
+        mono_serial_number: str = self._canned_results('mono_list')['devices'][0]['serialNumber'].strip()
+        self._monochromators: list[SimulatedMonochromator] = [
+            SimulatedMonochromator(index, _numbered(mono_serial_number, index)) for index in range(monochromator_count)
+        ]
+
+        self._handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            'ccd_discover': lambda _parameters: {'count': len(self._charge_coupled_devices)},
+            'ccd_listCount': lambda _parameters: {'count': len(self._charge_coupled_devices)},
+            'ccd_list': self._ccd_list,
+            'ccd_open': self._ccd_open,
+            'ccd_close': self._ccd_close,
+            'ccd_isOpen': lambda parameters: {'open': self._ccd(parameters).opened},
+            'ccd_restart': self._ccd_restart,
+            'ccd_getConfig': lambda parameters: {'configuration': self._ccd(parameters).configuration},
+            'ccd_getChipSize': self._ccd_chip_size,
+            'ccd_getExposureTime': lambda parameters: {'time': self._ccd(parameters).exposure_time},
+            'ccd_setExposureTime': self._ccd_set_exposure_time,
+            'ccd_getTimerResolution': self._ccd_timer_resolution,
+            'ccd_setTimerResolution': self._ccd_set_timer_resolution,
+            'ccd_getGain': self._ccd_gain,
+            'ccd_setGain': self._ccd_set_gain,
+            'ccd_getSpeed': self._ccd_speed,
+            'ccd_setSpeed': self._ccd_set_speed,
+            'ccd_getAcqCount': lambda parameters: {'count': self._ccd(parameters).acquisition_count},
+            'ccd_setAcqCount': self._ccd_set_acquisition_count,
+            'ccd_getCleanCount': self._ccd_clean_count,
+            'ccd_setCleanCount': self._ccd_set_clean_count,
+            'ccd_setAcqFormat': self._ccd_set_acquisition_format,
+            'ccd_setRoi': self._ccd_set_region_of_interest,
+            'ccd_getXAxisConversionType': self._ccd_x_axis_conversion_type,
+            'ccd_setXAxisConversionType': self._ccd_set_x_axis_conversion_type,
+            'ccd_getDataRetrievalMethod': self._ccd_data_retrieval_method,
+            'ccd_setDataRetrievalMethod': self._ccd_set_data_retrieval_method,
+            'ccd_setCenterWavelength': self._ccd_set_center_wavelength,
+            'ccd_calculateRangeModePositions': self._ccd_range_mode_positions,
+            'ccd_getDataSize': self._ccd_data_size,
+            'ccd_getAcquisitionReady': lambda parameters: {'ready': self._ccd(parameters).opened},
+            'ccd_getAcquisitionBusy': self._ccd_acquisition_busy,
+            'ccd_setAcquisitionStart': self._ccd_acquisition_start,
+            'ccd_setAcquisitionAbort': self._ccd_acquisition_abort,
+            'mono_discover': lambda _parameters: {'count': len(self._monochromators)},
+            'mono_listCount': lambda _parameters: {'count': len(self._monochromators)},
+            'mono_list': self._mono_list,
+            'mono_open': self._mono_open,
+            'mono_close': self._mono_close,
+            'mono_isOpen': lambda parameters: {'open': self._mono(parameters).opened},
+            'mono_isBusy': lambda parameters: {'busy': self._mono(parameters).is_busy(self._clock())},
+            'mono_init': self._mono_init,
+            'mono_getPosition': self._mono_position,
+            'mono_setPosition': self._mono_set_position,
+            'mono_moveToPosition': self._mono_move_to_position,
+            'mono_getGratingPosition': lambda parameters: {'position': self._mono(parameters).grating_position},
+            'mono_moveGrating': self._mono_move_grating,
+            'mono_getFilterWheelPosition': self._mono_filter_wheel_position,
+            'mono_moveFilterWheel': self._mono_move_filter_wheel,
+            'mono_getMirrorPosition': self._mono_mirror_position,
+            'mono_moveMirror': self._mono_move_mirror,
+            'mono_getSlitPositionInMM': self._mono_slit_position_in_mm,
+            'mono_moveSlitMM': self._mono_move_slit_in_mm,
+            'mono_getSlitStepPosition': self._mono_slit_step_position,
+            'mono_moveSlit': self._mono_move_slit,
+            'mono_shutterOpen': self._mono_shutter_open,
+            'mono_shutterClose': self._mono_shutter_close,
+            'mono_getShutterStatus': self._mono_shutter_status,
+        }
+
+    @property
+    def charge_coupled_devices(self) -> list[SimulatedChargeCoupledDevice]:
+        return self._charge_coupled_devices
+
+    @property
+    def monochromators(self) -> list[SimulatedMonochromator]:
+        return self._monochromators
+
+    def session(self) -> 'ICLSimulatorSession':
+        """Creates the session of a newly connected client.
+
+        Returns:
+            ICLSimulatorSession: The session, binary messages are disabled until it sends :code:`icl_binMode`
+        """
+        return ICLSimulatorSession(self)
+
+    def execute(self, command: dict[str, Any], session: 'ICLSimulatorSession') -> tuple[dict[str, Any], list[bytes]]:
+        """Executes a command.
+
+        Args:
+            command (dict[str, Any]): The command, as sent by the client
+            session (ICLSimulatorSession): Session of the client
+
+        Returns:
+            tuple[dict[str, Any], list[bytes]]: The json response and the binary messages to send after it
+        """
+        name: str = command['command']
+        parameters: dict[str, Any] = command.get('parameters') or {}
+        response: dict[str, Any] = {'id': command.get('id', 0), 'command': name, 'results': {}, 'errors': []}
+        session.pending_binary_messages = []
+        try:
+            acquired_ccd: Optional[SimulatedChargeCoupledDevice] = None
+            with self._lock:
+                handler = self._handlers.get(name)
+                if name == 'icl_binMode':
+                    response['results'] = self._icl_bin_mode(parameters, session)
+                elif name == 'ccd_getAcquisitionData':
+                    acquired_ccd = self._ccd_acquired(parameters)
+                elif handler is not None:
+                    response['results'] = handler(parameters)
+                elif name in self._canned_responses:
+                    response['results'] = self._canned_results(name)
+                else:
+                    raise SimulatorError(-2, 'ICL error: unknown command')
+            if acquired_ccd is not None:
+                response['results'] = self._ccd_acquisition_data(acquired_ccd, session)
+        except SimulatorError as e:
+            response['errors'] = [str(e)]
+        except KeyError as e:
+            response['errors'] = [str(SimulatorError(-729, f'Missing parameter argument: {e}'))]
+        except (ValueError, TypeError):
+            invalid_value: SimulatorError = (
+                SimulatorError(-513, 'MONO error: invalid parameter')
+                if name.startswith('mono_')
+                else SimulatorError(-318, 'CCD error: invalid value')
+            )
+            response['errors'] = [str(invalid_value)]
+        binary_messages, session.pending_binary_messages = session.pending_binary_messages, []
+        return response, binary_messages
+
+    def _canned_results(self, name: str) -> dict[str, Any]:
+        results: dict[str, Any] = self._canned_responses.get(name, {}).get('results', {})
+        return results
+
+    def _ccd(self, parameters: dict[str, Any]) -> SimulatedChargeCoupledDevice:
+        index: int = int(parameters['index'])
+        if not 0 <= index < len(self._charge_coupled_devices):
+            raise SimulatorError(-307, 'CCD error: invalid device index')
+        return self._charge_coupled_devices[index]
+
+    def _mono(self, parameters: dict[str, Any]) -> SimulatedMonochromator:
+        index: int = int(parameters['index'])
+        if not 0 <= index < len(self._monochromators):
+            raise SimulatorError(-508, 'MONO error: invalid device index')
+        return self._monochromators[index]
+
+    def _icl_bin_mode(self, parameters: dict[str, Any], session: 'ICLSimulatorSession') -> dict[str, Any]:
+        mode: str = parameters['mode']
+        if mode not in ('all', 'off'):
+            raise SimulatorError(-3, 'ICL error: invalid bin mode')
+        session.binary_mode = mode == 'all'
+        return {}
+
+    def _ccd_list(self, _parameters: dict[str, Any]) -> dict[str, Any]:
+        return {
+            'devices': [
+                {
+                    'deviceType': ccd.configuration.get('deviceType', ''),
+                    'index': ccd.index,
+                    'productId': int(ccd.configuration.get('productId', 0)),
+                    'serialNumber': ccd.serial_number,
+                }
+                for ccd in self._charge_coupled_devices
+            ]
+        }
+
+    def _ccd_open(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._ccd(parameters).opened = True
+        return {}
+
+    def _ccd_close(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        ccd.opened = False
+        ccd.busy_until = 0.0
+        return {}
+
+    def _ccd_restart(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        ccd.reset()
+        ccd.busy_until = 0.0
+        return {}
+
+    def _ccd_chip_size(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        return {'x': ccd.chip_width, 'y': ccd.chip_height}
+
+    def _ccd_set_exposure_time(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        exposure_time: int = int(parameters['time'])
+        if exposure_time < 0:
+            raise SimulatorError(-318, 'CCD error: invalid value')
+        self._ccd(parameters).exposure_time = exposure_time
+        return {}
+
+    def _ccd_timer_resolution(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        return {'resolutionToken': self._ccd(parameters).timer_resolution.value}
+
+    def _ccd_set_timer_resolution(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._ccd(parameters).timer_resolution = TimerResolution(int(parameters['resolutionToken']))
+        return {}
+
+    def _ccd_gain(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        return {'info': _token_info(ccd.configuration.get('gains', []), ccd.gain_token), 'token': ccd.gain_token}
+
+    def _ccd_set_gain(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        ccd.gain_token = _valid_token(ccd.configuration.get('gains', []), int(parameters['token']))
+        return {}
+
+    def _ccd_speed(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        return {'info': _token_info(ccd.configuration.get('speeds', []), ccd.speed_token), 'token': ccd.speed_token}
+
+    def _ccd_set_speed(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        ccd.speed_token = _valid_token(ccd.configuration.get('speeds', []), int(parameters['token']))
+        return {}
+
+    def _ccd_set_acquisition_count(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        count: int = int(parameters['count'])
+        if count < 1:
+            raise SimulatorError(-318, 'CCD error: invalid value')
+        self._ccd(parameters).acquisition_count = count
+        return {}
+
+    def _ccd_clean_count(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        return {'count': ccd.clean_count, 'mode': ccd.clean_count_mode}
+
+    def _ccd_set_clean_count(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        ccd.clean_count = int(parameters['count'])
+        ccd.clean_count_mode = int(parameters['mode'])
+        return {}
+
+    def _ccd_set_acquisition_format(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        ccd.acquisition_format = AcquisitionFormat(int(parameters['format']))
+        number_of_rois: int = int(parameters['numberOfRois'])
+        ccd.regions_of_interest = {
+            roi_index: roi for roi_index, roi in ccd.regions_of_interest.items() if roi_index <= number_of_rois
+        }
+        return {}
+
+    def _ccd_set_region_of_interest(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        roi = SimulatedRegionOfInterest(
+            int(parameters['xOrigin']),
+            int(parameters['yOrigin']),
+            int(parameters['xSize']),
+            int(parameters['ySize']),
+            int(parameters['xBin']),
+            int(parameters['yBin']),
+        )
+        if roi.x_origin < 0 or roi.y_origin < 0 or roi.x_origin + roi.x_size > ccd.chip_width:
+            raise SimulatorError(-318, 'CCD error: invalid value')
+        if roi.y_origin + roi.y_size > ccd.chip_height:
+            raise SimulatorError(-318, 'CCD error: invalid value')
+        ccd.regions_of_interest[int(parameters['roiIndex'])] = roi
+        return {}
+
+    def _ccd_x_axis_conversion_type(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        return {'type': self._ccd(parameters).x_axis_conversion_type.value}
+
+    def _ccd_set_x_axis_conversion_type(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._ccd(parameters).x_axis_conversion_type = XAxisConversionType(int(parameters['type']))
+        return {}
+
+    def _ccd_data_retrieval_method(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        return {'method': self._ccd(parameters).data_retrieval_method}
+
+    def _ccd_set_data_retrieval_method(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._ccd(parameters).data_retrieval_method = int(parameters['method'])
+        return {}
+
+    def _ccd_set_center_wavelength(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._ccd(parameters).center_wavelength = float(parameters['wavelength'])
+        return {}
+
+    def _ccd_range_mode_positions(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        self._mono({'index': parameters['monoIndex']})
+        start: float = float(parameters['start'])
+        end: float = float(parameters['end'])
+        overlap: int = int(parameters['overlap'])
+        roi: SimulatedRegionOfInterest = ccd.regions_of_interest.get(1, SimulatedRegionOfInterest(0, 0, 1, 1, 1, 1))
+        span: float = roi.x_size * self._dispersion_nm_per_pixel
+        step: float = (roi.x_size - overlap) * self._dispersion_nm_per_pixel
+        if end <= start or step <= 0:
+            raise SimulatorError(-318, 'CCD error: invalid value')
+        center_wavelengths: list[float] = [start + span / 2]
+        while center_wavelengths[-1] + span / 2 < end:
+            center_wavelengths.append(center_wavelengths[-1] + step)
+        return {'centerWavelengths': [round(center_wavelength, 3) for center_wavelength in center_wavelengths]}
+
+    def _ccd_data_size(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        return {'size': sum(roi.columns * roi.rows for roi in ccd.regions_of_interest.values())}
+
+    def _ccd_acquisition_busy(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        return {'isBusy': self._clock() < self._ccd(parameters).busy_until}
+
+    def _ccd_acquisition_start(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        if not ccd.opened:
+            raise SimulatorError(-305, 'CCD error: not open')
+        pixels: int = sum(roi.x_size * roi.y_size for roi in ccd.regions_of_interest.values())
+        duration_s: float = ccd.acquisition_count * (ccd.exposure_s() + pixels * self._readout_s_per_pixel)
+        ccd.open_shutter = bool(parameters.get('openShutter', True))
+        ccd.busy_until = self._clock() + duration_s
+        return {}
+
+    def _ccd_acquisition_abort(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._ccd(parameters).busy_until = 0.0
+        return {}
+
+    def _ccd_acquired(self, parameters: dict[str, Any]) -> SimulatedChargeCoupledDevice:
+        ccd: SimulatedChargeCoupledDevice = self._ccd(parameters)
+        if self._clock() < ccd.busy_until:
+            raise SimulatorError(-309, 'CCD error: acquiring')
+        return ccd.snapshot()
+
+    def _ccd_acquisition_data(
+        self, ccd: SimulatedChargeCoupledDevice, session: 'ICLSimulatorSession'
+    ) -> dict[str, Any]:
+        acquisitions: list[dict[str, Any]] = []
+        for acquisition_index in range(1, ccd.acquisition_count + 1):
+            rois: list[dict[str, Any]] = []
+            for roi_index, roi in sorted(ccd.regions_of_interest.items()):
+                x_data, y_data = self._roi_data(ccd, roi)
+                roi_description: dict[str, Any] = {
+                    'roiIndex': roi_index,
+                    'xOrigin': roi.x_origin,
+                    'yOrigin': roi.y_origin,
+                    'xSize': roi.x_size,
+                    'ySize': roi.y_size,
+                    'xBinning': roi.x_bin,
+                    'yBinning': roi.y_bin,
+                }
+                if session.binary_mode:
+                    tags: tuple[int, int, int] = (ccd.index, acquisition_index, roi_index)
+                    session.pending_binary_messages.append(_data_frame(tags, 0, BinaryElementType.FLOAT64, x_data))
+                    session.pending_binary_messages.append(_data_frame(tags, 1, BinaryElementType.UINT32, y_data))
+                else:
+                    roi_description['xData'] = [x_data.tolist()]
+                    roi_description['yData'] = y_data.tolist()
+                rois.append(roi_description)
+            acquisitions.append({'acqIndex': acquisition_index, 'roi': rois})
+        return {'acquisition': acquisitions, 'timestamp': time.strftime('%Y.%m.%d %H:%M:%S')}
+
+    def _roi_data(
+        self, ccd: SimulatedChargeCoupledDevice, roi: SimulatedRegionOfInterest
+    ) -> tuple[npt.NDArray[Any], npt.NDArray[Any]]:
+        pixels: npt.NDArray[Any] = roi.x_origin + np.arange(roi.columns, dtype=np.float64) * roi.x_bin
+        pixel_centers: npt.NDArray[Any] = pixels + (roi.x_bin - 1) / 2
+        wavelengths: npt.NDArray[Any] = (
+            ccd.center_wavelength + (pixel_centers - ccd.chip_width / 2) * self._dispersion_nm_per_pixel
+        )
+        x_data: npt.NDArray[Any] = pixels if ccd.x_axis_conversion_type == XAxisConversionType.NONE else wavelengths
+
+        signal_per_s: float = 2.0e5 * (1 + ccd.gain_token) if ccd.open_shutter else 0.0
+        profile = _lamp_profile(round(float(wavelengths[0]), 6), self._dispersion_nm_per_pixel * roi.x_bin, roi.columns)
+        pixels_per_element: int = roi.x_bin * roi.y_bin
+        row = 600.0 + profile * signal_per_s * ccd.exposure_s() * pixels_per_element
+        y_data = np.rint(np.broadcast_to(row, (roi.rows, roi.columns))).astype(np.uint32)
+        return x_data, y_data
+
+    def _mono_list(self, _parameters: dict[str, Any]) -> dict[str, Any]:
+        return {
+            'devices': [
+                {'deviceType': 'HORIBA Scientific iHR', 'index': mono.index, 'serialNumber': mono.serial_number}
+                for mono in self._monochromators
+            ]
+        }
+
+    def _mono_open(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._mono(parameters).opened = True
+        return {}
+
+    def _mono_close(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._mono(parameters).opened = False
+        return {}
+
+    def _mono_init(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        self._move(mono, 0.0)
+        mono.accessories_busy_until = self._clock() + self._accessory_move_s
+        return {}
+
+    def _mono_position(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        return {'wavelength': self._mono(parameters).wavelength(self._clock())}
+
+    def _mono_set_position(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        mono.start_wavelength = mono.target_wavelength = float(parameters['wavelength'])
+        mono.move_start = mono.move_end = 0.0
+        return {}
+
+    def _mono_move_to_position(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        if not mono.opened:
+            raise SimulatorError(-506, 'MONO error: not open')
+        self._move(mono, float(parameters['wavelength']))
+        return {}
+
+    def _move(self, mono: SimulatedMonochromator, wavelength: float) -> None:
+        now: float = self._clock()
+        mono.start_wavelength = mono.wavelength(now)
+        mono.target_wavelength = wavelength
+        mono.move_start = now
+        mono.move_end = now + abs(wavelength - mono.start_wavelength) / self._move_speed_nm_per_s
+
+    def _move_accessory(self, mono: SimulatedMonochromator) -> None:
+        mono.accessories_busy_until = self._clock() + self._accessory_move_s
+
+    def _mono_move_grating(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        mono.grating_position = int(parameters['position'])
+        self._move_accessory(mono)
+        return {}
+
+    def _mono_filter_wheel_position(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        return {'position': mono.filter_wheel_positions.get(int(parameters['locationId']), 0)}
+
+    def _mono_move_filter_wheel(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        mono.filter_wheel_positions[int(parameters['locationId'])] = int(parameters['position'])
+        self._move_accessory(mono)
+        return {}
+
+    def _mono_mirror_position(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        return {'position': mono.mirror_positions.get(int(parameters['locationId']), 0)}
+
+    def _mono_move_mirror(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        mono.mirror_positions[int(parameters['locationId'])] = int(parameters['position'])
+        self._move_accessory(mono)
+        return {}
+
+    def _mono_slit_position_in_mm(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        return {'position': mono.slit_positions_in_mm.get(int(parameters['locationId']), 0.0)}
+
+    def _mono_move_slit_in_mm(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        mono.slit_positions_in_mm[int(parameters['locationId'])] = float(parameters['position'])
+        self._move_accessory(mono)
+        return {}
+
+    def _mono_slit_step_position(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        return {'position': mono.slit_step_positions.get(int(parameters['locationId']), 0)}
+
+    def _mono_move_slit(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        mono: SimulatedMonochromator = self._mono(parameters)
+        mono.slit_step_positions[int(parameters['locationId'])] = int(parameters['position'])
+        self._move_accessory(mono)
+        return {}
+
+    def _mono_shutter_open(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._mono(parameters).shutter_opened = True
+        return {}
+
+    def _mono_shutter_close(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._mono(parameters).shutter_opened = False
+        return {}
+
+    def _mono_shutter_status(self, parameters: dict[str, Any]) -> dict[str, Any]:
+        shutter_status: int = int(self._mono(parameters).shutter_opened)
+        return {'shutter 1': shutter_status, 'shutter 2': shutter_status}
+
+
+@final
+class ICLSimulatorSession:
+    """Connection of one client to the :class:`ICLSimulator`.
+
+    Attributes:
+        binary_mode (bool): Whether the acquisition data is sent as binary messages, set by :code:`icl_binMode`
+        pending_binary_messages (list[bytes]): Binary messages produced by the command being executed
+    """
+
+    def __init__(self, simulator: ICLSimulator) -> None:
+        self._simulator = simulator
+        self.binary_mode: bool = False
+        self.pending_binary_messages: list[bytes] = []
+
+    def handle(self, message: Union[str, bytes]) -> list[Union[str, bytes]]:
+        """Handles a message of the client.
+
+        Args:
+            message (Union[str, bytes]): The json command sent by the client
+
+        Returns:
+            list[Union[str, bytes]]: The messages to send back: the json response followed by the binary messages
+            holding the acquisition data, if any. Messages that are not commands are echoed
+        """
+        try:
+            command: Any = json.loads(message)
+        except ValueError:
+            return [message]
+        if not isinstance(command, dict) or 'command' not in command:
+            return [message]
+
+        response, binary_messages = self._simulator.execute(command, self)
+        return [json.dumps(response), *binary_messages]
+
+
+def _numbered(serial_number: str, index: int) -> str:
+    return serial_number if index == 0 else f'{serial_number}-{index}'
+
+
+def _token_info(tokens: list[dict[str, Any]], token: int) -> str:
+    return next((str(entry.get('info', '')) for entry in tokens if entry.get('token') == token), '')
+
+
+def _valid_token(tokens: list[dict[str, Any]], token: int) -> int:
+    if tokens and all(entry.get('token') != token for entry in tokens):
+        raise SimulatorError(-317, 'CCD error: invalid token')
+    return token
+
+
+@lru_cache(maxsize=64)
+def _lamp_profile(first_wavelength: float, nm_per_column: float, columns: int) -> npt.NDArray[np.float64]:
+    """Relative intensity of the lamp lines seen by each column, the lines are 0.5 nm wide."""
+    wavelengths = first_wavelength + np.arange(columns) * nm_per_column
+    profile = np.full(columns, 0.01)
+    for line_wavelength, intensity in _EMISSION_LINES:
+        profile += intensity * np.exp(-0.5 * ((wavelengths - line_wavelength) / 0.5) ** 2)
+    profile.setflags(write=False)
+    return profile
+
+
+_FRAME_DTYPES: dict[BinaryElementType, str] = {
+    BinaryElementType.FLOAT64: '<f8',
+    BinaryElementType.UINT32: '<u4',
+}
+
+
+def _data_frame(
+    tags: tuple[int, int, int], axis: int, element_type: BinaryElementType, values: npt.NDArray[Any]
+) -> bytes:
+    payload: bytes = np.ascontiguousarray(values, dtype=_FRAME_DTYPES[element_type]).tobytes()
+    header: bytes = BinaryFrame.HEADER.pack(
+        _BINARY_MAGIC_NUMBER, BinaryMessageType.DATA.value, element_type.value, values.size, *tags, axis
+    )
+    return header + payload
@@ -0,0 +1,78 @@
+import asyncio
+from types import TracebackType
+from typing import Any, Optional, final
+
+import websockets
+from loguru import logger
+
+from horiba_sdk.devices.icl_simulator import ICLSimulator, ICLSimulatorSession
+
+
+@final
+class ICLSimulatorServer:
+    """Serves an :class:`horiba_sdk.devices.icl_simulator.ICLSimulator` over websockets.
+
+    Any number of clients can connect at the same time, they share the state of the simulated devices like they would
+    with the ICL. Example::
+
+        async with ICLSimulatorServer() as server:
+            device_manager = DeviceManager(start_icl=False, icl_port=str(server.port))
+            await device_manager.start()
+
+    Port 0, the default, lets the operating system pick a free port, read it from :attr:`port` once started.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, simulator: Optional[ICLSimulator] = None) -> None:
+        """
+        Args:
+            host (str, optional): Host to listen on. Defaults to '127.0.0.1'
+            port (int, optional): Port to listen on, 0 for a free port. Defaults to 0
+            simulator (Optional[ICLSimulator], optional): The simulator to serve. Defaults to a new
+                :class:`ICLSimulator` with one CCD and one monochromator
+        """
+        self._host: str = host
+        self._port: int = port
+        self.simulator: ICLSimulator = simulator if simulator is not None else ICLSimulator()
+        self._server: Optional[Any] = None
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on, the one picked by the operating system when started with port 0."""
+        return self._port
+
+    @property
+    def uri(self) -> str:
+        return f'ws://{self._host}:{self._port}'
+
+    async def __aenter__(self) -> 'ICLSimulatorServer':
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        self._server = await websockets.serve(self._serve, self._host, self._port)
+        self._port = next(iter(self._server.sockets)).getsockname()[1]
+        logger.info(f'ICL simulator listening on {self.uri}')
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, websocket: Any) -> None:
+        session: ICLSimulatorSession = self.simulator.session()
+        try:
+            async for message in websocket:
+                # generating the acquisition data takes time, the other clients are served in the meantime
+                for reply in await asyncio.to_thread(session.handle, message):
+                    await websocket.send(reply)
+        except websockets.ConnectionClosed:
+            logger.debug('ICL simulator client disconnected')
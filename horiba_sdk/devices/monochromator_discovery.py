@@ -1,9 +1,10 @@
-from typing import Any, final
+from typing import Any, Optional, final
 
 from loguru import logger
 from overrides import override
 
 from horiba_sdk.communication import AbstractCommunicator, Command, Response
+from horiba_sdk.core.discovery_cache import DiscoveryCache
 from horiba_sdk.devices.abstract_device_discovery import AbstractDeviceDiscovery
 from horiba_sdk.devices.single_devices import Monochromator
 from horiba_sdk.icl_error import AbstractErrorDB
@@ -11,8 +12,14 @@ from horiba_sdk.icl_error import AbstractErrorDB
 
 @final
 class MonochromatorsDiscovery(AbstractDeviceDiscovery):
-    def __init__(self, communicator: AbstractCommunicator, error_db: AbstractErrorDB):
+    def __init__(
+        self,
+        communicator: AbstractCommunicator,
+        error_db: AbstractErrorDB,
+        discovery_cache: Optional[DiscoveryCache] = None,
+    ):
         self._communicator: AbstractCommunicator = communicator
+        self._discovery_cache: Optional[DiscoveryCache] = discovery_cache
         self._monochromators: list[Monochromator] = []
         self._error_db: AbstractErrorDB = error_db
 
@@ -28,6 +35,9 @@ class MonochromatorsDiscovery(AbstractDeviceDiscovery):
         if not self._communicator.opened():
             await self._communicator.open()
 
+        if self._discovery_cache is not None and await self._listed_devices_match(self._discovery_cache):
+            return
+
         response: Response = await self._communicator.request_with_response(Command('mono_discover', {}))
         if response.results.get('count', 0) == 0 and error_on_no_device:
             raise Exception('No Monochromators connected')
@@ -36,8 +46,22 @@ class MonochromatorsDiscovery(AbstractDeviceDiscovery):
 
         raw_device_list = response.results
         self._monochromators = self._parse_monos(raw_device_list)
+        if self._discovery_cache is not None:
+            self._discovery_cache.store_devices('mono', raw_device_list['devices'])
         logger.info(f'Found {len(self._monochromators)} Monochromator devices')
 
+    async def _listed_devices_match(self, discovery_cache: DiscoveryCache) -> bool:
+        responses: list[Response] = await self._communicator.request_with_responses(
+            [Command('mono_listCount', {}), Command('mono_list', {})]
+        )
+        devices: list[dict[str, Any]] = responses[1].results.get('devices', [])
+        if responses[0].results.get('count') != len(devices) or not discovery_cache.matches('mono', devices):
+            return False
+
+        self._monochromators = self._parse_monos(responses[1].results)
+        logger.info(f'Found {len(self._monochromators)} Monochromator devices, unchanged since the last discovery')
+        return True
+
     def _parse_monos(self, raw_device_list: dict[str, Any]) -> list[Monochromator]:
         detected_monos: list[Monochromator] = []
         for device in raw_device_list['devices']:
@@ -0,0 +1,129 @@
+import asyncio
+from collections.abc import Generator, Sequence
+from types import TracebackType
+from typing import Any, Optional, final
+
+from loguru import logger
+
+from horiba_sdk.devices.single_devices import AbstractDevice, ChargeCoupledDevice, Monochromator
+
+
+@final
+class OpenedDevices:
+    """Devices opened together by :meth:`horiba_sdk.devices.DeviceManager.open_all`.
+
+    The devices are opened concurrently, so a setup is ready in the time of its slowest device. Awaiting the object
+    opens them, using it as an async context manager also closes them concurrently on exit::
+
+        async with device_manager.open_all() as devices:
+            ccd = devices.charge_coupled_devices[0]
+            mono = devices.monochromators[0]
+
+    When a device fails to open, the devices that were opened, and those that did not open within the timeout and may
+    be partially opened, are closed again and an exception listing the failures is raised.
+
+    Attributes:
+        charge_coupled_devices (list[ChargeCoupledDevice]): The opened CCDs
+        monochromators (list[Monochromator]): The opened monochromators
+    """
+
+    def __init__(
+        self, charge_coupled_devices: list[ChargeCoupledDevice], monochromators: list[Monochromator], timeout: float
+    ) -> None:
+        self.charge_coupled_devices = charge_coupled_devices
+        self.monochromators = monochromators
+        self._timeout = timeout
+        self._opened: bool = False
+
+    def __await__(self) -> Generator[Any, None, 'OpenedDevices']:
+        return self.open().__await__()
+
+    async def __aenter__(self) -> 'OpenedDevices':
+        if not self._opened:
+            await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    def devices(self) -> list[AbstractDevice]:
+        """Returns all the devices, CCDs first."""
+        return [*self.charge_coupled_devices, *self.monochromators]
+
+    async def open(self) -> 'OpenedDevices':
+        """Opens all the devices concurrently.
+
+        Returns:
+            OpenedDevices: self, once all the devices are opened
+
+        Raises:
+            Exception: When at least one device failed to open or did not open within the timeout. The devices that
+                were opened or timed out are closed again before
+        """
+        opened, failures, timed_out = await _run_concurrently(self.devices(), 'open', self._timeout)
+        if failures:
+            # the open of a timed out device was cancelled midway, its open command may have been sent already
+            _, close_failures, _ = await _run_concurrently([*opened, *timed_out], 'close', self._timeout)
+            for device, error in close_failures:
+                logger.warning(f'Failed to close {_describe(device)} after a failed open: {error!r}')
+            raise _failure_exception('open', failures)
+        self._opened = True
+        return self
+
+    async def close(self) -> None:
+        """Closes all the devices concurrently.
+
+        Raises:
+            Exception: When at least one device failed to close or did not close within the timeout. All the other
+                devices are closed nonetheless
+        """
+        _, failures, _ = await _run_concurrently(self.devices(), 'close', self._timeout)
+        self._opened = False
+        if failures:
+            raise _failure_exception('close', failures)
+
+
+async def _run_concurrently(
+    devices: Sequence[AbstractDevice], operation: str, timeout: float
+) -> tuple[list[AbstractDevice], list[tuple[AbstractDevice, BaseException]], list[AbstractDevice]]:
+    """Runs :code:`open` or :code:`close` on all the devices concurrently, with a timeout for each device.
+
+    Returns:
+        tuple[list[AbstractDevice], list[tuple[AbstractDevice, BaseException]], list[AbstractDevice]]: The devices on
+        which the operation succeeded, the devices on which it failed with their error, and among the latter the
+        devices that timed out
+    """
+    results: list[Optional[BaseException]] = list(
+        await asyncio.gather(
+            *(asyncio.wait_for(getattr(device, operation)(), timeout) for device in devices),
+            return_exceptions=True,
+        )
+    )
+    succeeded: list[AbstractDevice] = []
+    failures: list[tuple[AbstractDevice, BaseException]] = []
+    timed_out: list[AbstractDevice] = []
+    for device, result in zip(devices, results):
+        if isinstance(result, asyncio.TimeoutError):
+            failures.append((device, Exception(f'no answer within {timeout}s')))
+            timed_out.append(device)
+        elif isinstance(result, BaseException):
+            failures.append((device, result))
+        else:
+            succeeded.append(device)
+    return succeeded, failures, timed_out
+
+
+def _failure_exception(operation: str, failures: list[tuple[AbstractDevice, BaseException]]) -> Exception:
+    details: str = ', '.join(f'{_describe(device)}: {error}' for device, error in failures)
+    exception = Exception(f'Failed to {operation} {len(failures)} device(s): {details}')
+    exception.__cause__ = failures[0][1]
+    return exception
+
+
+def _describe(device: AbstractDevice) -> str:
+    return f'{type(device).__name__} #{device.id()}'
@@ -1,7 +1,14 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from loguru import logger
 
 from horiba_sdk.communication import AbstractCommunicator, Command, Response
+from horiba_sdk.core.command_batch import BatchedResponse, batched_commands, command_batch
+from horiba_sdk.core.polling_schedule import IdleWaitReport, PollingSchedule
 from horiba_sdk.icl_error import AbstractError, AbstractErrorDB
 
 
@@ -51,11 +58,44 @@ class AbstractDevice(ABC):
         """
         pass
 
+    @asynccontextmanager
+    async def batch(self, timeout: int = 5) -> AsyncIterator[None]:
+        """Groups the commands issued inside the context and sends them back-to-back when the context exits.
+
+        Use it to apply a configuration in roughly one round-trip instead of one round-trip per setting::
+
+            async with ccd.batch():
+                await ccd.set_timer_resolution(TimerResolution._1000_MICROSECONDS)
+                await ccd.set_exposure_time(100)
+                await ccd.set_gain(0)
+
+        Only the commands issued by the task that opened the batch, or by tasks it creates inside the batch, are
+        queued. Other coroutines using the device at the same time are not affected.
+
+        .. warning:: The methods called inside the context return before their command is sent. Only use methods
+                     that do not return a value from the device (e.g. setters), getters raise an exception.
+
+        Args:
+            timeout (int, optional): Timeout [s] for waiting for all the responses. Defaults to 5
+
+        Raises:
+            Exception: When a batch is already in progress, when an error occurred on the device side for any of
+            the batched commands, or when a getter is called inside the batch. The batch is closed in any case
+        """
+        with command_batch(id(self)) as commands:
+            yield
+
+        if commands:
+            await self._execute_commands(commands, timeout)
+
     async def _execute_command(self, command_name: str, parameters: dict[Any, Any], timeout: int = 5) -> Response:
         """
         Creates a command from the command name, and it's parameters
         Executes a command and handles the response.
 
+        When called inside of :meth:`batch`, the command is only queued and a
+        :class:`horiba_sdk.core.command_batch.BatchedResponse` is returned, whose results cannot be read.
+
         Args:
             command_name (str): The name of the command to execute.
             parameters (dict): The parameters for the command.
@@ -66,13 +106,93 @@ class AbstractDevice(ABC):
         Raises:
             Exception: When an error occurred on the device side.
         """
-        response: Response = await self._communicator.request_with_response(
-            Command(command_name, parameters), timeout=timeout
-        )
+        command: Command = Command(command_name, parameters)
+        queued_commands: Optional[list[Command]] = batched_commands(id(self))
+        if queued_commands is not None:
+            queued_commands.append(command)
+            return BatchedResponse(command)
+
+        response: Response = await self._communicator.request_with_response(command, timeout=timeout)
         if response.errors:
             self._handle_errors(response.errors)
         return response
 
+    async def _execute_commands(self, commands: list[Command], timeout: int = 5) -> list[Response]:
+        """
+        Sends the commands back-to-back and handles the responses.
+
+        The errors of every response are logged, the first failing command raises.
+
+        Args:
+            commands (list[Command]): The commands to execute, in order.
+            timeout (int, optional): Timeout [s] for waiting for all the responses.
+
+        Returns:
+            list[Response]: The responses from the device, in the same order as the commands.
+
+        Raises:
+            Exception: When an error occurred on the device side for any of the commands.
+        """
+        responses: list[Response] = await self._communicator.request_with_responses(commands, timeout=timeout)
+        failed_responses: list[Response] = [response for response in responses if response.errors]
+        for response in failed_responses:
+            for error in response.errors:
+                self._error_db.error_from(error).log()
+
+        if failed_responses:
+            first_failure: Response = failed_responses[0]
+            icl_error: AbstractError = self._error_db.error_from(first_failure.errors[0])
+            raise Exception(f'Error from the ICL for {first_failure.command}: {icl_error.message()}')
+
+        return responses
+
+    async def _wait_until_idle(
+        self,
+        is_busy: Callable[[], Awaitable[bool]],
+        timeout: float,
+        expected_duration_s: float = 0,
+        schedule: Optional[PollingSchedule] = None,
+    ) -> IdleWaitReport:
+        """
+        Waits until is_busy returns False, polling according to the schedule once the expected duration elapsed.
+
+        Args:
+            is_busy (Callable[[], Awaitable[bool]]): Returns if the device is busy
+            timeout (float): Timeout [s] for the whole wait
+            expected_duration_s (float, optional): Expected duration [s] of the operation, before the first poll
+            schedule (Optional[PollingSchedule], optional): Intervals between the polls. Defaults to PollingSchedule()
+
+        Returns:
+            IdleWaitReport: Number of polls, elapsed time and detection latency
+
+        Raises:
+            Exception: When the device is still busy after the timeout
+        """
+        loop = asyncio.get_running_loop()
+        start: float = loop.time()
+        deadline: float = start + timeout
+        polling_schedule: PollingSchedule = schedule if schedule is not None else PollingSchedule()
+
+        await asyncio.sleep(min(max(expected_duration_s, 0), timeout))
+        polls: int = 0
+        last_busy_poll: float = start
+        for interval_s in polling_schedule.intervals():
+            poll_time: float = loop.time()
+            polls += 1
+            if not await is_busy():
+                now: float = loop.time()
+                report: IdleWaitReport = IdleWaitReport(polls, now - start, now - last_busy_poll)
+                logger.debug(f'{type(self).__name__} #{self._id} idle: {report}')
+                return report
+
+            last_busy_poll = poll_time
+            remaining_s: float = deadline - loop.time()
+            if remaining_s <= 0:
+                raise Exception(f'{type(self).__name__} #{self._id} still busy after {timeout}s ({polls} polls)')
+            await asyncio.sleep(min(interval_s, remaining_s))
+
+        raise AssertionError('unreachable, the polling schedule is infinite')
+
     def _handle_errors(self, errors: list[str]) -> None:
         """
         Handles errors, logs them, and may take corrective actions.
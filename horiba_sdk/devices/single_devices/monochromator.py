@@ -6,6 +6,7 @@ from loguru import logger
 from overrides import override
 
 from horiba_sdk.communication import AbstractCommunicator, Response
+from horiba_sdk.core.polling_schedule import IdleWaitReport, PollingSchedule
 from horiba_sdk.icl_error import AbstractErrorDB
 
 from .abstract_device import AbstractDevice
@@ -145,6 +146,29 @@ class Monochromator(AbstractDevice):
         response: Response = await super()._execute_command('mono_isBusy', {'index': self._id})
         return bool(response.results['busy'])
 
+    async def wait_until_idle(
+        self, timeout: float = 180, expected_duration_s: float = 0, schedule: Optional[PollingSchedule] = None
+    ) -> IdleWaitReport:
+        """Waits until the monochromator finished its current operation, e.g. a move or the homing.
+
+        The busy state is first requested once the expected duration elapsed, then with growing intervals, see
+        :class:`horiba_sdk.core.polling_schedule.PollingSchedule`. Short moves are therefore detected within a few
+        milliseconds.
+
+        Args:
+            timeout (float, optional): Timeout [s]. Defaults to 180
+            expected_duration_s (float, optional): Expected duration of the operation in seconds, e.g. estimated from
+                the distance of the move. Defaults to 0
+            schedule (Optional[PollingSchedule], optional): Intervals between the polls. Defaults to PollingSchedule()
+
+        Returns:
+            IdleWaitReport: Number of polls, elapsed time and detection latency
+
+        Raises:
+            Exception: When the monochromator is still busy after the timeout or an error occurred on the device side
+        """
+        return await self._wait_until_idle(self.is_busy, timeout, expected_duration_s, schedule)
+
     async def home(self) -> None:
         """Starts the monochromator initialization process called "homing".
 
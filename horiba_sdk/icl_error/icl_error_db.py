@@ -1,6 +1,7 @@
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import final
+from typing import Any, Optional, final
 
 from loguru import logger
 from overrides import override
@@ -36,14 +37,29 @@ class ICLErrorDB(AbstractErrorDB):
 
     A database exists in this module under :code:`horiba_sdk/icl_error/error_list.json`
 
+    The database is loaded when the first error is looked up, so that creating a device manager does not pay for
+    parsing it. It is then indexed by error number, the errors are built once and looking up an error string does
+    not depend on the size of the database.
     """
 
     def __init__(self, json_db_path: Path) -> None:
         if not json_db_path.is_file():
             raise FileNotFoundError(f'ICL Json DB does not exist at {json_db_path}')
 
-        with open(json_db_path) as file:
-            self._icl_error_db = json.load(file)
+        self._json_db_path: Path = json_db_path
+        self._loaded_errors_by_code: Optional[dict[int, ICLError]] = None
+
+    @property
+    def _errors_by_code(self) -> dict[int, ICLError]:
+        if self._loaded_errors_by_code is None:
+            with open(self._json_db_path) as file:
+                icl_error_db: dict[str, Any] = json.load(file)
+
+            errors_by_code: dict[int, ICLError] = {}
+            for error in icl_error_db.get('errors', []):
+                errors_by_code.setdefault(error.get('number'), self._error_from_entry(error))
+            self._loaded_errors_by_code = errors_by_code
+        return self._loaded_errors_by_code
 
     @override
     def error_from(self, string: str) -> AbstractError:
@@ -60,22 +76,28 @@ class ICLErrorDB(AbstractErrorDB):
             Exception: when the error string is not formatted as explained above or when no error is found with the
             given error code.
         """
-        parsed_error = string.split(';')
-
-        if len(parsed_error) != 3:
-            raise Exception(f'Invalid length of ICL error string, was {len(parsed_error)} should be 3')
-
-        error_code: int = int(parsed_error[1])
-        found_error = next(
-            (error for error in self._icl_error_db.get('errors', []) if error.get('number') == error_code), None
-        )
+        error_code, text = _parse_error_string(string)
+        found_error = self._errors_by_code.get(error_code)
 
         if found_error is None:
             logger.error(f'Error with number #{error_code} not found in error db')
-            text: str = parsed_error[2]
             return ICLError(error_code, f'Unknown error: {text}', Severity.CRITICAL)
 
-        level: str = found_error.get('level')
+        return found_error
+
+    @staticmethod
+    def _error_from_entry(error: dict[str, Any]) -> ICLError:
+        level: str = error.get('level', '')
         severity: Severity = StringAsSeverity(level).to_severity()
-        message: str = found_error.get('text')
-        return ICLError(error_code, message, severity)
+        message: str = error.get('text', '')
+        return ICLError(error.get('number', 0), message, severity)
+
+
+@lru_cache(maxsize=256)
+def _parse_error_string(string: str) -> tuple[int, str]:
+    parsed_error = string.split(';')
+
+    if len(parsed_error) != 3:
+        raise Exception(f'Invalid length of ICL error string, was {len(parsed_error)} should be 3')
+
+    return int(parsed_error[1]), parsed_error[2]
@@ -39,6 +39,20 @@ class AbstractCommunicator(ABC):
         """
         pass
 
+    @abstractmethod
+    def request_with_responses(self, commands: list[Command], response_timeout_s: float = 5) -> list[Response]:
+        """
+        Abstract method to send several commands back-to-back and fetch their responses.
+
+        Args:
+            commands (list[Command]): Commands for which responses are desired, sent in the given order
+            response_timeout_s (float, optional): Timeout in seconds for all responses. Defaults to 5.
+
+        Returns:
+            list[Response]: The responses, in the same order as the commands.
+        """
+        pass
+
     @abstractmethod
     def close(self) -> None:
         """
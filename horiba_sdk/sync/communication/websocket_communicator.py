@@ -1,6 +1,6 @@
 import time
-from queue import Queue
-from threading import Thread
+from collections.abc import Iterable
+from threading import Condition, Thread
 from types import TracebackType
 from typing import Any, Callable, Optional, final
 
@@ -10,26 +10,69 @@ from overrides import override
 from websockets.sync.client import ClientConnection
 
 from horiba_sdk.communication.communication_exception import CommunicationException
+from horiba_sdk.communication.message_log_policy import MessageLogPolicy
+from horiba_sdk.communication.message_queue import (
+    MessageQueue,
+    MessageQueuePolicy,
+    MessageQueueStatistics,
+    QueueOverflowPolicy,
+)
 from horiba_sdk.communication.messages import Command, JSONResponse, Response
 from horiba_sdk.sync.communication.abstract_communicator import AbstractCommunicator
 
+# bound of the ids of the timed out commands whose late reply is still awaited, the oldest ids are forgotten first
+_MAX_EXPIRED_COMMAND_IDS: int = 1000
+
 
 @final
 class WebsocketCommunicator(AbstractCommunicator):
     """
     The WebsocketCommunicator implements the `horiba_sdk.sync.communication.AbstractCommunicator` via websockets.
     A background thread listens continuously for incoming binary data.
+
+    The logging of the exchanged messages is controlled by the :class:`horiba_sdk.communication.MessageLogPolicy`
+    given at construction, available as :attr:`log_policy`.
+
+    The received messages are bounded by the :class:`horiba_sdk.communication.MessageQueuePolicy` given at
+    construction. By default, the JSON responses waiting to be fetched are bounded to 1000 and the oldest is dropped
+    on overflow, the binary messages are bounded to 1000 and the listening thread waits for the binary message
+    callback on overflow. See :meth:`message_queue_statistics` for the depth and the drop counters. Responses
+    arriving after their request timed out are discarded.
+
+    With the :code:`RAISE` overflow policy, only the message arriving while its queue is full is rejected, the
+    listening thread keeps running.
+
+    .. warning:: With the :code:`BLOCK` overflow policy, a full queue stops the listening thread until the queue is
+                 consumed, including the reception of the responses to pending requests.
     """
 
-    def __init__(self, uri: str = 'ws://127.0.0.1:25010') -> None:
+    def __init__(
+        self,
+        uri: str = 'ws://127.0.0.1:25010',
+        log_policy: Optional[MessageLogPolicy] = None,
+        json_queue_policy: Optional[MessageQueuePolicy] = None,
+        binary_queue_policy: Optional[MessageQueuePolicy] = None,
+    ) -> None:
         self.uri: str = uri
+        self.log_policy: MessageLogPolicy = log_policy if log_policy is not None else MessageLogPolicy()
         self.websocket: Optional[ClientConnection] = None
         self.running_listen_thread: bool = False
         self.listen_thread: Optional[Thread] = None
         self.running_binary_message_handling_thread: bool = False
         self.binary_message_handling_thread: Optional[Thread] = None
         self.json_message_dict: dict[int, JSONResponse] = {}
-        self.binary_message_queue: Queue[bytes] = Queue()
+        self.json_queue_policy: MessageQueuePolicy = (
+            json_queue_policy
+            if json_queue_policy is not None
+            else MessageQueuePolicy(overflow=QueueOverflowPolicy.DROP_OLDEST)
+        )
+        self._json_message_dict_condition: Condition = Condition()
+        self._json_message_dict_max_depth: int = 0
+        self._json_message_dict_dropped: int = 0
+        self._expired_command_ids: dict[int, None] = {}
+        self.binary_message_queue: MessageQueue[Optional[bytes]] = MessageQueue(
+            binary_queue_policy if binary_queue_policy is not None else MessageQueuePolicy()
+        )
         self.binary_message_callback: Optional[Callable[[bytes], Any]] = None
         self.icl_info: dict[str, Any] = {}
 
@@ -84,8 +127,9 @@ class WebsocketCommunicator(AbstractCommunicator):
 
         try:
             # mypy cannot infer the check from self.opened() done above
-            logger.debug(f'Sending JSON command: {command.json()}')
-            self.websocket.send(command.json())  # type: ignore
+            message: str = command.json()
+            self.log_policy.log('Sending JSON command', message)
+            self.websocket.send(message)  # type: ignore
         except websockets.exceptions.ConnectionClosed as e:
             raise CommunicationException(None, 'Trying to send data while websocket is closed') from e
 
@@ -102,6 +146,9 @@ class WebsocketCommunicator(AbstractCommunicator):
     def response(self, command_id: int, timeout_s: float = 5.0) -> Response:
         """Fetches the response belonging to the command_id.
 
+        Waits on a condition variable notified by the listening thread, the response is returned as soon as it is
+        received.
+
         Args:
             command_id (int): The command id of the command.
             timeout_s (float): The timeout in seconds.
@@ -112,28 +159,38 @@ class WebsocketCommunicator(AbstractCommunicator):
         Raises:
             CommunicationException: When the connection terminated with an error
         """
-        waited_time_in_s: float = 0.0
-        sleep_time_in_s: float = 0.1
-        while waited_time_in_s < timeout_s and (
-            not self.json_message_dict
-            or len(self.json_message_dict) == 0
-            or self.json_message_dict.get(command_id) is None
-        ):
-            time.sleep(sleep_time_in_s)
-            waited_time_in_s += sleep_time_in_s
-
-        if not self.json_message_dict or len(self.json_message_dict) == 0:
-            raise CommunicationException(None, 'no message to be received.')
-
-        if self.json_message_dict.get(command_id) is None:
-            raise CommunicationException(None, f'no response with id {command_id}')
-
-        logger.debug(f'#{len(self.json_message_dict)} messages, taking the one with id:{command_id}')
-        response: JSONResponse = self.json_message_dict[command_id]
-        del self.json_message_dict[command_id]
+        with self._json_message_dict_condition:
+            received: bool = self._json_message_dict_condition.wait_for(
+                lambda: command_id in self.json_message_dict, timeout=timeout_s
+            )
+            if not received:
+                self._expire_command_ids([command_id])
+                if not self.json_message_dict:
+                    raise CommunicationException(None, 'no message to be received.')
+                raise CommunicationException(None, f'no response with id {command_id}')
+
+            logger.debug(f'#{len(self.json_message_dict)} messages, taking the one with id:{command_id}')
+            response: JSONResponse = self.json_message_dict.pop(command_id)
+            self._json_message_dict_condition.notify_all()
         logger.debug('retrieved message in dict')
         return response
 
+    def message_queue_statistics(self) -> dict[str, MessageQueueStatistics]:
+        """Returns the depth and the drop counters of the received messages.
+
+        Returns:
+            dict[str, MessageQueueStatistics]: The statistics of :attr:`json_message_dict` and
+            :attr:`binary_message_queue`, by name
+        """
+        with self._json_message_dict_condition:
+            json_statistics: MessageQueueStatistics = MessageQueueStatistics(
+                len(self.json_message_dict), self._json_message_dict_max_depth, self._json_message_dict_dropped
+            )
+        return {
+            'json_message_dict': json_statistics,
+            'binary_message_queue': self.binary_message_queue.statistics(),
+        }
+
     @override
     def close(self) -> None:
         """
@@ -148,23 +205,34 @@ class WebsocketCommunicator(AbstractCommunicator):
             logger.debug('Waiting websocket close...')
             self.websocket.close()
 
-        if self.binary_message_handling_thread:
-            logger.debug('Canceling binary listening thread...')
-            self.running_binary_message_handling_thread = False
-            self.binary_message_handling_thread.join()
-            self.binary_message_handling_thread = None
-
         if self.listen_thread:
             logger.debug('Canceling listening thread...')
             self.running_listen_thread = False
             self.listen_thread.join()
             self.listen_thread = None
 
+        if self.binary_message_handling_thread:
+            logger.debug('Canceling binary listening thread...')
+            self.running_binary_message_handling_thread = False
+            # the sentinel must not wait behind the pending messages, the thread stops after the message it handles
+            discarded: int = self.binary_message_queue.clear()
+            if discarded:
+                logger.debug(f'Discarded {discarded} unhandled binary messages')
+            self.binary_message_queue.put_nowait(None)
+            self.binary_message_handling_thread.join()
+            # the sentinel is left behind when the thread stopped before taking it
+            self.binary_message_queue.clear()
+            self.binary_message_handling_thread = None
+
         self.websocket = None
         logger.debug('Websocket connection closed')
 
     def register_binary_message_callback(self, callback: Callable[[bytes], Any]) -> None:
-        """Registers a callback to be called with every incoming binary message."""
+        """Registers a callback to be called with every incoming binary message.
+
+        The callback is called from a dedicated thread, in the order in which the messages were received. The thread
+        sleeps on :attr:`binary_message_queue` and wakes up as soon as a binary message arrives.
+        """
         if self.binary_message_callback:
             raise CommunicationException(None, 'Binary message callback already registered')
 
@@ -182,12 +250,15 @@ class WebsocketCommunicator(AbstractCommunicator):
         while self.running_listen_thread:
             try:
                 for message in self.websocket:
-                    logger.debug(f'Received message: {message!r}')
+                    self.log_policy.log('Received message', message)
                     if isinstance(message, str):
-                        response: JSONResponse = JSONResponse(message)
-                        self.json_message_dict[response.id] = response
+                        self._store_json_response(JSONResponse(message))
                     elif isinstance(message, bytes) and self.binary_message_callback:
-                        self.binary_message_queue.put(message)
+                        try:
+                            self.binary_message_queue.put_message(message)
+                        except CommunicationException as e:
+                            # only this message is rejected, it is counted in the queue statistics
+                            logger.warning(f'Rejected binary message: {e.message}')
                     else:
                         raise CommunicationException(None, f'Unknown type of message {type(message)}')
             except websockets.ConnectionClosedOK:
@@ -197,18 +268,56 @@ class WebsocketCommunicator(AbstractCommunicator):
             except Exception as e:
                 raise CommunicationException(None, 'failure to process binary data') from e
 
+    def _expire_command_ids(self, command_ids: Iterable[int]) -> None:
+        # the ids are kept in insertion order, so that the oldest are forgotten when the ICL never replies
+        for command_id in command_ids:
+            self._expired_command_ids[command_id] = None
+        while len(self._expired_command_ids) > _MAX_EXPIRED_COMMAND_IDS:
+            del self._expired_command_ids[next(iter(self._expired_command_ids))]
+
+    def _store_json_response(self, response: JSONResponse) -> None:
+        with self._json_message_dict_condition:
+            if response.id in self._expired_command_ids:
+                del self._expired_command_ids[response.id]
+                logger.warning(f'Discarding late response to command #{response.id} ({response.command})')
+                return
+
+            max_size: int = self.json_queue_policy.max_size
+            while 0 < max_size <= len(self.json_message_dict):
+                if self.json_queue_policy.overflow == QueueOverflowPolicy.RAISE:
+                    # the listening thread must survive, only this response is rejected
+                    self._json_message_dict_dropped += 1
+                    logger.warning(
+                        f'Response queue full ({max_size} responses), rejected response #{response.id} '
+                        f'({response.command})'
+                    )
+                    return
+                if self.json_queue_policy.overflow == QueueOverflowPolicy.DROP_OLDEST:
+                    oldest_command_id: int = next(iter(self.json_message_dict))
+                    del self.json_message_dict[oldest_command_id]
+                    self._json_message_dict_dropped += 1
+                    logger.warning(f'Response queue full ({max_size} responses), dropped response #{oldest_command_id}')
+                else:
+                    self._json_message_dict_condition.wait(0.1)
+                    if not self.running_listen_thread:
+                        return
+
+            self.json_message_dict[response.id] = response
+            self._json_message_dict_condition.notify_all()
+            self._json_message_dict_max_depth = max(self._json_message_dict_max_depth, len(self.json_message_dict))
+
     def _run_binary_message_callback(self) -> None:
         if not self.binary_message_callback:
             raise CommunicationException(None, 'No binary message callback registered')
 
         while self.running_binary_message_handling_thread:
-            while self.binary_message_queue.empty():
-                time.sleep(0.5)
-                if not self.running_binary_message_handling_thread:
-                    return
-
-            binary_message = self.binary_message_queue.get()
-            self.binary_message_callback(binary_message)
+            binary_message: Optional[bytes] = self.binary_message_queue.get()
+            if binary_message is None:
+                return
+            try:
+                self.binary_message_callback(binary_message)
+            except Exception as e:
+                logger.error(f'Binary message callback failed: {e!r}')
 
     @override
     def request_with_response(self, command: Command, response_timeout_s: float = 5) -> Response:
@@ -230,3 +339,42 @@ class WebsocketCommunicator(AbstractCommunicator):
             raise Exception('got wrong response id')
 
         return response
+
+    @override
+    def request_with_responses(self, commands: list[Command], response_timeout_s: float = 5) -> list[Response]:
+        """
+        Sends the commands back-to-back without waiting for the individual replies and collects the responses.
+
+        Args:
+            commands (list[Command]): Commands for which responses are desired, sent in the given order
+            response_timeout_s (float, optional): Timeout in seconds for all responses. Defaults to 5.
+
+        Returns:
+            list[Response]: The responses, in the same order as the commands.
+
+        Raises:
+            CommunicationException: When a response did not arrive in time. The replies to the following commands are
+                discarded, whether they already arrived or arrive later
+        """
+        for command in commands:
+            self.send(command)
+
+        deadline: float = time.monotonic() + response_timeout_s
+        responses: list[Response] = []
+        try:
+            for command in commands:
+                remaining_timeout_s: float = max(deadline - time.monotonic(), 0.0)
+                responses.append(self.response(command.id, remaining_timeout_s))
+        except CommunicationException:
+            self._discard_responses(commands[len(responses) + 1 :])
+            raise
+
+        return responses
+
+    def _discard_responses(self, commands: list[Command]) -> None:
+        with self._json_message_dict_condition:
+            unanswered_command_ids: list[int] = [
+                command.id for command in commands if self.json_message_dict.pop(command.id, None) is None
+            ]
+            self._expire_command_ids(unanswered_command_ids)
+            self._json_message_dict_condition.notify_all()
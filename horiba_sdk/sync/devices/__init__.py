@@ -1,9 +1,17 @@
-from .abstract_device_discovery import AbstractDeviceDiscovery
-from .abstract_device_manager import AbstractDeviceManager
-from .device_discovery import DeviceDiscovery
-from .device_manager import DeviceManager
-from .fake_device_manager import FakeDeviceManager
-from .fake_icl_server import FakeICLServer
+from typing import TYPE_CHECKING
+
+from horiba_sdk.core.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .abstract_device_discovery import AbstractDeviceDiscovery
+    from .abstract_device_manager import AbstractDeviceManager
+    from .device_discovery import DeviceDiscovery
+    from .device_manager import DeviceManager
+    from .fake_device_manager import FakeDeviceManager
+    from .fake_icl_server import FakeICLServer
+    from .icl_simulator_server import ICLSimulatorServer
+    from .opened_devices import OpenedDevices
+    from .range_scan import RangeScan
 
 __all__ = [
     'AbstractDeviceDiscovery',
@@ -11,5 +19,24 @@ __all__ = [
     'DeviceDiscovery',
     'DeviceManager',
     'FakeDeviceManager',
+    'ICLSimulatorServer',
+    'OpenedDevices',
+    'RangeScan',
     'FakeICLServer',
 ]
+
+# the device managers pull in the communication, the devices and their dependencies, they are imported on first use
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'AbstractDeviceDiscovery': '.abstract_device_discovery',
+        'AbstractDeviceManager': '.abstract_device_manager',
+        'DeviceDiscovery': '.device_discovery',
+        'DeviceManager': '.device_manager',
+        'FakeDeviceManager': '.fake_device_manager',
+        'FakeICLServer': '.fake_icl_server',
+        'ICLSimulatorServer': '.icl_simulator_server',
+        'OpenedDevices': '.opened_devices',
+        'RangeScan': '.range_scan',
+    },
+)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from horiba_sdk.sync.communication import AbstractCommunicator
+from horiba_sdk.sync.devices.opened_devices import OpenedDevices
 from horiba_sdk.sync.devices.single_devices import ChargeCoupledDevice, Monochromator
 
 
@@ -66,3 +67,35 @@ class AbstractDeviceManager(ABC):
             List[ChargeCoupledDevice]: The detected CCDS.
         """
         pass
+
+    def open_all(self, timeout_in_s: float = 30) -> OpenedDevices:
+        """
+        Opens all the discovered devices concurrently, should be called after :meth:`discover_devices`.
+
+        Used as a context manager, the devices are also closed on exit::
+
+            with device_manager.open_all() as devices:
+                ccd = devices.charge_coupled_devices[0]
+
+        Args:
+            timeout_in_s (float): Timeout in seconds for opening each device.
+
+        Returns:
+            OpenedDevices: The opened devices
+
+        Raises:
+            Exception: When at least one device failed to open, the devices that were opened are closed again
+        """
+        return OpenedDevices(self.charge_coupled_devices, self.monochromators, timeout_in_s).open()
+
+    def close_all(self, timeout_in_s: float = 30) -> None:
+        """
+        Closes all the discovered devices concurrently.
+
+        Args:
+            timeout_in_s (float): Timeout in seconds for closing each device.
+
+        Raises:
+            Exception: When at least one device failed to close, all the other devices are closed nonetheless
+        """
+        OpenedDevices(self.charge_coupled_devices, self.monochromators, timeout_in_s).close()
@@ -1,54 +1,113 @@
-from typing import final
+from typing import Any, Optional, final
 
 from loguru import logger
 from overrides import override
 
 from horiba_sdk.communication import Command, Response
+from horiba_sdk.core.discovery_cache import DiscoveryCache
 from horiba_sdk.icl_error import AbstractErrorDB
 from horiba_sdk.sync.communication import AbstractCommunicator
 from horiba_sdk.sync.devices.abstract_device_discovery import AbstractDeviceDiscovery
 from horiba_sdk.sync.devices.single_devices import ChargeCoupledDevice, Monochromator
 
+# timeout given to each discovery command, like when they were sent one after the other
+_TIMEOUT_PER_COMMAND_IN_S: float = 5
+
 
 @final
 class DeviceDiscovery(AbstractDeviceDiscovery):
-    def __init__(self, communicator: AbstractCommunicator, error_db: AbstractErrorDB):
+    def __init__(
+        self,
+        communicator: AbstractCommunicator,
+        error_db: AbstractErrorDB,
+        discovery_cache: Optional[DiscoveryCache] = None,
+    ):
         self._communicator: AbstractCommunicator = communicator
         self._charge_coupled_devices: list[ChargeCoupledDevice] = []
         self._monochromators: list[Monochromator] = []
         self._error_db: AbstractErrorDB = error_db
+        self._discovery_cache: Optional[DiscoveryCache] = discovery_cache
         self._discovered_devices: bool = False
 
     @override
     def execute(self, error_on_no_device: bool = False) -> None:
         """
         Discovers the connected devices and saves them internally.
+
+        The discover commands of all device families are sent back-to-back, and so are the list commands, which saves
+        the round-trips between them. Each command keeps its own timeout, the responses are awaited for the sum of
+        them. With a discovery cache, the device families that the ICL still lists as in the last full discovery are
+        not enumerated again, see :class:`horiba_sdk.core.discovery_cache.DiscoveryCache`.
         """
         if not self._communicator.opened():
             self._communicator.open()
 
-        # Define the commands and device types in a list of tuples for iteration
-        commands_and_types = [('ccd_discover', 'ccd_list', 'CCD'), ('mono_discover', 'mono_list', 'Monochromator')]
-
-        for discover_command, list_command, device_type in commands_and_types:
-            response: Response = self._communicator.request_with_response(Command(discover_command, {}))
-            if response.results.get('count', 0) == 0 and error_on_no_device:
-                raise Exception(f'No {device_type} connected')
-            response = self._communicator.request_with_response(Command(list_command, {}))
-
-            for device in response.results['devices']:
-                if device_type == 'CCD':
-                    ccd = ChargeCoupledDevice(device['index'], self._communicator, self._error_db)
-                    logger.info(f'Detected CCD: {device["deviceType"]}')
-                    self._charge_coupled_devices.append(ccd)
-                elif device_type == 'Monochromator':
-                    mono = Monochromator(device['index'], self._communicator, self._error_db)
-                    logger.info(f'Detected Monochromator: {device["deviceType"]}')
-                    self._monochromators.append(mono)
+        # Define the command prefixes and device types in a list of tuples for iteration
+        prefixes_and_types = [('ccd', 'CCD'), ('mono', 'Monochromator')]
+
+        listed_devices: dict[str, list[dict[str, Any]]] = {}
+        if self._discovery_cache is not None:
+            listed_devices = self._listed_devices_matching_cache(
+                self._discovery_cache, [prefix for prefix, _ in prefixes_and_types]
+            )
+        to_discover = [
+            (prefix, device_type) for prefix, device_type in prefixes_and_types if prefix not in listed_devices
+        ]
+
+        if to_discover:
+            discover_responses: list[Response] = self._request_with_responses(
+                [Command(f'{prefix}_discover', {}) for prefix, _ in to_discover]
+            )
+            for response, (_, device_type) in zip(discover_responses, to_discover):
+                if response.results.get('count', 0) == 0 and error_on_no_device:
+                    raise Exception(f'No {device_type} connected')
+
+            list_responses: list[Response] = self._request_with_responses(
+                [Command(f'{prefix}_list', {}) for prefix, _ in to_discover]
+            )
+            for response, (prefix, _) in zip(list_responses, to_discover):
+                listed_devices[prefix] = response.results['devices']
+                if self._discovery_cache is not None:
+                    self._discovery_cache.store_devices(prefix, listed_devices[prefix])
+
+        for device in listed_devices['ccd']:
+            ccd = ChargeCoupledDevice(
+                device['index'],
+                self._communicator,
+                self._error_db,
+                serial_number=device.get('serialNumber'),
+                discovery_cache=self._discovery_cache,
+            )
+            logger.info(f'Detected CCD: {device["deviceType"]}')
+            self._charge_coupled_devices.append(ccd)
+        for device in listed_devices['mono']:
+            mono = Monochromator(device['index'], self._communicator, self._error_db)
+            logger.info(f'Detected Monochromator: {device["deviceType"]}')
+            self._monochromators.append(mono)
 
         logger.info(f'Found {len(self._monochromators)} Monochromator devices')
         logger.info(f'Found {len(self._charge_coupled_devices)} CCD devices')
 
+    def _listed_devices_matching_cache(
+        self, discovery_cache: DiscoveryCache, prefixes: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        commands: list[Command] = []
+        for prefix in prefixes:
+            commands += [Command(f'{prefix}_listCount', {}), Command(f'{prefix}_list', {})]
+        responses: list[Response] = self._request_with_responses(commands)
+
+        matching_devices: dict[str, list[dict[str, Any]]] = {}
+        for position, prefix in enumerate(prefixes):
+            count_response, list_response = responses[2 * position], responses[2 * position + 1]
+            devices: list[dict[str, Any]] = list_response.results.get('devices', [])
+            if count_response.results.get('count') == len(devices) and discovery_cache.matches(prefix, devices):
+                logger.debug(f'{prefix} devices unchanged since the last discovery')
+                matching_devices[prefix] = devices
+        return matching_devices
+
+    def _request_with_responses(self, commands: list[Command]) -> list[Response]:
+        return self._communicator.request_with_responses(commands, _TIMEOUT_PER_COMMAND_IN_S * len(commands))
+
     @override
     def charge_coupled_devices(self) -> list[ChargeCoupledDevice]:
         return self._charge_coupled_devices
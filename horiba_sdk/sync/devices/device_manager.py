@@ -6,15 +6,17 @@ This Device Manager uses threads instead of asyncio
 import importlib.resources
 import platform
 import subprocess
+import time
 from pathlib import Path
 from subprocess import Popen
 from typing import Optional, final
 
-import psutil
 from loguru import logger
 from overrides import override
 
-from horiba_sdk.communication import Command, CommunicationException, Response
+from horiba_sdk.communication import BinaryFrame, BinaryMessageType, Command, CommunicationException, Response
+from horiba_sdk.core.discovery_cache import DiscoveryCache
+from horiba_sdk.core.icl_process import ICL_EXECUTABLE, ICLProcessMonitor
 from horiba_sdk.icl_error import AbstractError, AbstractErrorDB, ICLErrorDB
 from horiba_sdk.sync.communication import AbstractCommunicator, WebsocketCommunicator
 from horiba_sdk.sync.devices import AbstractDeviceManager, DeviceDiscovery
@@ -33,6 +35,8 @@ class DeviceManager(AbstractDeviceManager):
         icl_ip: str = '127.0.0.1',
         icl_port: str = '25010',
         enable_binary_messages: bool = True,
+        discovery_cache: Optional[DiscoveryCache] = None,
+        icl_start_timeout_in_s: float = 30,
     ):
         """
         Initializes the DeviceManager with the specified communicator class.
@@ -42,6 +46,11 @@ class DeviceManager(AbstractDeviceManager):
             icl_ip (str) = '127.0.0.1': websocket IP
             icl_port (str) = '25010': websocket port
             enable_binary_messages (bool) = True: If True, binary messages are enabled.
+            discovery_cache (Optional[DiscoveryCache]) = None: If set, the device lists and the CCD configurations are
+                cached on disk and the enumeration of the devices is skipped when the ICL still lists the same devices,
+                see :class:`horiba_sdk.core.discovery_cache.DiscoveryCache`.
+            icl_start_timeout_in_s (float) = 30: Time in seconds to wait for a started ICL to accept connections, and
+                for the ICL to stop after its shutdown.
         """
         super().__init__()
         self._start_icl = start_icl
@@ -49,8 +58,12 @@ class DeviceManager(AbstractDeviceManager):
         self._icl_websocket_ip: str = icl_ip
         self._icl_websocket_port: str = icl_port
         self._icl_process: Optional[Popen[bytes]] = None
+        self._icl_process_monitor: ICLProcessMonitor = ICLProcessMonitor(icl_ip, icl_port)
+        self._icl_start_timeout_in_s: float = icl_start_timeout_in_s
         self._binary_messages: bool = enable_binary_messages
+        self._discovery_cache: Optional[DiscoveryCache] = discovery_cache
         self._charge_coupled_devices: list[ChargeCoupledDevice] = []
+        self._charge_coupled_devices_by_index: dict[int, ChargeCoupledDevice] = {}
         self._monochromators: list[Monochromator] = []
 
         error_list_path: Path = Path(str(importlib.resources.files('horiba_sdk.icl_error') / 'error_list.json'))
@@ -83,22 +96,36 @@ class DeviceManager(AbstractDeviceManager):
 
     def start_icl(self) -> None:
         """
-        Starts the ICL software and establishes communication.
+        Starts the ICL software and waits until it accepts connections.
+
+        Raises:
+            Exception: When the ICL could not be started, exits or does not accept connections within the start
+                timeout
         """
         logger.info('Starting ICL software...')
-        # try:
         if platform.system() != 'Windows':
             logger.info('Only Windows is supported for ICL software. Skip starting of ICL...')
             return
 
-        icl_running = 'icl.exe' in (p.name() for p in psutil.process_iter())
-        if not icl_running:
+        if not self._icl_process_monitor.is_running():
             logger.info('icl not running, starting it...')
             try:
-                self._icl_process = subprocess.Popen([r'C:\Program Files\HORIBA Scientific\SDK\icl.exe'])
-            except subprocess.CalledProcessError as error:
+                self._icl_process = subprocess.Popen([ICL_EXECUTABLE])
+            except OSError as error:
                 logger.error('Failed to start ICL software.')
                 raise Exception('Failed to start ICL software') from error
+            self._icl_process_monitor.store_pid(self._icl_process.pid)
+
+        self._wait_until_icl_ready()
+
+    def _wait_until_icl_ready(self) -> None:
+        deadline: float = time.monotonic() + self._icl_start_timeout_in_s
+        while not self._icl_process_monitor.accepts_connections():
+            if self._icl_process is not None and self._icl_process.poll() is not None:
+                raise Exception(f'ICL software exited with code {self._icl_process.returncode} while starting')
+            if time.monotonic() >= deadline:
+                raise Exception(f'ICL software did not accept connections within {self._icl_start_timeout_in_s}s')
+            time.sleep(0.1)
 
     def _enable_binary_messages(self) -> None:
         bin_mode_command: Command = Command('icl_binMode', {'mode': 'all'})
@@ -139,31 +166,37 @@ class DeviceManager(AbstractDeviceManager):
 
         if self._icl_process is not None:
             self._icl_process.terminate()
-        icl_running = 'icl.exe' in (p.name() for p in psutil.process_iter())
-        if icl_running:
+            try:
+                self._icl_process.wait(self._icl_start_timeout_in_s)
+            except subprocess.TimeoutExpired as e:
+                raise Exception('Failed to shutdown ICL software.') from e
+            self._icl_process = None
+        elif (
+            not self._icl_process_monitor.wait_until_stopped(self._icl_start_timeout_in_s)
+            or self._icl_process_monitor.is_running()
+        ):
             raise Exception('Failed to shutdown ICL software.')
+        self._icl_process_monitor.clear_pid()
 
         logger.info('icl_shutdown command sent')
 
-    def _format_icl_binary_to_string(self, message: bytes) -> str:
-        return ' '.join(format(byte, '02x') for byte in message[::-1])
-
     def _binary_message_callback(self, message: bytes) -> None:
-        # hex_data = ' '.join(format(byte, '02x') for byte in message)
-        # if len(message) < 18:
-        #     logger.warning(f'binary message not valid: {len(message)} < 16')
-        # logger.info(f'Received binary message: {hex_data}')
-        # logger.info(f'magic number: {self._format_icl_binary_to_string(message[:2])}')
-        # logger.info(f'message type: {self._format_icl_binary_to_string(message[2:4])}')
-        # logger.info(f'element type: {self._format_icl_binary_to_string(message[4:6])}')
-        # logger.info(f'element count: {self._format_icl_binary_to_string(message[6:10])}')
-        # logger.info(f'tag 1: {self._format_icl_binary_to_string(message[10:12])}')
-        # logger.info(f'tag 2: {self._format_icl_binary_to_string(message[12:14])}')
-        # logger.info(f'tag 3: {self._format_icl_binary_to_string(message[14:16])}')
-        # logger.info(f'tag 4: {self._format_icl_binary_to_string(message[16:18])}')
-        # logger.info(f'payload: {self._format_icl_binary_to_string(message[18:])}')
-        # logger.info(f'payload as string: {str(message[18:])}')
-        pass
+        try:
+            frame: BinaryFrame = BinaryFrame.from_bytes(message)
+        except Exception as e:
+            logger.warning(f'Discarding invalid binary message: {e}')
+            return
+
+        if frame.message_type != BinaryMessageType.DATA:
+            logger.info(f'ICL binary {frame.message_type.name.lower()} message: {frame.text()}')
+            return
+
+        ccd: Optional[ChargeCoupledDevice] = self._charge_coupled_devices_by_index.get(frame.device_index)
+        if ccd is None:
+            logger.warning(f'Discarding binary data frame for unknown CCD #{frame.device_index}')
+            return
+
+        ccd.receive_binary_frame(frame)
 
     @override
     def discover_devices(self, error_on_no_device: bool = False) -> None:
@@ -173,9 +206,12 @@ class DeviceManager(AbstractDeviceManager):
         Args:
             error_on_no_device (bool): If True, an exception is raised if no device is connected.
         """
-        device_discovery: DeviceDiscovery = DeviceDiscovery(self._icl_communicator, self._icl_error_db)
+        device_discovery: DeviceDiscovery = DeviceDiscovery(
+            self._icl_communicator, self._icl_error_db, self._discovery_cache
+        )
         device_discovery.execute(error_on_no_device)
         self._charge_coupled_devices = device_discovery.charge_coupled_devices()
+        self._charge_coupled_devices_by_index = {ccd.id(): ccd for ccd in self._charge_coupled_devices}
         self._monochromators = device_discovery.monochromators()
 
     @property
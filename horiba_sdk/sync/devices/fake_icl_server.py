@@ -55,21 +55,19 @@ class FakeICLServer:
                 websocket.send(message)
                 continue
             if command['command'].startswith('icl_'):
-                response = self.icl_responses[command['command']]
-                response['id'] = command['id']
-                websocket.send(json.dumps(response))
+                websocket.send(self._response_for(self.icl_responses, command))
             elif command['command'].startswith('mono_'):
-                response = self.monochromator_responses[command['command']]
-                response['id'] = command['id']
-                websocket.send(json.dumps(response))
+                websocket.send(self._response_for(self.monochromator_responses, command))
             elif command['command'].startswith('ccd_'):
-                response = self.ccd_responses[command['command']]
-                response['id'] = command['id']
-                websocket.send(json.dumps(response))
+                websocket.send(self._response_for(self.ccd_responses, command))
             else:
                 logger.info('unknown command, responding with message')
                 websocket.send(message)
 
+    def _response_for(self, responses, command):
+        response = {'command': command['command'], **responses[command['command']], 'id': command['id']}
+        return json.dumps(response)
+
     def start(self):
         self._server = serve(self.echo, host=self._fake_icl_host, port=self._fake_icl_port)
         self._server.serve_forever()
@@ -0,0 +1,84 @@
+from threading import Thread
+from types import TracebackType
+from typing import Any, Optional, final
+
+from loguru import logger
+from websockets.exceptions import ConnectionClosed
+from websockets.sync.server import WebSocketServer, serve
+
+from horiba_sdk.devices.icl_simulator import ICLSimulator, ICLSimulatorSession
+
+
+@final
+class ICLSimulatorServer:
+    """Serves an :class:`horiba_sdk.devices.icl_simulator.ICLSimulator` over websockets from a background thread.
+
+    Each client is served by its own thread, any number of clients can connect at the same time and share the state
+    of the simulated devices like they would with the ICL. Example::
+
+        with ICLSimulatorServer() as server:
+            device_manager = DeviceManager(start_icl=False, icl_port=str(server.port))
+            device_manager.start()
+
+    Port 0, the default, lets the operating system pick a free port, read it from :attr:`port` once started.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, simulator: Optional[ICLSimulator] = None) -> None:
+        """
+        Args:
+            host (str, optional): Host to listen on. Defaults to '127.0.0.1'
+            port (int, optional): Port to listen on, 0 for a free port. Defaults to 0
+            simulator (Optional[ICLSimulator], optional): The simulator to serve. Defaults to a new
+                :class:`ICLSimulator` with one CCD and one monochromator
+        """
+        self._host: str = host
+        self._port: int = port
+        self.simulator: ICLSimulator = simulator if simulator is not None else ICLSimulator()
+        self._server: Optional[WebSocketServer] = None
+        self._thread: Optional[Thread] = None
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on, the one picked by the operating system when started with port 0."""
+        return self._port
+
+    @property
+    def uri(self) -> str:
+        return f'ws://{self._host}:{self._port}'
+
+    def __enter__(self) -> 'ICLSimulatorServer':
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Starts listening, the connections are accepted by a background thread."""
+        self._server = serve(self._serve, host=self._host, port=self._port)
+        self._port = self._server.socket.getsockname()[1]
+        self._thread = Thread(target=self._server.serve_forever, name='icl-simulator')
+        self._thread.start()
+        logger.info(f'ICL simulator listening on {self.uri}')
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _serve(self, websocket: Any) -> None:
+        session: ICLSimulatorSession = self.simulator.session()
+        try:
+            for message in websocket:
+                for reply in session.handle(message):
+                    websocket.send(reply)
+        except ConnectionClosed:
+            logger.debug('ICL simulator client disconnected')
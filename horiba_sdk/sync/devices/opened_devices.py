@@ -0,0 +1,140 @@
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import Optional, final
+
+from loguru import logger
+
+from horiba_sdk.sync.devices.single_devices import AbstractDevice, ChargeCoupledDevice, Monochromator
+
+
+@final
+class OpenedDevices:
+    """Devices opened together by :meth:`horiba_sdk.sync.devices.DeviceManager.open_all`.
+
+    The devices are opened concurrently, each in its own thread, so a setup is ready in the time of its slowest device.
+    Used as a context manager, the devices are also closed concurrently on exit::
+
+        with device_manager.open_all() as devices:
+            ccd = devices.charge_coupled_devices[0]
+            mono = devices.monochromators[0]
+
+    When a device fails to open, the devices that were opened, and those that did not open within the timeout and may
+    be partially opened, are closed again and an exception listing the failures is raised.
+
+    .. note:: A device that did not answer within the timeout cannot be interrupted. When opening, its thread is
+        awaited before the device is closed again, the exception is only raised then. When closing, its thread
+        finishes in the background.
+
+    Attributes:
+        charge_coupled_devices (list[ChargeCoupledDevice]): The opened CCDs
+        monochromators (list[Monochromator]): The opened monochromators
+    """
+
+    def __init__(
+        self,
+        charge_coupled_devices: list[ChargeCoupledDevice],
+        monochromators: list[Monochromator],
+        timeout_in_s: float,
+    ) -> None:
+        self.charge_coupled_devices = charge_coupled_devices
+        self.monochromators = monochromators
+        self._timeout_in_s = timeout_in_s
+        self._opened: bool = False
+
+    def __enter__(self) -> 'OpenedDevices':
+        if not self._opened:
+            self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def devices(self) -> list[AbstractDevice]:
+        """Returns all the devices, CCDs first."""
+        return [*self.charge_coupled_devices, *self.monochromators]
+
+    def open(self) -> 'OpenedDevices':
+        """Opens all the devices concurrently.
+
+        Returns:
+            OpenedDevices: self, once all the devices are opened
+
+        Raises:
+            Exception: When at least one device failed to open or did not open within the timeout. The devices that
+                were opened or timed out are closed again before
+        """
+        opened, failures, timed_out = _run_concurrently(self.devices(), 'open', self._timeout_in_s)
+        if failures:
+            # the open of a timed out device still runs in its thread, it is awaited before closing the device
+            wait([future for _, future in timed_out])
+            devices_to_close: list[AbstractDevice] = [*opened, *(device for device, _ in timed_out)]
+            _, close_failures, _ = _run_concurrently(devices_to_close, 'close', self._timeout_in_s)
+            for device, error in close_failures:
+                logger.warning(f'Failed to close {_describe(device)} after a failed open: {error!r}')
+            raise _failure_exception('open', failures)
+        self._opened = True
+        return self
+
+    def close(self) -> None:
+        """Closes all the devices concurrently.
+
+        Raises:
+            Exception: When at least one device failed to close or did not close within the timeout. All the other
+                devices are closed nonetheless
+        """
+        _, failures, _ = _run_concurrently(self.devices(), 'close', self._timeout_in_s)
+        self._opened = False
+        if failures:
+            raise _failure_exception('close', failures)
+
+
+def _run_concurrently(
+    devices: Sequence[AbstractDevice], operation: str, timeout_in_s: float
+) -> tuple[list[AbstractDevice], list[tuple[AbstractDevice, BaseException]], list[tuple[AbstractDevice, Future[None]]]]:
+    """Runs :code:`open` or :code:`close` on all the devices concurrently, with a timeout for each device.
+
+    Returns:
+        tuple[list[AbstractDevice], list[tuple[AbstractDevice, BaseException]], list[tuple[AbstractDevice,
+        Future[None]]]]: The devices on which the operation succeeded, the devices on which it failed with their error,
+        and among the latter the devices that timed out with the future of their still running operation
+    """
+    if not devices:
+        return [], [], []
+
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=len(devices), thread_name_prefix=operation)
+    # all the threads start at once, a single wait gives every device the same timeout
+    futures: list[Future[None]] = [executor.submit(getattr(device, operation)) for device in devices]
+    wait(futures, timeout=timeout_in_s)
+    executor.shutdown(wait=False)
+
+    succeeded: list[AbstractDevice] = []
+    failures: list[tuple[AbstractDevice, BaseException]] = []
+    timed_out: list[tuple[AbstractDevice, Future[None]]] = []
+    for device, future in zip(devices, futures):
+        if not future.done():
+            failures.append((device, Exception(f'no answer within {timeout_in_s}s')))
+            timed_out.append((device, future))
+            continue
+        error: Optional[BaseException] = future.exception()
+        if error is not None:
+            failures.append((device, error))
+        else:
+            succeeded.append(device)
+    return succeeded, failures, timed_out
+
+
+def _failure_exception(operation: str, failures: list[tuple[AbstractDevice, BaseException]]) -> Exception:
+    details: str = ', '.join(f'{_describe(device)}: {error}' for device, error in failures)
+    exception = Exception(f'Failed to {operation} {len(failures)} device(s): {details}')
+    exception.__cause__ = failures[0][1]
+    return exception
+
+
+def _describe(device: AbstractDevice) -> str:
+    return f'{type(device).__name__} #{device.id()}'
@@ -0,0 +1,132 @@
+import time
+from typing import Any, final
+
+import numpy.typing as npt
+from loguru import logger
+
+from horiba_sdk.core.acquisition_data import AcquisitionData, RegionOfInterestData
+from horiba_sdk.core.range_scan_result import RangeScanResult, RangeScanStepTiming
+from horiba_sdk.core.stitching import IncrementalLinearStitch
+from horiba_sdk.sync.devices.single_devices.ccd import ChargeCoupledDevice
+from horiba_sdk.sync.devices.single_devices.monochromator import Monochromator
+
+
+@final
+class RangeScan:
+    """Acquires a spectrum wider than the CCD by moving the monochromator over a wavelength range.
+
+    The center wavelengths are computed by the ICL, see :meth:`ChargeCoupledDevice.range_mode_center_wavelengths`.
+    The steps are pipelined: as soon as the acquisition of a step completed, i.e. the shutter closed, the
+    monochromator starts moving to the next center wavelength while the data of the step is retrieved and decoded.
+
+    The CCD and the monochromator must be open and configured (grating, acquisition format, region of interest,
+    exposure time, x axis conversion type) before running the scan. Example::
+
+        scan = RangeScan(ccd, mono, start_wavelength=200, end_wavelength=600)
+        result = scan.run()
+        plt.plot(result.x_data, result.y_data)
+
+    The spectrum of each step is the first row of the first region of interest of the first acquisition. It is
+    stitched as soon as it is retrieved, :attr:`stitch` gives access to the spectrum stitched so far, e.g. for a live
+    display. The segments themselves are only kept when requested with :code:`keep_segments`.
+    """
+
+    def __init__(
+        self,
+        ccd: ChargeCoupledDevice,
+        monochromator: Monochromator,
+        start_wavelength: float,
+        end_wavelength: float,
+        pixel_overlap: int = 10,
+        open_shutter: bool = True,
+        keep_segments: bool = False,
+        timeout_in_s: float = 60,
+    ) -> None:
+        """
+        Args:
+            ccd (ChargeCoupledDevice): CCD acquiring the segments
+            monochromator (Monochromator): Monochromator in front of the CCD
+            start_wavelength (float): Start wavelength of the range, in nm
+            end_wavelength (float): End wavelength of the range, in nm
+            pixel_overlap (int, optional): Overlap in pixels between two segments. Defaults to 10
+            open_shutter (bool, optional): Whether the shutter should be open during the acquisitions. Defaults to True
+            keep_segments (bool, optional): Whether the spectrum of each step is kept in the result. Defaults to False
+            timeout_in_s (float, optional): Timeout in seconds of each move and each acquisition. Defaults to 60
+        """
+        self._ccd = ccd
+        self._monochromator = monochromator
+        self._start_wavelength = start_wavelength
+        self._end_wavelength = end_wavelength
+        self._pixel_overlap = pixel_overlap
+        self._open_shutter = open_shutter
+        self._keep_segments = keep_segments
+        self._stitch: IncrementalLinearStitch = IncrementalLinearStitch()
+        self._timeout_in_s = timeout_in_s
+
+    @property
+    def stitch(self) -> IncrementalLinearStitch:
+        """Stitch of the segments acquired so far by the running or the last scan."""
+        return self._stitch
+
+    def run(self) -> RangeScanResult:
+        """Runs the scan and stitches the segments.
+
+        Returns:
+            RangeScanResult: Stitched spectrum, segments and timings of each step
+
+        Raises:
+            Exception: When the CCD is not ready, when a move or an acquisition did not complete within the timeout
+                or when an error occurred on the device side
+        """
+        scan_start: float = time.monotonic()
+        center_wavelengths: list[float] = self._ccd.range_mode_center_wavelengths(
+            self._monochromator.id(), self._start_wavelength, self._end_wavelength, self._pixel_overlap
+        )
+        if not center_wavelengths:
+            raise Exception(f'No center wavelength found for the range {self._start_wavelength}-{self._end_wavelength}')
+        logger.info(f'Range scan of {len(center_wavelengths)} steps')
+
+        self._stitch = IncrementalLinearStitch()
+        segments: list[tuple[npt.NDArray[Any], npt.NDArray[Any]]] = []
+        steps: list[RangeScanStepTiming] = []
+        self._monochromator.move_to_target_wavelength(center_wavelengths[0])
+        for index, center_wavelength in enumerate(center_wavelengths):
+            step_start: float = time.monotonic()
+            self._monochromator.wait_until_idle(self._timeout_in_s)
+            mono_wavelength: float = self._monochromator.get_current_wavelength()
+            self._ccd.set_center_wavelength(mono_wavelength)
+
+            acquisition_start: float = time.monotonic()
+            if not self._ccd.get_acquisition_ready():
+                raise Exception('The CCD is not ready for an acquisition')
+            self._ccd.set_acquisition_start(self._open_shutter)
+            self._ccd.wait_until_idle(self._timeout_in_s)
+
+            readout_start: float = time.monotonic()
+            if index + 1 < len(center_wavelengths):
+                self._monochromator.move_to_target_wavelength(center_wavelengths[index + 1])
+            acquisitions: list[AcquisitionData] = self._ccd.get_acquisition_data_arrays(self._timeout_in_s)
+            x_values, y_values = _spectrum_of(acquisitions)
+            self._stitch.add_segment(x_values, y_values)
+            if self._keep_segments:
+                segments.append((x_values.copy(), y_values.copy()))
+            readout_end: float = time.monotonic()
+
+            steps.append(
+                RangeScanStepTiming(
+                    center_wavelength,
+                    mono_wavelength,
+                    acquisition_start - step_start,
+                    readout_start - acquisition_start,
+                    readout_end - readout_start,
+                )
+            )
+            logger.debug(f'Range scan step {index + 1}/{len(center_wavelengths)}: {steps[-1]}')
+
+        x_data, y_data = self._stitch.spectrum()
+        return RangeScanResult(x_data.copy(), y_data.copy(), segments, steps, time.monotonic() - scan_start)
+
+
+def _spectrum_of(acquisitions: list[AcquisitionData]) -> tuple[npt.NDArray[Any], npt.NDArray[Any]]:
+    roi: RegionOfInterestData = acquisitions[0].regions_of_interest[0]
+    return roi.x_data[0], roi.y_data[0]
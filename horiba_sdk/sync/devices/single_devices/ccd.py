@@ -1,12 +1,22 @@
+import queue
+import time
+from collections.abc import Iterator
 from types import TracebackType
 from typing import Any, List, Optional, final
 
+import numpy.typing as npt
 from loguru import logger
 from overrides import override
 
-from horiba_sdk.communication import Response
+from horiba_sdk.communication import BinaryFrame, Command, CommunicationException, Response
+from horiba_sdk.communication.message_queue import MessageQueue, MessageQueuePolicy, QueueOverflowPolicy
+from horiba_sdk.core.acquisition_data import AcquisitionData, AcquisitionRingBuffer, RegionOfInterestData
 from horiba_sdk.core.acquisition_format import AcquisitionFormat
+from horiba_sdk.core.ccd_configuration import ChargeCoupledDeviceConfiguration
 from horiba_sdk.core.clean_count_mode import CleanCountMode
+from horiba_sdk.core.data_retrieval_method import DataRetrievalMethod
+from horiba_sdk.core.discovery_cache import DiscoveryCache
+from horiba_sdk.core.polling_schedule import IdleWaitReport, PollingSchedule
 from horiba_sdk.core.resolution import Resolution
 from horiba_sdk.core.timer_resolution import TimerResolution
 from horiba_sdk.core.x_axis_conversion_type import XAxisConversionType
@@ -14,6 +24,15 @@ from horiba_sdk.icl_error import AbstractErrorDB
 from horiba_sdk.sync.communication.abstract_communicator import AbstractCommunicator
 from horiba_sdk.sync.devices.single_devices.abstract_device import AbstractDevice
 
+# bound of the binary frames waiting to be retrieved, the oldest frames are discarded when frames arrive that nobody
+# retrieves
+_MAX_PENDING_BINARY_FRAMES: int = 1000
+
+_TIMER_RESOLUTION_IN_S: dict[TimerResolution, float] = {
+    TimerResolution._1000_MICROSECONDS: 1e-3,
+    TimerResolution._1_MICROSECOND: 1e-6,
+}
+
 
 @final
 class ChargeCoupledDevice(AbstractDevice):
@@ -21,14 +40,32 @@ class ChargeCoupledDevice(AbstractDevice):
 
     This class should not be instanced by the end user. Instead, the :class:`horiba_sdk.devices.DeviceManager`
     should be used to access the detected CCDs on the system.
+
+    The settings written by the SDK and the settings read from the CCD are cached, the getters of the gain, speed,
+    exposure time, timer resolution, x axis conversion type, acquisition count, clean count and data retrieval method
+    answer from the cache unless called with :code:`refresh=True`. The cache is cleared when the CCD is opened, closed
+    or restarted, and by :meth:`invalidate_settings_cache`.
     """
 
-    def __init__(self, device_id: int, communicator: AbstractCommunicator, error_db: AbstractErrorDB) -> None:
+    def __init__(
+        self,
+        device_id: int,
+        communicator: AbstractCommunicator,
+        error_db: AbstractErrorDB,
+        serial_number: Optional[str] = None,
+        discovery_cache: Optional[DiscoveryCache] = None,
+    ) -> None:
         super().__init__(device_id, communicator, error_db)
+        self._serial_number: Optional[str] = serial_number
+        self._discovery_cache: Optional[DiscoveryCache] = discovery_cache
+        self._binary_frames: MessageQueue[BinaryFrame] = MessageQueue(
+            MessageQueuePolicy(max_size=_MAX_PENDING_BINARY_FRAMES, overflow=QueueOverflowPolicy.DROP_OLDEST)
+        )
+        self._settings_cache: dict[str, Any] = {}
+        self._configuration: Optional[ChargeCoupledDeviceConfiguration] = None
 
     def __enter__(self) -> 'ChargeCoupledDevice':
         self.open()
-        self._config: dict[str, Any] = self.get_configuration()
         return self
 
     def __exit__(
@@ -45,13 +82,28 @@ class ChargeCoupledDevice(AbstractDevice):
 
     @override
     def open(self) -> None:
-        """Opens the connection to the Charge Coupled Device
+        """Opens the connection to the Charge Coupled Device and reads its configuration, see :meth:`configuration`
+
+        When the CCD was created with a :class:`horiba_sdk.core.discovery_cache.DiscoveryCache`, the configuration is
+        read from the cache, by serial number, and only requested from the CCD the first time.
 
         Raises:
             Exception: When an error occurred on the device side
         """
         super().open()
+        self.invalidate_settings_cache()
         super()._execute_command('ccd_open', {'index': self._id})
+        self._configuration = ChargeCoupledDeviceConfiguration(self._cached_configuration())
+
+    def _cached_configuration(self) -> dict[str, Any]:
+        if self._discovery_cache is None or not self._serial_number:
+            return self.get_configuration()
+
+        configuration: Optional[dict[str, Any]] = self._discovery_cache.configuration(self._serial_number)
+        if configuration is None:
+            configuration = self.get_configuration()
+            self._discovery_cache.store_configuration(self._serial_number, configuration)
+        return configuration
 
     @override
     def close(self) -> None:
@@ -60,6 +112,7 @@ class ChargeCoupledDevice(AbstractDevice):
         Raises:
             Exception: When an error occurred on the device side
         """
+        self.invalidate_settings_cache()
         super()._execute_command('ccd_close', {'index': self._id})
 
     def is_open(self) -> bool:
@@ -80,8 +133,68 @@ class ChargeCoupledDevice(AbstractDevice):
         Raises:
             Exception: When an error occurred on the device side
         """
+        self.invalidate_settings_cache()
         super()._execute_command('ccd_restart', {'index': self._id})
 
+    def invalidate_settings_cache(self) -> None:
+        """Forgets the cached settings, the next call of each getter reads the setting from the CCD.
+
+        Use it when the settings may have been changed outside of this SDK instance.
+        """
+        self._settings_cache.clear()
+
+    @override
+    def _execute_commands(self, commands: list[Command], timeout_in_s: float = 5) -> list[Response]:
+        try:
+            return super()._execute_commands(commands, timeout_in_s)
+        except Exception:
+            # the cache was already updated by the batched setters, it is not known which of them were applied
+            self.invalidate_settings_cache()
+            raise
+
+    def receive_binary_frame(self, frame: BinaryFrame) -> None:
+        """Hands over a binary data frame of this CCD, called by the :class:`horiba_sdk.sync.devices.DeviceManager`.
+
+        Args:
+            frame (BinaryFrame): The data frame received from the ICL
+        """
+        self._binary_frames.put_message(frame)
+
+    def get_binary_frame(self, timeout_in_s: float = 5) -> BinaryFrame:
+        """Waits for the next binary data frame of this CCD.
+
+        Binary frames are only sent by the ICL when the binary messages are enabled in the DeviceManager.
+
+        Args:
+            timeout_in_s (float, optional): Timeout in seconds for waiting for the frame. Defaults to 5
+
+        Returns:
+            BinaryFrame: The next data frame, see :meth:`horiba_sdk.communication.BinaryFrame.data`
+
+        Raises:
+            CommunicationException: When no frame arrived within the timeout
+        """
+        try:
+            return self._binary_frames.get(timeout=timeout_in_s)
+        except queue.Empty as e:
+            raise CommunicationException(None, f'Timeout of {timeout_in_s}s while waiting for binary frame.') from e
+
+    def configuration(self) -> ChargeCoupledDeviceConfiguration:
+        """Returns the configuration of the CCD, read when the CCD was opened.
+
+        Unlike :meth:`get_configuration`, no command is sent to the ICL and the gains, speeds, triggers and signals are
+        indexed by their token.
+
+        Returns:
+            ChargeCoupledDeviceConfiguration: Configuration of the CCD
+
+        Raises:
+            Exception: When the CCD was not opened
+        """
+        if self._configuration is None:
+            raise Exception('The configuration is only available once the CCD is opened')
+        return self._configuration
+
     def get_configuration(self) -> dict[str, Any]:
         """Returns the configuration of the CCD
 
@@ -94,17 +207,25 @@ class ChargeCoupledDevice(AbstractDevice):
         response: Response = super()._execute_command('ccd_getConfig', {'index': self._id})
         return response.results['configuration']
 
-    def get_gain_token(self) -> int:
+    def get_gain_token(self, refresh: bool = False) -> int:
         """Returns the current gain token.
 
+        Args:
+            refresh (bool, optional): If True, the value is read from the CCD even if it is cached. Defaults to False
+
         Returns:
             int: Gain token of the ccd
 
         Raises:
             Exception: When an error occurred on the device side
         """
+        if not refresh and 'gain_token' in self._settings_cache:
+            cached_gain_token: int = self._settings_cache['gain_token']
+            return cached_gain_token
+
         response: Response = super()._execute_command('ccd_getGain', {'index': self._id})
         gain: int = int(response.results['token'])
+        self._settings_cache['gain_token'] = gain
         return gain
 
     def set_gain(self, gain_token: int) -> None:
@@ -116,19 +237,29 @@ class ChargeCoupledDevice(AbstractDevice):
         Raises:
             Exception: When an error occurred on the device side
         """
+        self.configuration().validate_gain(gain_token)
         super()._execute_command('ccd_setGain', {'index': self._id, 'token': gain_token})
+        self._settings_cache['gain_token'] = gain_token
 
-    def get_speed_token(self) -> int:
+    def get_speed_token(self, refresh: bool = False) -> int:
         """Returns the speed token.
 
+        Args:
+            refresh (bool, optional): If True, the value is read from the CCD even if it is cached. Defaults to False
+
         Returns:
             int: Speed token of the CCD.
 
         Raises:
             Exception: When an error occurred on the device side
         """
+        if not refresh and 'speed_token' in self._settings_cache:
+            cached_speed_token: int = self._settings_cache['speed_token']
+            return cached_speed_token
+
         response: Response = super()._execute_command('ccd_getSpeed', {'index': self._id})
         speed_token: int = int(response.results['token'])
+        self._settings_cache['speed_token'] = speed_token
         return speed_token
 
     def set_speed(self, speed_token: int) -> None:
@@ -140,7 +271,9 @@ class ChargeCoupledDevice(AbstractDevice):
         Raises:
             Exception: When an error occurred on the device side
         """
+        self.configuration().validate_speed(speed_token)
         super()._execute_command('ccd_setSpeed', {'index': self._id, 'token': speed_token})
+        self._settings_cache['speed_token'] = speed_token
 
     def get_fit_parameters(self) -> list[int]:
         """Returns the fit parameters of the CCD
@@ -167,18 +300,27 @@ class ChargeCoupledDevice(AbstractDevice):
         fit_params_str: str = ','.join(map(str, fit_params))
         super()._execute_command('ccd_setFitParams', {'index': self._id, 'params': fit_params_str})
 
-    def get_timer_resolution(self) -> TimerResolution:
+    def get_timer_resolution(self, refresh: bool = False) -> TimerResolution:
         """Returns the timer resolution of the CCD in microseconds [μs]
 
+        Args:
+            refresh (bool, optional): If True, the value is read from the CCD even if it is cached. Defaults to False
+
         Returns:
             int: Timer resolution in microseconds [μs]
 
         Raises:
             Exception: When an error occurred on the device side
         """
+        if not refresh and 'timer_resolution' in self._settings_cache:
+            cached_timer_resolution: TimerResolution = self._settings_cache['timer_resolution']
+            return cached_timer_resolution
+
         response: Response = super()._execute_command('ccd_getTimerResolution', {'index': self._id})
         timer_resolution: int = int(response.results['resolutionToken'])
-        return TimerResolution(timer_resolution)
+        resolution: TimerResolution = TimerResolution(timer_resolution)
+        self._settings_cache['timer_resolution'] = resolution
+        return resolution
 
     def set_timer_resolution(self, timer_resolution: TimerResolution) -> None:
         """Sets the timer resolution of the CCD
@@ -194,6 +336,7 @@ class ChargeCoupledDevice(AbstractDevice):
         super()._execute_command(
             'ccd_setTimerResolution', {'index': self._id, 'resolutionToken': timer_resolution.value}
         )
+        self._settings_cache['timer_resolution'] = timer_resolution
 
     def set_acquisition_format(self, number_of_rois: int, acquisition_format: AcquisitionFormat) -> None:
         """Sets the acquisition format and the number of ROIs (Regions of Interest) or areas.
@@ -264,15 +407,25 @@ class ChargeCoupledDevice(AbstractDevice):
 
         """
         super()._execute_command('ccd_setXAxisConversionType', {'index': self._id, 'type': conversion_type.value})
+        self._settings_cache['x_axis_conversion_type'] = conversion_type
 
-    def get_x_axis_conversion_type(self) -> XAxisConversionType:
+    def get_x_axis_conversion_type(self, refresh: bool = False) -> XAxisConversionType:
         """Gets the conversion type of the x axis.
         0 = None (default)
         1 = CCD FIT parameters contained in the CCD firmware
         2 = Mono Wavelength parameters contained in the icl_settings.ini file
+
+        Args:
+            refresh (bool, optional): If True, the value is read from the CCD even if it is cached. Defaults to False
         """
+        if not refresh and 'x_axis_conversion_type' in self._settings_cache:
+            cached_x_axis_conversion_type: XAxisConversionType = self._settings_cache['x_axis_conversion_type']
+            return cached_x_axis_conversion_type
+
         response: Response = super()._execute_command('ccd_getXAxisConversionType', {'index': self._id})
-        return XAxisConversionType(response.results['type'])
+        conversion_type: XAxisConversionType = XAxisConversionType(response.results['type'])
+        self._settings_cache['x_axis_conversion_type'] = conversion_type
+        return conversion_type
 
     def set_acquisition_count(self, count: int) -> None:
         """Sets the number of acquisition measurements to be performed sequentially by the hardware.
@@ -283,25 +436,43 @@ class ChargeCoupledDevice(AbstractDevice):
             count (int): The number of acquisition measurements.
         """
         super()._execute_command('ccd_setAcqCount', {'index': self._id, 'count': count})
+        self._settings_cache['acquisition_count'] = count
 
-    def get_acquisition_count(self) -> int:
+    def get_acquisition_count(self, refresh: bool = False) -> int:
         """Gets the number of acquisitions to be performed. The acquisition count is used to perform multiple
         acquisitions in a row.
+
+        Args:
+            refresh (bool, optional): If True, the value is read from the CCD even if it is cached. Defaults to False
         """
+        if not refresh and 'acquisition_count' in self._settings_cache:
+            cached_acquisition_count: int = self._settings_cache['acquisition_count']
+            return cached_acquisition_count
+
         response: Response = super()._execute_command('ccd_getAcqCount', {'index': self._id})
-        return int(response.results['count'])
+        count: int = int(response.results['count'])
+        self._settings_cache['acquisition_count'] = count
+        return count
 
-    def get_clean_count(self) -> tuple[int, CleanCountMode]:
+    def get_clean_count(self, refresh: bool = False) -> tuple[int, CleanCountMode]:
         """Gets the number of cleans to be performed prior to measurement.
 
+        Args:
+            refresh (bool, optional): If True, the value is read from the CCD even if it is cached. Defaults to False
+
         Returns:
             Tuple[int, CleanCountMode]:
                 count: Number of cleans,
                 mode: Specifies how the cleans will be performed.
         """
+        if not refresh and 'clean_count' in self._settings_cache:
+            cached_clean_count: tuple[int, CleanCountMode] = self._settings_cache['clean_count']
+            return cached_clean_count
+
         response: Response = super()._execute_command('ccd_getCleanCount', {'index': self._id})
         count: int = int(response.results['count'])
         mode: CleanCountMode = CleanCountMode(response.results['mode'])
+        self._settings_cache['clean_count'] = (count, mode)
         return count, mode
 
     def set_clean_count(self, count: int, mode: CleanCountMode) -> None:
@@ -311,6 +482,7 @@ class ChargeCoupledDevice(AbstractDevice):
             mode (CleanCountMode): The mode of the clean count
         """
         super()._execute_command('ccd_setCleanCount', {'index': self._id, 'count': count, 'mode': mode.value})
+        self._settings_cache['clean_count'] = (count, mode)
 
     def get_acquisition_data_size(self) -> int:
         """Returns the size of the acquisition data of the CCD
@@ -351,16 +523,24 @@ class ChargeCoupledDevice(AbstractDevice):
         resolution: Resolution = Resolution(width, height)
         return resolution
 
-    def get_exposure_time(self) -> int:
+    def get_exposure_time(self, refresh: bool = False) -> int:
         """Returns the exposure time in ms
 
+        Args:
+            refresh (bool, optional): If True, the value is read from the CCD even if it is cached. Defaults to False
+
         Returns:
             pint.Quantity: Exposure time in ms
         Raises:
             Exception: When an error occurred on the device side
         """
+        if not refresh and 'exposure_time' in self._settings_cache:
+            cached_exposure_time: int = self._settings_cache['exposure_time']
+            return cached_exposure_time
+
         response: Response = super()._execute_command('ccd_getExposureTime', {'index': self._id})
         exposure = int(response.results['time'])
+        self._settings_cache['exposure_time'] = exposure
         return exposure
 
     def set_exposure_time(self, exposure_time: int) -> None:
@@ -379,6 +559,7 @@ class ChargeCoupledDevice(AbstractDevice):
         """
 
         super()._execute_command('ccd_setExposureTime', {'index': self._id, 'time': exposure_time})
+        self._settings_cache['exposure_time'] = exposure_time
 
     def get_trigger_input(self) -> tuple[bool, int, int, int]:
         """This command is used to get the current setting of the input trigger.
@@ -439,19 +620,7 @@ class ChargeCoupledDevice(AbstractDevice):
             )
             return
 
-        found_triggers = [trigger for trigger in self._config['triggers'] if trigger['token'] == address]
-        if not found_triggers:
-            raise Exception(f'Trigger address {address} not found in the configuration')
-
-        found_events = [
-            trigger_event for trigger_event in found_triggers[0]['events'] if trigger_event['token'] == event
-        ]
-        if not found_events:
-            raise Exception(f'Trigger event {event} not found in the configuration')
-
-        found_signal_types = [signal for signal in found_events[0]['types'] if signal['token'] == signal_type]
-        if not found_signal_types:
-            raise Exception(f'Trigger signal type {signal_type} not found in the configuration')
+        self.configuration().validate_trigger_input(address, event, signal_type)
 
         super()._execute_command(
             'ccd_setTriggerIn',
@@ -515,19 +684,7 @@ class ChargeCoupledDevice(AbstractDevice):
             )
             return
 
-        found_triggers = [trigger for trigger in self._config['signals'] if trigger['token'] == address]
-        if not found_triggers:
-            raise Exception(f'Signal address {address} not found in the configuration')
-
-        found_events = [
-            trigger_event for trigger_event in found_triggers[0]['events'] if trigger_event['token'] == event
-        ]
-        if not found_events:
-            raise Exception(f'Signal event {event} not found in the configuration')
-
-        found_signal_types = [signal for signal in found_events[0]['types'] if signal['token'] == signal_type]
-        if not found_signal_types:
-            raise Exception(f'Signal type {signal_type} not found in the configuration')
+        self.configuration().validate_signal_output(address, event, signal_type)
 
         super()._execute_command(
             'ccd_setSignalOut',
@@ -586,6 +743,246 @@ class ChargeCoupledDevice(AbstractDevice):
         response: Response = super()._execute_command('ccd_getAcquisitionData', {'index': self._id})
         return response.results['acquisition']
 
+    def set_data_retrieval_method(self, method: DataRetrievalMethod) -> None:
+        """Sets how the ICL delivers the acquisition data.
+
+        With :attr:`DataRetrievalMethod.BINARY`, :code:`ccd_getAcquisitionData` only describes the acquisitions and
+        regions of interest, the data itself is sent as binary frames. Use :meth:`get_acquisition_data_arrays` to
+        retrieve it.
+
+        Args:
+            method (DataRetrievalMethod): The data retrieval method
+
+        Raises:
+            Exception: When an error occurred on the device side
+        """
+        super()._execute_command('ccd_setDataRetrievalMethod', {'index': self._id, 'method': method.value})
+        self._settings_cache['data_retrieval_method'] = method
+
+    def get_data_retrieval_method(self, refresh: bool = False) -> DataRetrievalMethod:
+        """Returns how the ICL delivers the acquisition data.
+
+        Args:
+            refresh (bool, optional): If True, the value is read from the CCD even if it is cached. Defaults to False
+
+        Returns:
+            DataRetrievalMethod: The data retrieval method
+
+        Raises:
+            Exception: When an error occurred on the device side
+        """
+        if not refresh and 'data_retrieval_method' in self._settings_cache:
+            cached_data_retrieval_method: DataRetrievalMethod = self._settings_cache['data_retrieval_method']
+            return cached_data_retrieval_method
+
+        response: Response = super()._execute_command('ccd_getDataRetrievalMethod', {'index': self._id})
+        method: DataRetrievalMethod = DataRetrievalMethod(response.results['method'])
+        self._settings_cache['data_retrieval_method'] = method
+        return method
+
+    def get_acquisition_data_arrays(self, timeout_in_s: float = 5) -> list[AcquisitionData]:
+        """Retrieves data from the last acquisition as numpy arrays.
+
+        Works with both data retrieval methods, see :meth:`set_data_retrieval_method`. With the binary method, the
+        data of each region of interest is taken from the binary frames of this CCD, which avoids encoding and
+        decoding the data as JSON.
+
+        Args:
+            timeout_in_s (float, optional): Timeout in seconds for waiting for the data. Defaults to 5
+
+        Returns:
+            list[AcquisitionData]: The data of each acquisition, with the metadata of each region of interest
+
+        Raises:
+            Exception: When an error occurred on the device side
+            CommunicationException: When the binary frames did not arrive within the timeout
+        """
+        raw_acquisitions, binary_data = self._fetch_acquisition_data(timeout_in_s)
+        return self._acquisition_data_from(raw_acquisitions, binary_data)
+
+    def _fetch_acquisition_data(
+        self, timeout_in_s: float
+    ) -> tuple[list[dict[str, Any]], dict[tuple[int, int, int], npt.NDArray[Any]]]:
+        while not self._binary_frames.empty():
+            self._binary_frames.get_nowait()
+
+        response: Response = super()._execute_command('ccd_getAcquisitionData', {'index': self._id}, timeout_in_s)
+        raw_acquisitions: list[dict[str, Any]] = response.results['acquisition']
+        binary_rois: set[tuple[int, int, int]] = {
+            (int(acquisition['acqIndex']), int(roi['roiIndex']), axis)
+            for acquisition in raw_acquisitions
+            for roi in acquisition['roi']
+            if 'yData' not in roi
+            for axis in (0, 1)
+        }
+        binary_data: dict[tuple[int, int, int], npt.NDArray[Any]] = self._binary_roi_data(binary_rois, timeout_in_s)
+        return raw_acquisitions, binary_data
+
+    @staticmethod
+    def _acquisition_data_from(
+        raw_acquisitions: list[dict[str, Any]], binary_data: dict[tuple[int, int, int], npt.NDArray[Any]]
+    ) -> list[AcquisitionData]:
+        acquisitions: list[AcquisitionData] = []
+        for acquisition in raw_acquisitions:
+            acquisition_index: int = int(acquisition['acqIndex'])
+            regions_of_interest: list[RegionOfInterestData] = [
+                RegionOfInterestData.from_json(
+                    roi,
+                    binary_data.get((acquisition_index, int(roi['roiIndex']), 0)),
+                    binary_data.get((acquisition_index, int(roi['roiIndex']), 1)),
+                )
+                for roi in acquisition['roi']
+            ]
+            acquisitions.append(AcquisitionData(acquisition_index, regions_of_interest, acquisition.get('timestamp')))
+        return acquisitions
+
+    def _binary_roi_data(
+        self, expected_keys: set[tuple[int, int, int]], timeout_in_s: float
+    ) -> dict[tuple[int, int, int], npt.NDArray[Any]]:
+        deadline: float = time.monotonic() + timeout_in_s
+        binary_data: dict[tuple[int, int, int], npt.NDArray[Any]] = {}
+        while len(binary_data) < len(expected_keys):
+            frame: BinaryFrame = self.get_binary_frame(max(deadline - time.monotonic(), 0))
+            key: tuple[int, int, int] = (frame.tags[1], frame.tags[2], frame.tags[3])
+            if key in expected_keys:
+                binary_data[key] = frame.data()
+        return binary_data
+
+    def acquire(self, open_shutter: bool = True, timeout_in_s: float = 60) -> list[AcquisitionData]:
+        """Runs an acquisition with the current settings and returns its data as numpy arrays.
+
+        Replaces the usual sequence of :meth:`get_acquisition_ready`, :meth:`set_acquisition_start`, polling
+        :meth:`get_acquisition_busy` and :meth:`get_acquisition_data_arrays`. The polling only starts once the expected
+        duration, derived from the exposure time, the timer resolution and the acquisition count, has elapsed, see
+        :meth:`wait_until_idle`.
+
+        Example::
+
+            with ccd.batch():
+                ccd.set_exposure_time(100)
+                ccd.set_region_of_interest()
+            acquisitions = ccd.acquire()
+            spectrum = acquisitions[0].regions_of_interest[0].y_data
+
+        Args:
+            open_shutter (bool, optional): Whether the shutter should be open during the acquisition. Defaults to True
+            timeout_in_s (float, optional): Timeout in seconds for the whole acquisition, including the data
+                retrieval. Defaults to 60
+
+        Returns:
+            list[AcquisitionData]: The data of each acquisition, with the metadata of each region of interest
+
+        Raises:
+            Exception: When the CCD is not ready, when the acquisition did not complete within the timeout or when an
+                error occurred on the device side
+        """
+        if not self.get_acquisition_ready():
+            raise Exception('The CCD is not ready for an acquisition')
+
+        deadline: float = time.monotonic() + timeout_in_s
+        expected_duration_s: float = self._expected_acquisition_duration_s()
+        self.set_acquisition_start(open_shutter)
+
+        self._wait_until_idle(self.get_acquisition_busy, deadline - time.monotonic(), expected_duration_s)
+        return self.get_acquisition_data_arrays(max(deadline - time.monotonic(), 1))
+
+    def stream(
+        self, open_shutter: bool = True, count: Optional[int] = None, buffer_size: int = 8, timeout_in_s: float = 60
+    ) -> Iterator[list[AcquisitionData]]:
+        """Runs acquisitions back to back with the current settings and yields the data of each one.
+
+        As soon as the data of an acquisition has been retrieved from the CCD, the next acquisition is started. Its
+        exposure therefore overlaps the decoding of the previous frame and the processing done by the consumer.
+
+        The counts of the yielded frames are stored in a preallocated
+        :class:`horiba_sdk.core.acquisition_data.AcquisitionRingBuffer` of :code:`buffer_size` frames: the arrays of a
+        frame are only valid until :code:`buffer_size` more frames have been yielded, copy them to keep them longer.
+
+        When the iteration stops before the last frame, because the consumer breaks out of the loop, the program is
+        interrupted or an error occurs, the running acquisition is aborted with :meth:`set_acquisition_abort`. Close
+        the iterator explicitly, e.g. with :code:`contextlib.closing`, for the abort to happen right away.
+
+        Example::
+
+            with contextlib.closing(ccd.stream(count=100)) as frames:
+                for acquisitions in frames:
+                    spectrum = acquisitions[0].regions_of_interest[0].y_data
+
+        Args:
+            open_shutter (bool, optional): Whether the shutter should be open during the acquisitions. Defaults to True
+            count (Optional[int], optional): Number of frames to acquire. Defaults to None, streaming until the
+                iteration is stopped
+            buffer_size (int, optional): Number of frames kept in the ring buffer. Defaults to 8
+            timeout_in_s (float, optional): Timeout in seconds for each frame, including the data retrieval.
+                Defaults to 60
+
+        Yields:
+            list[AcquisitionData]: The data of each acquisition of the frame
+
+        Raises:
+            Exception: When the CCD is not ready, when an acquisition did not complete within the timeout or when an
+                error occurred on the device side
+        """
+        if count is not None and count < 1:
+            raise ValueError(f'At least one frame must be streamed, got {count}')
+        ring_buffer: AcquisitionRingBuffer = AcquisitionRingBuffer(buffer_size)
+        if not self.get_acquisition_ready():
+            raise Exception('The CCD is not ready for an acquisition')
+
+        expected_duration_s: float = self._expected_acquisition_duration_s()
+        self.set_acquisition_start(open_shutter)
+        armed: bool = True
+        frames: int = 0
+        try:
+            while armed:
+                deadline: float = time.monotonic() + timeout_in_s
+                self._wait_until_idle(self.get_acquisition_busy, timeout_in_s, expected_duration_s)
+                armed = False
+                raw_acquisitions, binary_data = self._fetch_acquisition_data(max(deadline - time.monotonic(), 1))
+                frames += 1
+                if count is None or frames < count:
+                    self.set_acquisition_start(open_shutter)
+                    armed = True
+                yield ring_buffer.store(self._acquisition_data_from(raw_acquisitions, binary_data))
+        finally:
+            if armed:
+                logger.debug(f'Stream of CCD #{self._id} stopped after {frames} frames, aborting the acquisition')
+                self.set_acquisition_abort()
+
+    def wait_until_idle(
+        self,
+        timeout_in_s: float = 60,
+        expected_duration_s: Optional[float] = None,
+        schedule: Optional[PollingSchedule] = None,
+    ) -> IdleWaitReport:
+        """Waits until the running acquisition completed.
+
+        The busy state is first requested once the expected duration elapsed, then with growing intervals, see
+        :class:`horiba_sdk.core.polling_schedule.PollingSchedule`.
+
+        Args:
+            timeout_in_s (float, optional): Timeout in seconds. Defaults to 60
+            expected_duration_s (Optional[float], optional): Expected remaining duration in seconds of the acquisition.
+                Defaults to the duration derived from the exposure time, the timer resolution and the acquisition count
+            schedule (Optional[PollingSchedule], optional): Intervals between the polls. Defaults to PollingSchedule()
+
+        Returns:
+            IdleWaitReport: Number of polls, elapsed time and detection latency
+
+        Raises:
+            Exception: When the acquisition did not complete within the timeout or an error occurred on the device
+                side
+        """
+        if expected_duration_s is None:
+            expected_duration_s = self._expected_acquisition_duration_s()
+        return self._wait_until_idle(self.get_acquisition_busy, timeout_in_s, expected_duration_s, schedule)
+
+    def _expected_acquisition_duration_s(self) -> float:
+        exposure_time: int = self.get_exposure_time()
+        timer_resolution: TimerResolution = self.get_timer_resolution()
+        acquisition_count: int = self.get_acquisition_count()
+        return exposure_time * _TIMER_RESOLUTION_IN_S[timer_resolution] * max(acquisition_count, 1)
+
     def set_center_wavelength(self, center_wavelength: float) -> None:
         """Sets the center wavelength value to be used in the grating equation.
 
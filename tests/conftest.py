@@ -1,7 +1,9 @@
 # pylint: skip-file
 import asyncio
 import os
+import socket
 import threading
+import time
 
 import pytest
 import pytest_asyncio
@@ -18,6 +20,16 @@ fake_icl_port: int = 8766
 fake_icl_uri: str = 'ws://' + fake_icl_host + ':' + str(fake_icl_port)
 
 
+def _wait_for_server(host: str, port: int, timeout_s: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return
+        except OSError:
+            time.sleep(0.01)
+
+
 @pytest.fixture(scope='module')
 def fake_icl_host_fixture():
     return fake_icl_host
@@ -62,6 +74,7 @@ def fake_sync_icl_exe():  # noqa: ARG001
     sync_server = FakeSyncICLServer(fake_icl_host=fake_icl_host, fake_icl_port=fake_icl_port)
     thread = threading.Thread(target=sync_server.start)
     thread.start()
+    _wait_for_server(fake_icl_host, fake_icl_port)
 
     yield thread
 
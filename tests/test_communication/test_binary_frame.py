@@ -0,0 +1,64 @@
+# pylint: skip-file
+import struct
+
+import numpy as np
+import pytest
+
+from horiba_sdk.communication import BinaryElementType, BinaryFrame, BinaryMessageType
+
+
+def _binary_message(message_type: int, element_type: int, payload: bytes, element_count: int, tags=(0, 0, 0, 0)):
+    return struct.pack('<HHHI4H', 0x1CE1, message_type, element_type, element_count, *tags) + payload
+
+
+def test_binary_frame_header_is_parsed():
+    # arrange
+    values = np.arange(8, dtype='<u2')
+    message = _binary_message(2, 2, values.tobytes(), len(values), tags=(1, 2, 3, 4))
+
+    # act
+    frame = BinaryFrame.from_bytes(message)
+
+    # assert
+    assert frame.magic_number == 0x1CE1
+    assert frame.message_type == BinaryMessageType.DATA
+    assert frame.element_type == BinaryElementType.UINT16
+    assert frame.element_count == 8
+    assert frame.tags == (1, 2, 3, 4)
+    assert frame.device_index == 1
+
+
+def test_binary_frame_data_does_not_copy_payload():
+    # arrange
+    values = np.arange(1024, dtype='<f4')
+    message = bytearray(_binary_message(2, 5, values.tobytes(), len(values)))
+
+    # act
+    data = BinaryFrame.from_bytes(message).data()
+    message[BinaryFrame.HEADER.size : BinaryFrame.HEADER.size + 4] = struct.pack('<f', 42.0)
+
+    # assert
+    np.testing.assert_array_equal(data[1:], values[1:])
+    assert data[0] == 42.0
+
+
+def test_binary_frame_text():
+    # arrange
+    message = _binary_message(0, 0, b'some log', 8)
+
+    # act
+    frame = BinaryFrame.from_bytes(message)
+
+    # assert
+    assert frame.message_type == BinaryMessageType.LOG
+    assert frame.text() == 'some log'
+
+
+def test_binary_frame_too_short_throws():
+    # arrange
+    message = _binary_message(2, 3, b'\x00\x00', 4)
+
+    # act
+    # assert
+    with pytest.raises(Exception, match='too short'):
+        BinaryFrame.from_bytes(message)
@@ -0,0 +1,64 @@
+# pylint: skip-file
+import pytest
+from loguru import logger
+
+from horiba_sdk.communication import MessageLogPolicy
+
+
+@pytest.fixture
+def log_records():
+    records = []
+    handler_id = logger.add(lambda message: records.append(message.record['message']), level='DEBUG')
+    yield records
+    logger.remove(handler_id)
+
+
+def test_message_log_policy_truncates_long_messages(log_records):
+    # arrange
+    policy = MessageLogPolicy(max_length=10)
+
+    # act
+    policy.log('Received message', b'\x00' * 1000)
+
+    # assert
+    assert len(log_records) == 1
+    assert log_records[0].endswith('... (1000 in total)')
+    assert len(log_records[0]) < 100
+
+
+def test_message_log_policy_samples_messages(log_records):
+    # arrange
+    policy = MessageLogPolicy(sample_every=10)
+
+    # act
+    for i in range(100):
+        policy.log('Received message', f'message {i}')
+
+    # assert
+    assert len(log_records) == 10
+
+
+def test_message_log_policy_disabled_does_not_log(log_records):
+    # arrange
+    policy = MessageLogPolicy(enabled=False)
+
+    # act
+    policy.log('Received message', 'some message')
+
+    # assert
+    assert not log_records
+
+
+def test_message_log_policy_does_not_format_below_level(log_records):
+    # arrange
+    class Unformattable(str):
+        def __repr__(self):
+            raise AssertionError('message should not be formatted')
+
+    policy = MessageLogPolicy(level='TRACE')
+
+    # act
+    policy.log('Received message', Unformattable('some message'))
+
+    # assert
+    assert not log_records
@@ -0,0 +1,132 @@
+# pylint: skip-file
+import asyncio
+import threading
+
+import pytest
+
+from horiba_sdk.communication import (
+    CommunicationException,
+    JSONResponse,
+    MessageQueuePolicy,
+    QueueOverflowPolicy,
+)
+from horiba_sdk.communication.message_queue import AsyncMessageQueue, MessageQueue
+from horiba_sdk.sync.communication.websocket_communicator import WebsocketCommunicator
+
+
+def test_message_queue_policy_rejects_negative_size():
+    # act & assert
+    with pytest.raises(ValueError):
+        MessageQueuePolicy(max_size=-1)
+
+
+async def test_async_message_queue_drops_oldest():
+    # arrange
+    message_queue = AsyncMessageQueue(MessageQueuePolicy(max_size=2, overflow=QueueOverflowPolicy.DROP_OLDEST))
+
+    # act
+    for message in ['a', 'b', 'c']:
+        await message_queue.put_message(message)
+
+    # assert
+    assert [message_queue.get_nowait(), message_queue.get_nowait()] == ['b', 'c']
+    statistics = message_queue.statistics()
+    assert statistics.depth == 0
+    assert statistics.max_depth == 2
+    assert statistics.dropped == 1
+
+
+async def test_async_message_queue_raises_when_full():
+    # arrange
+    message_queue = AsyncMessageQueue(MessageQueuePolicy(max_size=1, overflow=QueueOverflowPolicy.RAISE))
+    await message_queue.put_message('a')
+
+    # act & assert
+    with pytest.raises(CommunicationException):
+        await message_queue.put_message('b')
+    assert message_queue.statistics().dropped == 1
+    assert message_queue.get_nowait() == 'a'
+
+
+async def test_async_message_queue_blocks_until_consumed():
+    # arrange
+    message_queue = AsyncMessageQueue(MessageQueuePolicy(max_size=1, overflow=QueueOverflowPolicy.BLOCK))
+    await message_queue.put_message('a')
+
+    # act
+    put_task = asyncio.create_task(message_queue.put_message('b'))
+    await asyncio.sleep(0.01)
+    blocked = not put_task.done()
+    first_message = await message_queue.get()
+    await put_task
+
+    # assert
+    assert blocked
+    assert first_message == 'a'
+    assert message_queue.get_nowait() == 'b'
+    assert message_queue.statistics().dropped == 0
+
+
+def test_message_queue_drops_oldest():
+    # arrange
+    message_queue = MessageQueue(MessageQueuePolicy(max_size=2, overflow=QueueOverflowPolicy.DROP_OLDEST))
+
+    # act
+    for message in [b'a', b'b', b'c']:
+        message_queue.put_message(message)
+
+    # assert
+    assert [message_queue.get_nowait(), message_queue.get_nowait()] == [b'b', b'c']
+    assert message_queue.statistics().dropped == 1
+
+
+def test_message_queue_blocks_until_consumed():
+    # arrange
+    message_queue = MessageQueue(MessageQueuePolicy(max_size=1, overflow=QueueOverflowPolicy.BLOCK))
+    message_queue.put_message(b'a')
+    producer = threading.Thread(target=message_queue.put_message, args=(b'b',))
+
+    # act
+    producer.start()
+    producer.join(0.05)
+    blocked = producer.is_alive()
+    first_message = message_queue.get()
+    producer.join(1)
+
+    # assert
+    assert blocked
+    assert first_message == b'a'
+    assert message_queue.get_nowait() == b'b'
+    assert message_queue.statistics().max_depth == 1
+
+
+def test_sync_communicator_bounds_unclaimed_responses():
+    # arrange
+    communicator = WebsocketCommunicator(
+        json_queue_policy=MessageQueuePolicy(max_size=2, overflow=QueueOverflowPolicy.DROP_OLDEST)
+    )
+
+    # act
+    for command_id in range(1, 4):
+        communicator._store_json_response(
+            JSONResponse(f'{{"id": {command_id}, "command": "icl_info", "results": {{}}, "errors": []}}')
+        )
+
+    # assert
+    assert list(communicator.json_message_dict) == [2, 3]
+    statistics = communicator.message_queue_statistics()['json_message_dict']
+    assert statistics.depth == 2
+    assert statistics.dropped == 1
+
+
+def test_sync_communicator_discards_late_responses():
+    # arrange
+    communicator = WebsocketCommunicator()
+    with pytest.raises(CommunicationException):
+        communicator.response(42, timeout_s=0)
+
+    # act
+    communicator._store_json_response(JSONResponse('{"id": 42, "command": "icl_info", "results": {}, "errors": []}'))
+
+    # assert
+    assert not communicator.json_message_dict
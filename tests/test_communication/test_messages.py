@@ -1,7 +1,40 @@
-from horiba_sdk.communication import Command
+import contextlib
+import json
 
+import numpy as np
+import pytest
 
-def test_command_to_json_with_string_paramter():
+from horiba_sdk.communication import (
+    Command,
+    JSONResponse,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    json_codec,
+    set_json_codec,
+)
+
+available_codecs = [StdlibJSONCodec()]
+with contextlib.suppress(ImportError):
+    available_codecs.append(OrjsonCodec())
+
+
+@pytest.fixture
+def stdlib_json_codec():
+    previous_codec = json_codec()
+    set_json_codec(StdlibJSONCodec())
+    yield
+    set_json_codec(previous_codec)
+
+
+@pytest.fixture(params=available_codecs, ids=lambda codec: type(codec).__name__)
+def each_json_codec(request):
+    previous_codec = json_codec()
+    set_json_codec(request.param)
+    yield request.param
+    set_json_codec(previous_codec)
+
+
+def test_command_to_json_with_string_paramter(stdlib_json_codec):  # noqa: ARG001
     # arrange
     command: Command = Command('test_command', {'test': 'some_test'})
 
@@ -12,7 +45,7 @@ def test_command_to_json_with_string_paramter():
     assert json == '{"id": 1, "command": "test_command", "parameters": {"test": "some_test"}}'
 
 
-def test_command_to_json_with_bool_parameter():
+def test_command_to_json_with_bool_parameter(stdlib_json_codec):  # noqa: ARG001
     # arrange
     command = Command('ccd_setAcquisitionStart', {'index': 1, 'parameters': {'openShutter': True}})
 
@@ -24,3 +57,52 @@ def test_command_to_json_with_bool_parameter():
         '{"id": 2, "command": "ccd_setAcquisitionStart", "parameters":'
         ' {"index": 1, "parameters": {"openShutter": true}}}'
     )
+
+
+def test_command_to_json_with_each_codec(each_json_codec):  # noqa: ARG001
+    # arrange
+    command = Command('ccd_setRoi', {'index': 0, 'xOrigin': 0, 'xSize': 1024, 'enable': False})
+
+    # act
+    encoded_command = command.json()
+
+    # assert
+    assert isinstance(encoded_command, str)
+    assert json.loads(encoded_command) == {
+        'id': command.id,
+        'command': 'ccd_setRoi',
+        'parameters': {'index': 0, 'xOrigin': 0, 'xSize': 1024, 'enable': False},
+    }
+
+
+def test_command_with_numpy_parameters_to_json_with_each_codec(each_json_codec):  # noqa: ARG001
+    # arrange
+    command = Command(
+        'ccd_setRoi',
+        {'index': np.int64(0), 'wavelength': np.float64(546.07), 'positions': np.array([1, 2]), 'keys': {1: 'a'}},
+    )
+
+    # act
+    encoded_command = command.json()
+
+    # assert
+    assert json.loads(encoded_command)['parameters'] == {
+        'index': 0,
+        'wavelength': 546.07,
+        'positions': [1, 2],
+        'keys': {'1': 'a'},
+    }
+
+
+def test_json_response_with_each_codec(each_json_codec):  # noqa: ARG001
+    # arrange
+    message = '{"id": 42, "command": "ccd_getGain", "results": {"token": 2}, "errors": []}'
+
+    # act
+    response = JSONResponse(message)
+
+    # assert
+    assert response.id == 42
+    assert response.command == 'ccd_getGain'
+    assert response.results == {'token': 2}
+    assert response.errors == []
@@ -1,9 +1,10 @@
 # pylint: skip-file
+import threading
 import time
 
 import pytest
 
-from horiba_sdk.communication import Command, CommunicationException, Response
+from horiba_sdk.communication import Command, CommunicationException, MessageQueuePolicy, QueueOverflowPolicy, Response
 from horiba_sdk.sync.communication.websocket_communicator import WebsocketCommunicator
 
 
@@ -121,3 +122,92 @@ def test_websocket_fails_close_when_already_closed(fake_sync_icl_exe, fake_icl_u
     # assert
     with pytest.raises(CommunicationException):
         websocket_communicator.close()
+
+
+def test_websocket_binary_messages_are_dispatched_in_order_without_delay(
+    fake_sync_icl_exe,  # noqa: ARG001
+    fake_icl_uri_fixture,
+):
+    # arrange
+    received_messages = []
+    all_received = threading.Event()
+
+    def callback(message):
+        received_messages.append(message)
+        if len(received_messages) == 3:
+            all_received.set()
+
+    websocket_communicator = WebsocketCommunicator(fake_icl_uri_fixture)
+    websocket_communicator.open()
+    websocket_communicator.register_binary_message_callback(callback)
+
+    # act
+    for message in [b'first', b'second', b'third']:
+        websocket_communicator.binary_message_queue.put_message(message)
+    dispatched = all_received.wait(0.2)
+    start = time.perf_counter()
+    websocket_communicator.close()
+    close_duration_s = time.perf_counter() - start
+
+    # assert
+    assert dispatched
+    assert received_messages == [b'first', b'second', b'third']
+    assert close_duration_s < 0.5
+
+
+def test_websocket_close_does_not_wait_for_pending_binary_messages(
+    fake_sync_icl_exe,  # noqa: ARG001
+    fake_icl_uri_fixture,
+):
+    # arrange
+    received_messages = []
+    handling_first_message = threading.Event()
+    release_callback = threading.Event()
+
+    def callback(message):
+        received_messages.append(message)
+        handling_first_message.set()
+        release_callback.wait(1)
+
+    def release_once_queue_is_cleared():
+        while websocket_communicator.binary_message_queue.qsize() > 1:
+            time.sleep(0.01)
+        release_callback.set()
+
+    websocket_communicator = WebsocketCommunicator(fake_icl_uri_fixture)
+    websocket_communicator.open()
+    websocket_communicator.register_binary_message_callback(callback)
+    for index in range(500):
+        websocket_communicator.binary_message_queue.put_message(b'%d' % index)
+    handling_first_message.wait(1)
+    releaser = threading.Thread(target=release_once_queue_is_cleared)
+    releaser.start()
+
+    # act
+    websocket_communicator.close()
+    releaser.join()
+
+    # assert
+    assert received_messages == [b'0']
+    assert websocket_communicator.binary_message_queue.qsize() == 0
+
+
+def test_websocket_queue_overflow_does_not_stop_the_listening_thread(fake_sync_icl_exe, fake_icl_uri_fixture):  # noqa: ARG001
+    # arrange
+    policy = MessageQueuePolicy(max_size=1, overflow=QueueOverflowPolicy.RAISE)
+    with WebsocketCommunicator(fake_icl_uri_fixture, json_queue_policy=policy) as communicator:
+        unclaimed_commands = [Command('icl_info', {}), Command('icl_info', {})]
+        for command in unclaimed_commands:
+            communicator.send(command)
+        deadline = time.monotonic() + 1
+        while communicator.message_queue_statistics()['json_message_dict'].dropped == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        communicator.response(unclaimed_commands[0].id, timeout_s=1)
+
+        # act
+        command = Command('ccd_getGain', {'index': 0})
+        response = communicator.request_with_response(command, response_timeout_s=1)
+
+    # assert
+    assert response.id == command.id
+    assert communicator.message_queue_statistics()['json_message_dict'].dropped == 1
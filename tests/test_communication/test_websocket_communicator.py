@@ -1,7 +1,21 @@
 # pylint: skip-file
+import asyncio
+import contextlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import websockets
 
-from horiba_sdk.communication import Command, CommunicationException, Response, WebsocketCommunicator
+from horiba_sdk.communication import (
+    Command,
+    CommunicationException,
+    MessageQueuePolicy,
+    QueueOverflowPolicy,
+    Response,
+    WebsocketCommunicator,
+)
 
 
 @pytest.mark.asyncio
@@ -78,3 +92,172 @@ async def test_websocket_fails_close_when_already_closed(fake_icl_exe, fake_icl_
     # assert
     with pytest.raises(CommunicationException):
         await websocket_communicator.close()
+
+
+@pytest.mark.asyncio
+async def test_websocket_concurrent_requests_get_their_own_response(fake_icl_exe, fake_icl_uri_fixture):  # noqa: ARG001
+    # arrange
+    commands: list[Command] = [
+        Command('icl_info', {}),
+        Command('ccd_getGain', {'index': 0}),
+        Command('mono_isBusy', {'index': 0}),
+        Command('ccd_getSpeed', {'index': 0}),
+    ]
+
+    async with WebsocketCommunicator(fake_icl_uri_fixture) as websocket_communicator:
+        # act
+        responses = await asyncio.gather(
+            *(websocket_communicator.request_with_response(command) for command in commands)
+        )
+
+    # assert
+    for command, response in zip(commands, responses):
+        assert response.id == command.id
+        assert response.command == command.command
+
+
+async def _reply_after_delay(websocket, message, delays_by_command):
+    request = json.loads(message)
+    await asyncio.sleep(delays_by_command.get(request['command'], 0))
+    await websocket.send(json.dumps({'id': request['id'], 'command': request['command'], 'results': {}, 'errors': []}))
+
+
+@contextlib.asynccontextmanager
+async def _slow_icl(delays_by_command):
+    async def handler(websocket):
+        # every request is answered on its own, a slow reply does not delay the others
+        replies = [
+            asyncio.create_task(_reply_after_delay(websocket, message, delays_by_command))
+            async for message in websocket
+        ]
+        await asyncio.gather(*replies, return_exceptions=True)
+
+    async with websockets.serve(handler, '127.0.0.1', 0) as server:
+        yield f'ws://127.0.0.1:{server.sockets[0].getsockname()[1]}'
+
+
+@pytest.mark.asyncio
+async def test_websocket_late_response_is_not_handed_to_next_request():
+    async with _slow_icl({'ccd_getGain': 0.3}) as uri, WebsocketCommunicator(uri) as websocket_communicator:
+        # arrange
+        timed_out_command: Command = Command('ccd_getGain', {'index': 0})
+        with pytest.raises(CommunicationException):
+            await websocket_communicator.request_with_response(timed_out_command, timeout=0.05)
+        await asyncio.sleep(0.4)  # the late reply arrives
+
+        # act
+        command: Command = Command('icl_info', {})
+        response: Response = await websocket_communicator.request_with_response(command, timeout=1)
+
+        # assert
+        assert response.id == command.id
+        assert response.command == 'icl_info'
+        assert websocket_communicator.json_message_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_websocket_forgets_oldest_expired_command_ids(monkeypatch):
+    # arrange
+    monkeypatch.setattr('horiba_sdk.communication.websocket_communicator._MAX_EXPIRED_COMMAND_IDS', 2)
+    async with _slow_icl({'ccd_getGain': 0.5}) as uri, WebsocketCommunicator(uri) as websocket_communicator:
+        commands: list[Command] = [Command('ccd_getGain', {'index': 0}) for _ in range(3)]
+
+        # act
+        for command in commands:
+            with pytest.raises(CommunicationException):
+                await websocket_communicator.request_with_response(command, timeout=0.05)
+
+        # assert
+        assert list(websocket_communicator._expired_command_ids) == [commands[1].id, commands[2].id]
+
+
+@pytest.mark.asyncio
+async def test_websocket_request_with_responses_keeps_order(fake_icl_exe, fake_icl_uri_fixture):  # noqa: ARG001
+    # arrange
+    commands: list[Command] = [Command('ccd_setGain', {'index': 0, 'token': 0}), Command('icl_info', {})]
+
+    async with WebsocketCommunicator(fake_icl_uri_fixture) as websocket_communicator:
+        # act
+        responses = await websocket_communicator.request_with_responses(commands)
+
+    # assert
+    assert [response.id for response in responses] == [command.id for command in commands]
+    assert [response.command for response in responses] == ['ccd_setGain', 'icl_info']
+
+
+@pytest.mark.asyncio
+async def test_websocket_queue_overflow_does_not_stop_the_listening_task(
+    fake_icl_exe,  # noqa: ARG001
+    fake_icl_uri_fixture,
+):
+    # arrange
+    policy = MessageQueuePolicy(max_size=1, overflow=QueueOverflowPolicy.RAISE)
+    async with WebsocketCommunicator(fake_icl_uri_fixture, json_queue_policy=policy) as websocket_communicator:
+        for _ in range(3):
+            await websocket_communicator.send(Command('icl_info', {}))
+
+        # act
+        command: Command = Command('ccd_getGain', {'index': 0})
+        response: Response = await websocket_communicator.request_with_response(command, timeout=1)
+
+        # assert
+        assert response.id == command.id
+        statistics = websocket_communicator.message_queue_statistics()['json_message_queue']
+        assert statistics.depth == 1
+        assert statistics.dropped == 2
+
+
+async def test_websocket_slow_binary_callback_does_not_delay_responses(
+    fake_icl_exe,  # noqa: ARG001
+    fake_icl_uri_fixture,
+):
+    # arrange
+    received_messages = []
+    callback_running = asyncio.Event()
+    release_callback = asyncio.Event()
+
+    async def slow_callback(message):
+        callback_running.set()
+        await release_callback.wait()
+        received_messages.append(message)
+
+    websocket_communicator = WebsocketCommunicator(fake_icl_uri_fixture)
+    websocket_communicator.register_binary_message_callback(slow_callback)
+    await websocket_communicator.open()
+
+    # act
+    for message in [b'first', b'second']:
+        await websocket_communicator.binary_message_queue.put_message(message)
+    await asyncio.wait_for(callback_running.wait(), 1)
+    response: Response = await websocket_communicator.request_with_response(Command('icl_info', {}), timeout=1)
+    release_callback.set()
+    while len(received_messages) < 2:
+        await asyncio.sleep(0.01)
+    await websocket_communicator.close()
+
+    # assert
+    assert response.command == 'icl_info'
+    assert received_messages == [b'first', b'second']
+
+
+async def test_websocket_binary_callback_runs_in_executor(fake_icl_exe, fake_icl_uri_fixture):  # noqa: ARG001
+    # arrange
+    callback_threads = []
+    callback_done = threading.Event()
+
+    def callback(message):  # noqa: ARG001
+        callback_threads.append(threading.get_ident())
+        callback_done.set()
+
+    websocket_communicator = WebsocketCommunicator(fake_icl_uri_fixture)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        websocket_communicator.register_binary_message_callback(callback, executor)
+        await websocket_communicator.open()
+
+        # act
+        await websocket_communicator.binary_message_queue.put_message(b'frame')
+        await asyncio.get_running_loop().run_in_executor(None, callback_done.wait, 1)
+        await websocket_communicator.close()
+
+    # assert
+    assert callback_threads and callback_threads[0] != threading.get_ident()
@@ -0,0 +1,60 @@
+# pylint: skip-file
+from horiba_sdk.core.discovery_cache import DiscoveryCache
+
+_CCDS = [{'deviceType': 'HORIBA Scientific Syncerity', 'index': 0, 'productId': 13, 'serialNumber': 'Camera SN:  2244'}]
+
+
+def test_discovery_cache_persists_devices_and_configurations(tmp_path):
+    # arrange
+    cache_path = tmp_path / 'discovery_cache.json'
+    cache = DiscoveryCache(cache_path)
+
+    # act
+    cache.store_devices('ccd', _CCDS)
+    cache.store_configuration('Camera SN:  2244', {'gains': []})
+    reloaded_cache = DiscoveryCache(cache_path)
+
+    # assert
+    assert reloaded_cache.devices('ccd') == _CCDS
+    assert reloaded_cache.devices('mono') is None
+    assert reloaded_cache.configuration('Camera SN:  2244') == {'gains': []}
+
+
+def test_discovery_cache_matches_devices_by_index_type_and_serial(tmp_path):
+    # arrange
+    cache = DiscoveryCache(tmp_path / 'discovery_cache.json')
+    cache.store_devices('ccd', _CCDS)
+    other_ccds = [{**_CCDS[0], 'serialNumber': 'Camera SN:  1111'}]
+
+    # act
+    # assert
+    assert cache.matches('ccd', [dict(_CCDS[0])])
+    assert not cache.matches('ccd', other_ccds)
+    assert not cache.matches('ccd', [])
+    assert not cache.matches('mono', _CCDS)
+
+
+def test_discovery_cache_ignores_unreadable_file(tmp_path):
+    # arrange
+    cache_path = tmp_path / 'discovery_cache.json'
+    cache_path.write_text('{not json')
+
+    # act
+    cache = DiscoveryCache(cache_path)
+
+    # assert
+    assert cache.devices('ccd') is None
+
+
+def test_discovery_cache_clear_removes_the_file(tmp_path):
+    # arrange
+    cache_path = tmp_path / 'discovery_cache.json'
+    cache = DiscoveryCache(cache_path)
+    cache.store_devices('ccd', _CCDS)
+
+    # act
+    cache.clear()
+
+    # assert
+    assert not cache_path.exists()
+    assert DiscoveryCache(cache_path).devices('ccd') is None
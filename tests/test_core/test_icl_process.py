@@ -0,0 +1,127 @@
+# pylint: skip-file
+import os
+import socket
+
+import pytest
+
+from horiba_sdk.core.icl_process import ICLProcessMonitor
+
+
+@pytest.fixture
+def listening_port():
+    server = socket.create_server(('127.0.0.1', 0))
+    yield str(server.getsockname()[1])
+    server.close()
+
+
+def _unused_port() -> str:
+    with socket.create_server(('127.0.0.1', 0)) as server:
+        return str(server.getsockname()[1])
+
+
+def _fail_process_scan(*args, **kwargs):  # noqa: ARG001
+    raise AssertionError('the processes should not be scanned')
+
+
+def test_icl_process_monitor_detects_listening_icl_without_scanning(listening_port, tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.setattr('psutil.process_iter', _fail_process_scan)
+    monitor = ICLProcessMonitor('127.0.0.1', listening_port, tmp_path / 'icl.pid')
+
+    # act
+    # assert
+    assert monitor.accepts_connections()
+    assert monitor.is_running()
+    assert monitor.wait_until_ready(timeout_in_s=1)
+
+
+def test_icl_process_monitor_uses_pid_file_instead_of_scanning(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.setattr('psutil.process_iter', _fail_process_scan)
+    monkeypatch.setattr('horiba_sdk.core.icl_process._is_icl_process', lambda pid: pid == os.getpid())
+    monitor = ICLProcessMonitor('127.0.0.1', _unused_port(), tmp_path / 'icl.pid')
+
+    # act
+    monitor.store_pid(os.getpid())
+    recorded_pid = monitor.recorded_pid()
+    running = monitor.is_running()
+    monitor.clear_pid()
+
+    # assert
+    assert recorded_pid == os.getpid()
+    assert running
+    assert monitor.recorded_pid() is None
+    assert not monitor.pid_file.exists()
+
+
+def _process_scan_finding(names, scans):
+    class FakeProcess:
+        def __init__(self, name):
+            self.info = {'name': name}
+
+    def process_iter(attributes):
+        scans.append(attributes)
+        return [FakeProcess(name) for name in names]
+
+    return process_iter
+
+
+def test_icl_process_monitor_falls_back_to_process_scan_for_stale_pid(tmp_path, monkeypatch):
+    # arrange
+    scans = []
+    monkeypatch.setattr('psutil.process_iter', _process_scan_finding(['icl.exe'], scans))
+    monitor = ICLProcessMonitor('127.0.0.1', _unused_port(), tmp_path / 'icl.pid')
+    monitor.store_pid(os.getpid())  # the pid is the one of python, not of an icl.exe
+
+    # act
+    running = monitor.is_running()
+
+    # assert
+    assert running
+    assert scans == [['name']]
+    assert monitor.recorded_pid() is None
+
+
+def test_icl_process_monitor_finds_external_icl_after_clear_pid(tmp_path, monkeypatch):
+    # arrange
+    scans = []
+    monkeypatch.setattr('psutil.process_iter', _process_scan_finding(['python.exe', 'icl.exe'], scans))
+    monitor = ICLProcessMonitor('127.0.0.1', _unused_port(), tmp_path / 'icl.pid')
+    monitor.store_pid(12345)
+    monitor.clear_pid()
+
+    # act
+    running = monitor.is_running()
+
+    # assert
+    assert running
+    assert scans == [['name']]
+    assert monitor.wait_until_stopped(timeout_in_s=1)
+
+
+def test_icl_process_monitor_falls_back_to_process_scan_without_pid_file(tmp_path, monkeypatch):
+    # arrange
+    scans = []
+
+    def process_iter(attributes):
+        scans.append(attributes)
+        return []
+
+    monkeypatch.setattr('psutil.process_iter', process_iter)
+    monitor = ICLProcessMonitor('127.0.0.1', _unused_port(), tmp_path / 'icl.pid')
+
+    # act
+    running = monitor.is_running()
+
+    # assert
+    assert not running
+    assert scans == [['name']]
+
+
+def test_icl_process_monitor_wait_until_ready_times_out(tmp_path):
+    # arrange
+    monitor = ICLProcessMonitor('127.0.0.1', _unused_port(), tmp_path / 'icl.pid')
+
+    # act
+    # assert
+    assert not monitor.wait_until_ready(timeout_in_s=0.2, poll_interval_in_s=0.05)
@@ -0,0 +1,114 @@
+# pylint: skip-file
+import numpy as np
+import pytest
+
+from horiba_sdk.core.stitching import IncrementalLinearStitch, stitch_linear
+
+
+def test_stitch_linear_averages_the_overlap():
+    # arrange
+    segments = [
+        (np.array([0.0, 1.0, 2.0, 3.0]), np.array([1.0, 1.0, 1.0, 1.0])),
+        (np.array([2.0, 3.0, 4.0, 5.0]), np.array([3.0, 3.0, 3.0, 3.0])),
+    ]
+
+    # act
+    x_data, y_data = stitch_linear(segments)
+
+    # assert
+    np.testing.assert_array_equal(x_data, [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    np.testing.assert_array_equal(y_data, [1.0, 1.0, 2.0, 2.0, 3.0, 3.0])
+
+
+def test_stitch_linear_without_overlap_raises():
+    # arrange
+    segments = [
+        (np.array([0.0, 1.0]), np.array([1.0, 1.0])),
+        (np.array([2.0, 3.0]), np.array([1.0, 1.0])),
+    ]
+
+    # act
+    # assert
+    with pytest.raises(Exception, match='No overlapping region'):
+        stitch_linear(segments)
+
+
+def test_stitch_linear_stitches_every_overlap_in_one_pass():
+    # arrange
+    segments = [
+        (np.arange(0.0, 10.0), np.zeros(10)),
+        (np.arange(8.0, 20.0), np.full(12, 2.0)),
+        (np.arange(18.5, 25.5), np.full(7, 4.0)),
+    ]
+
+    # act
+    x_data, y_data = stitch_linear(segments)
+
+    # assert
+    np.testing.assert_array_equal(x_data, np.concatenate((np.arange(0.0, 20.0), np.arange(19.5, 25.5))))
+    np.testing.assert_array_equal(y_data[:8], 0.0)
+    np.testing.assert_array_equal(y_data[8:10], 1.0)
+    np.testing.assert_array_equal(y_data[10:19], 2.0)
+    np.testing.assert_array_equal(y_data[19], 3.0)
+    np.testing.assert_array_equal(y_data[20:], 4.0)
+
+
+def test_stitch_linear_of_a_single_segment():
+    # arrange
+    x_values = np.array([1.0, 2.0, 3.0])
+
+    # act
+    x_data, y_data = stitch_linear([(x_values, [5, 6, 7])])
+
+    # assert
+    np.testing.assert_array_equal(x_data, x_values)
+    np.testing.assert_array_equal(y_data, [5.0, 6.0, 7.0])
+
+
+def test_incremental_linear_stitch_matches_stitch_linear():
+    # arrange
+    rng = np.random.default_rng(0)
+    segments = [
+        (np.linspace(200.0 + 40.0 * index, 250.0 + 40.0 * index, 101), rng.normal(size=101)) for index in range(20)
+    ]
+    stitch = IncrementalLinearStitch(initial_capacity=16)
+
+    # act
+    for x_values, y_values in segments:
+        stitch.add_segment(x_values, y_values)
+    x_data, y_data = stitch.spectrum()
+
+    # assert
+    expected_x_data, expected_y_data = stitch_linear(segments)
+    assert stitch.segment_count == 20
+    np.testing.assert_array_equal(x_data, expected_x_data)
+    np.testing.assert_allclose(y_data, expected_y_data)
+
+
+def test_incremental_linear_stitch_exposes_the_partial_spectrum():
+    # arrange
+    stitch = IncrementalLinearStitch()
+
+    # act
+    stitch.add_segment([0.0, 1.0, 2.0, 3.0], [1.0, 1.0, 1.0, 1.0])
+    first_x_data, first_y_data = stitch.spectrum()
+    first_y_data = first_y_data.copy()
+    stitch.add_segment([2.0, 3.0, 4.0, 5.0], [3.0, 3.0, 3.0, 3.0])
+    second_x_data, second_y_data = stitch.spectrum()
+
+    # assert
+    np.testing.assert_array_equal(first_x_data, [0.0, 1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(first_y_data, [1.0, 1.0, 1.0, 1.0])
+    np.testing.assert_array_equal(second_x_data, [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    np.testing.assert_array_equal(second_y_data, [1.0, 1.0, 2.0, 2.0, 3.0, 3.0])
+
+
+def test_incremental_linear_stitch_without_overlap_raises():
+    # arrange
+    stitch = IncrementalLinearStitch()
+    stitch.add_segment([0.0, 1.0], [1.0, 1.0])
+
+    # act
+    # assert
+    with pytest.raises(Exception, match='No overlapping region'):
+        stitch.add_segment([2.0, 3.0], [1.0, 1.0])
@@ -4,6 +4,7 @@
 # Look at /test/conftest.py for the definition of fake_icl_exe
 
 
+from horiba_sdk.core.discovery_cache import DiscoveryCache
 from horiba_sdk.devices.ccd_discovery import ChargeCoupledDevicesDiscovery
 from horiba_sdk.icl_error import FakeErrorDB
 
@@ -18,3 +19,30 @@ async def test_ccd_discovery_executes(fake_icl_exe, fake_device_manager):  # noq
 
     # assert
     assert len(ccd_discovery.charge_coupled_devices()) != 0
+
+
+async def test_ccd_discovery_skips_discover_when_the_devices_are_cached(
+    fake_icl_exe,  # noqa: ARG001
+    fake_device_manager,
+    tmp_path,
+    monkeypatch,
+):
+    # arrange
+    discovery_cache = DiscoveryCache(tmp_path / 'discovery_cache.json')
+    await ChargeCoupledDevicesDiscovery(fake_device_manager.communicator, FakeErrorDB(), discovery_cache).execute()
+    sent_commands = []
+    send = fake_device_manager.communicator.send
+
+    async def recording_send(command):
+        sent_commands.append(command.command)
+        await send(command)
+
+    monkeypatch.setattr(fake_device_manager.communicator, 'send', recording_send)
+    ccd_discovery = ChargeCoupledDevicesDiscovery(fake_device_manager.communicator, FakeErrorDB(), discovery_cache)
+
+    # act
+    await ccd_discovery.execute()
+
+    # assert
+    assert sent_commands == ['ccd_listCount', 'ccd_list']
+    assert len(ccd_discovery.charge_coupled_devices()) == 1
@@ -1,7 +1,10 @@
 # pylint: skip-file
 
+import asyncio
 import os
+import struct
 
+import numpy as np
 import psutil
 import pytest
 
@@ -39,3 +42,157 @@ async def test_device_manager_with_fake_icl_exe(event_loop, fake_icl_exe, fake_i
     assert len(device_manager.monochromators) == 1  # defined in horiba_sdk/devices/fake_responses/monochromator.json
 
     await device_manager.stop()
+
+
+async def test_device_manager_routes_binary_frames_to_ccd(
+    event_loop,  # noqa: ARG001
+    fake_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+):
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    await device_manager.start()
+    ccd = device_manager.charge_coupled_devices[0]
+    values = np.arange(1024, dtype='<u4')
+    message = struct.pack('<HHHI4H', 0x1CE1, 2, 4, len(values), ccd.id(), 0, 0, 0) + values.tobytes()
+
+    await device_manager._binary_message_callback(message)
+    frame = await ccd.get_binary_frame(timeout=1)
+
+    np.testing.assert_array_equal(frame.data(), values)
+
+    await device_manager.stop()
+
+
+async def test_device_manager_discovers_device_families_concurrently(
+    event_loop,  # noqa: ARG001
+    fake_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    monkeypatch,
+):
+    # arrange
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    await device_manager.start()
+    communicator = device_manager.communicator
+    sent_commands = []
+    send = communicator.send
+
+    async def recording_send(command):
+        sent_commands.append(command.command)
+        await send(command)
+
+    monkeypatch.setattr(communicator, 'send', recording_send)
+
+    # act
+    await device_manager.discover_devices()
+
+    # assert
+    assert set(sent_commands[:2]) == {'ccd_discover', 'mono_discover'}
+    assert len(device_manager.charge_coupled_devices) == 1
+    assert len(device_manager.monochromators) == 1
+
+    await device_manager.stop()
+
+
+async def test_device_manager_open_all_opens_and_closes_every_device(
+    event_loop,  # noqa: ARG001
+    fake_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    monkeypatch,
+):
+    # arrange
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    await device_manager.start()
+    communicator = device_manager.communicator
+    sent_commands = []
+    send = communicator.send
+
+    async def recording_send(command):
+        sent_commands.append(command.command)
+        await send(command)
+
+    monkeypatch.setattr(communicator, 'send', recording_send)
+
+    # act
+    async with device_manager.open_all(timeout=5) as devices:
+        opened_ccd = await devices.charge_coupled_devices[0].is_open()
+        opened_mono = await devices.monochromators[0].is_open()
+
+    # assert
+    assert opened_ccd
+    assert opened_mono
+    assert set(sent_commands[:2]) == {'ccd_open', 'mono_open'}
+    assert {'ccd_close', 'mono_close'} <= set(sent_commands)
+
+    await device_manager.stop()
+
+
+async def test_device_manager_open_all_closes_opened_devices_on_failure(
+    event_loop,  # noqa: ARG001
+    fake_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    monkeypatch,
+):
+    # arrange
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    await device_manager.start()
+    ccd = device_manager.charge_coupled_devices[0]
+    mono = device_manager.monochromators[0]
+    closed_devices = []
+    close = ccd.close
+
+    async def failing_open():
+        raise Exception('mono not powered')
+
+    async def recording_close():
+        closed_devices.append(ccd)
+        await close()
+
+    monkeypatch.setattr(mono, 'open', failing_open)
+    monkeypatch.setattr(ccd, 'close', recording_close)
+
+    # act
+    with pytest.raises(Exception, match='Failed to open 1 device') as error:
+        await device_manager.open_all(timeout=5)
+
+    # assert
+    assert 'Monochromator #0: mono not powered' in str(error.value)
+    assert closed_devices == [ccd]
+
+    await device_manager.stop()
+
+
+async def test_device_manager_open_all_closes_devices_not_opened_in_time(
+    event_loop,  # noqa: ARG001
+    fake_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    monkeypatch,
+):
+    # arrange
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    await device_manager.start()
+    mono = device_manager.monochromators[0]
+    closed_devices = []
+
+    async def slow_open():
+        await asyncio.sleep(0.5)
+
+    async def recording_close():
+        closed_devices.append(mono)
+
+    monkeypatch.setattr(mono, 'open', slow_open)
+    monkeypatch.setattr(mono, 'close', recording_close)
+
+    # act
+    with pytest.raises(Exception, match='Failed to open 1 device') as error:
+        await device_manager.open_all(timeout=0.1)
+
+    # assert
+    assert 'Monochromator #0: no answer within 0.1s' in str(error.value)
+    assert closed_devices == [mono]
+
+    await device_manager.stop()
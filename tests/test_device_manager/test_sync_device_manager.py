@@ -1,11 +1,14 @@
 # pylint: skip-file
 
 import os
+import threading
+import time
 
 import psutil
 import pytest
 
 from horiba_sdk.communication import Command
+from horiba_sdk.core.discovery_cache import DiscoveryCache
 from horiba_sdk.sync.devices import DeviceManager
 
 
@@ -39,3 +42,175 @@ def test_device_manager_with_fake_icl_exe(fake_sync_icl_exe, fake_icl_host_fixtu
 
     device_manager.stop()
     assert not communicator.opened()
+
+
+def test_device_manager_discovers_device_families_concurrently(
+    fake_sync_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    monkeypatch,
+):
+    # arrange
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    device_manager.start()
+    communicator = device_manager.communicator
+    sent_commands = []
+    send = communicator.send
+
+    def recording_send(command):
+        sent_commands.append(command.command)
+        send(command)
+
+    monkeypatch.setattr(communicator, 'send', recording_send)
+
+    # act
+    device_manager.discover_devices()
+
+    # assert
+    assert sent_commands == ['ccd_discover', 'mono_discover', 'ccd_list', 'mono_list']
+    assert len(device_manager.charge_coupled_devices) == 1
+    assert len(device_manager.monochromators) == 1
+
+    device_manager.stop()
+
+
+def test_device_manager_with_discovery_cache_skips_enumeration(
+    fake_sync_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    tmp_path,
+    monkeypatch,
+):
+    # arrange
+    discovery_cache = DiscoveryCache(tmp_path / 'discovery_cache.json')
+    device_manager = DeviceManager(
+        start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture, discovery_cache=discovery_cache
+    )
+    device_manager.start()
+    communicator = device_manager.communicator
+    sent_commands = []
+    send = communicator.send
+
+    def recording_send(command):
+        sent_commands.append(command.command)
+        send(command)
+
+    monkeypatch.setattr(communicator, 'send', recording_send)
+
+    # act
+    device_manager.discover_devices()
+    with device_manager.charge_coupled_devices[0] as ccd:
+        ccd.configuration()
+    with device_manager.charge_coupled_devices[0] as ccd:
+        ccd.configuration()
+
+    # assert
+    assert 'ccd_discover' not in sent_commands
+    assert 'mono_discover' not in sent_commands
+    assert sent_commands.count('ccd_getConfig') == 1
+    assert len(device_manager.monochromators) == 1
+
+    device_manager.stop()
+
+
+def test_device_manager_open_all_opens_and_closes_every_device(
+    fake_sync_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    monkeypatch,
+):
+    # arrange
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    device_manager.start()
+    communicator = device_manager.communicator
+    sent_commands = []
+    send = communicator.send
+
+    def recording_send(command):
+        sent_commands.append((command.command, threading.get_ident()))
+        send(command)
+
+    monkeypatch.setattr(communicator, 'send', recording_send)
+
+    # act
+    with device_manager.open_all(timeout_in_s=5) as devices:
+        opened_ccd = devices.charge_coupled_devices[0].is_open()
+        opened_mono = devices.monochromators[0].is_open()
+
+    # assert
+    assert opened_ccd
+    assert opened_mono
+    threads_by_command = dict(sent_commands)
+    assert len({threads_by_command['ccd_open'], threads_by_command['mono_open'], threading.get_ident()}) == 3
+    assert {'ccd_close', 'mono_close'} <= set(threads_by_command)
+
+    device_manager.stop()
+
+
+def test_device_manager_open_all_reports_devices_not_opened_in_time(
+    fake_sync_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    monkeypatch,
+):
+    # arrange
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    device_manager.start()
+    ccd = device_manager.charge_coupled_devices[0]
+    mono = device_manager.monochromators[0]
+    events = []
+    close = ccd.close
+
+    def slow_open():
+        time.sleep(0.5)
+        events.append('mono opened')
+
+    def recording_close():
+        events.append('ccd closed')
+        close()
+
+    def recording_mono_close():
+        events.append('mono closed')
+
+    monkeypatch.setattr(mono, 'open', slow_open)
+    monkeypatch.setattr(mono, 'close', recording_mono_close)
+    monkeypatch.setattr(ccd, 'close', recording_close)
+
+    # act
+    with pytest.raises(Exception, match='Failed to open 1 device') as error:
+        device_manager.open_all(timeout_in_s=0.1)
+
+    # assert
+    assert 'Monochromator #0: no answer within 0.1s' in str(error.value)
+    assert events[0] == 'mono opened'
+    assert sorted(events[1:]) == ['ccd closed', 'mono closed']
+
+    device_manager.stop()
+
+
+def test_device_manager_discovery_gives_each_command_its_timeout(
+    fake_sync_icl_exe,  # noqa: ARG001
+    fake_icl_host_fixture,
+    fake_icl_port_fixture,
+    monkeypatch,
+):
+    # arrange
+    device_manager = DeviceManager(start_icl=False, icl_ip=fake_icl_host_fixture, icl_port=fake_icl_port_fixture)
+    device_manager.start()
+    communicator = device_manager.communicator
+    timeouts_in_s = []
+    request_with_responses = communicator.request_with_responses
+
+    def recording_request_with_responses(commands, response_timeout_s=5):
+        timeouts_in_s.append((len(commands), response_timeout_s))
+        return request_with_responses(commands, response_timeout_s)
+
+    monkeypatch.setattr(communicator, 'request_with_responses', recording_request_with_responses)
+
+    # act
+    device_manager.discover_devices()
+
+    # assert
+    assert timeouts_in_s == [(2, 10), (2, 10)]
+
+    device_manager.stop()
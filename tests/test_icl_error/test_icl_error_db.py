@@ -51,3 +51,17 @@ def test_icl_error_db_error_from():
 
     # assert
     assert icl_error.message() == 'ICL error: no parser found'
+
+
+def test_icl_error_db_error_from_returns_the_prebuilt_error():
+    # arrange
+    error_list_path = importlib.resources.files('horiba_sdk.icl_error') / 'error_list.json'
+    icl_error_db = ICLErrorDB(error_list_path)
+
+    # act
+    first_error = icl_error_db.error_from('[E];-2;ICL error: unknown command')
+    second_error = icl_error_db.error_from('[E];-2;ICL error: unknown command')
+
+    # assert
+    assert first_error is second_error
+    assert first_error.message() == 'ICL error: unknown command'
@@ -0,0 +1,54 @@
+# pylint: skip-file
+import json
+import subprocess
+import sys
+
+import pytest
+
+_HEAVY_MODULES = ['numpy', 'websockets', 'psutil', 'loguru', 'importlib.metadata']
+
+
+def _import(statement: str) -> list[str]:
+    """Runs the statement in a new interpreter.
+
+    Returns:
+        list[str]: The imported modules
+    """
+    completed = subprocess.run(
+        [sys.executable, '-c', f'{statement}; import sys, json; print(json.dumps(list(sys.modules)))'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+@pytest.mark.parametrize(
+    'statement', ['import horiba_sdk', 'import horiba_sdk.devices', 'import horiba_sdk.sync.devices']
+)
+def test_importing_packages_does_not_import_heavy_dependencies(statement):
+    # arrange
+    # act
+    imported_modules = _import(statement)
+
+    # assert
+    assert [module for module in _HEAVY_MODULES if module in imported_modules] == []
+
+
+def test_importing_communication_messages_does_not_import_heavy_dependencies():
+    # arrange
+    # act
+    imported_modules = _import('from horiba_sdk.communication import Command, Response')
+
+    # assert
+    assert [module for module in ['numpy', 'websockets', 'psutil'] if module in imported_modules] == []
+
+
+def test_device_manager_is_imported_on_first_use():
+    # arrange
+    # act
+    imported_modules = _import('from horiba_sdk.devices import DeviceManager')
+
+    # assert
+    assert 'horiba_sdk.devices.device_manager' in imported_modules
+    assert 'psutil' not in imported_modules
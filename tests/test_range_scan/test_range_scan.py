@@ -0,0 +1,72 @@
+# pylint: skip-file
+# Important note: the fake_icl_exe will return the contents of the
+# horiba_sdk/devices/fake_responses/ccd.json and monochromator.json
+from horiba_sdk.devices import RangeScan
+
+
+async def test_range_scan(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_device_manager.communicator.request_with_response
+
+    async def recording_request_with_response(command, timeout=5):
+        sent_commands.append(command.command)
+        return await request_with_response(command, timeout)
+
+    mono = fake_device_manager.monochromators[0]
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        await mono.open()
+        monkeypatch.setattr(fake_device_manager.communicator, 'request_with_response', recording_request_with_response)
+        scan = RangeScan(ccd, mono, 200, 600, timeout=5)
+
+        # act
+        result = await scan.run()
+        await mono.close()
+
+    # assert
+    assert [step.center_wavelength for step in result.steps] == [300.0, 450.0, 600.0]
+    assert result.segments == []
+    assert result.x_data.shape == result.y_data.shape == (1000,)
+    assert sent_commands.count('mono_moveToPosition') == 3
+    assert sent_commands.count('ccd_setCenterWavelength') == 3
+
+
+async def test_range_scan_moves_the_mono_before_the_readout(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_device_manager.communicator.request_with_response
+
+    async def recording_request_with_response(command, timeout=5):
+        sent_commands.append(command.command)
+        return await request_with_response(command, timeout)
+
+    mono = fake_device_manager.monochromators[0]
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        await mono.open()
+        monkeypatch.setattr(fake_device_manager.communicator, 'request_with_response', recording_request_with_response)
+
+        scan = RangeScan(ccd, mono, 200, 600, keep_segments=True, timeout=5)
+
+        # act
+        result = await scan.run()
+        await mono.close()
+
+    # assert
+    assert len(result.segments) == 3
+    assert scan.stitch.segment_count == 3
+    step_commands = [
+        command
+        for command in sent_commands
+        if command in ('mono_moveToPosition', 'ccd_setAcquisitionStart', 'ccd_getAcquisitionData')
+    ]
+    assert step_commands == [
+        'mono_moveToPosition',
+        'ccd_setAcquisitionStart',
+        'mono_moveToPosition',
+        'ccd_getAcquisitionData',
+        'ccd_setAcquisitionStart',
+        'mono_moveToPosition',
+        'ccd_getAcquisitionData',
+        'ccd_setAcquisitionStart',
+        'ccd_getAcquisitionData',
+    ]
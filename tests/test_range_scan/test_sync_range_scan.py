@@ -0,0 +1,40 @@
+# pylint: skip-file
+# Important note: the fake_sync_icl_exe will return the contents of the
+# horiba_sdk/devices/fake_responses/ccd.json and monochromator.json
+from horiba_sdk.sync.devices import RangeScan
+
+
+def test_range_scan(fake_sync_icl_exe, fake_sync_device_manager, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_sync_device_manager.communicator.request_with_response
+
+    def recording_request_with_response(command, response_timeout_s=5):
+        sent_commands.append(command.command)
+        return request_with_response(command, response_timeout_s)
+
+    mono = fake_sync_device_manager.monochromators[0]
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        mono.open()
+        monkeypatch.setattr(
+            fake_sync_device_manager.communicator, 'request_with_response', recording_request_with_response
+        )
+
+        # act
+        result = RangeScan(ccd, mono, 200, 600, timeout_in_s=5).run()
+        mono.close()
+
+    # assert
+    assert [step.center_wavelength for step in result.steps] == [300.0, 450.0, 600.0]
+    assert result.x_data.shape == result.y_data.shape == (1000,)
+    step_commands = [
+        command
+        for command in sent_commands
+        if command in ('mono_moveToPosition', 'ccd_setAcquisitionStart', 'ccd_getAcquisitionData')
+    ]
+    assert step_commands[:4] == [
+        'mono_moveToPosition',
+        'ccd_setAcquisitionStart',
+        'mono_moveToPosition',
+        'ccd_getAcquisitionData',
+    ]
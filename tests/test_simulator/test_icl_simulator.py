@@ -0,0 +1,242 @@
+# pylint: skip-file
+import asyncio
+import json
+import threading
+
+import numpy as np
+
+from horiba_sdk.communication import BinaryFrame
+from horiba_sdk.core.x_axis_conversion_type import XAxisConversionType
+from horiba_sdk.devices import DeviceManager, ICLSimulator, ICLSimulatorServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _execute(session, command, **parameters):
+    messages = session.handle(json.dumps({'id': 1, 'command': command, 'parameters': parameters}))
+    return json.loads(messages[0]), messages[1:]
+
+
+def test_settings_are_kept_between_commands():
+    # arrange
+    session = ICLSimulator().session()
+
+    # act
+    _execute(session, 'ccd_setExposureTime', index=0, time=250)
+    _execute(session, 'mono_setPosition', index=0, wavelength=512.5)
+    exposure, _ = _execute(session, 'ccd_getExposureTime', index=0)
+    position, _ = _execute(session, 'mono_getPosition', index=0)
+
+    # assert
+    assert exposure['results'] == {'time': 250}
+    assert position['results'] == {'wavelength': 512.5}
+
+
+def test_state_is_shared_between_sessions():
+    # arrange
+    simulator = ICLSimulator()
+    first_session = simulator.session()
+    second_session = simulator.session()
+
+    # act
+    _execute(first_session, 'ccd_setExposureTime', index=0, time=42)
+    response, _ = _execute(second_session, 'ccd_getExposureTime', index=0)
+
+    # assert
+    assert response['results'] == {'time': 42}
+
+
+def test_acquisition_is_busy_for_the_exposure_time():
+    # arrange
+    clock = FakeClock()
+    session = ICLSimulator(clock=clock).session()
+    _execute(session, 'ccd_open', index=0)
+    _execute(session, 'ccd_setExposureTime', index=0, time=500)
+
+    # act
+    _execute(session, 'ccd_setAcquisitionStart', index=0, openShutter=True)
+    busy_during_exposure, _ = _execute(session, 'ccd_getAcquisitionBusy', index=0)
+    clock.now += 0.6
+    busy_after_exposure, _ = _execute(session, 'ccd_getAcquisitionBusy', index=0)
+
+    # assert
+    assert busy_during_exposure['results'] == {'isBusy': True}
+    assert busy_after_exposure['results'] == {'isBusy': False}
+
+
+def test_acquisition_data_is_an_error_while_acquiring():
+    # arrange
+    clock = FakeClock()
+    session = ICLSimulator(clock=clock).session()
+    _execute(session, 'ccd_open', index=0)
+    _execute(session, 'ccd_setExposureTime', index=0, time=500)
+    _execute(session, 'ccd_setAcquisitionStart', index=0, openShutter=True)
+
+    # act
+    data_during_exposure, _ = _execute(session, 'ccd_getAcquisitionData', index=0)
+    clock.now += 0.6
+    data_after_exposure, _ = _execute(session, 'ccd_getAcquisitionData', index=0)
+
+    # assert
+    assert data_during_exposure['errors'] == ['[E];-309;CCD error: acquiring']
+    assert data_after_exposure['errors'] == []
+    assert data_after_exposure['results']['acquisition']
+
+
+def test_acquisition_data_is_generated_outside_of_the_simulator_lock(monkeypatch):
+    # arrange
+    simulator = ICLSimulator(ccd_count=2)
+    first_session = simulator.session()
+    second_session = simulator.session()
+    generating = threading.Event()
+    other_ccd_answered = threading.Event()
+    answered_while_generating = []
+    roi_data = ICLSimulator._roi_data
+
+    def slow_roi_data(self, ccd, roi):
+        if ccd.index == 0:
+            generating.set()
+            answered_while_generating.append(other_ccd_answered.wait(1))
+        return roi_data(self, ccd, roi)
+
+    monkeypatch.setattr(ICLSimulator, '_roi_data', slow_roi_data)
+
+    def acquire_from_first_ccd():
+        _execute(first_session, 'ccd_getAcquisitionData', index=0)
+
+    acquisition = threading.Thread(target=acquire_from_first_ccd)
+    acquisition.start()
+    generating.wait(1)
+
+    # act
+    response, _ = _execute(second_session, 'ccd_getExposureTime', index=1)
+    other_ccd_answered.set()
+    acquisition.join()
+
+    # assert
+    assert response['results'] == {'time': 0}
+    assert answered_while_generating == [True]
+
+
+def test_monochromator_is_busy_while_moving():
+    # arrange
+    clock = FakeClock()
+    session = ICLSimulator(move_speed_nm_per_s=100.0, clock=clock).session()
+    _execute(session, 'mono_open', index=0)
+
+    # act
+    _execute(session, 'mono_moveToPosition', index=0, wavelength=520.0)
+    busy_while_moving, _ = _execute(session, 'mono_isBusy', index=0)
+    clock.now += 1.0
+    position_while_moving, _ = _execute(session, 'mono_getPosition', index=0)
+    clock.now += 1.5
+    busy_after_move, _ = _execute(session, 'mono_isBusy', index=0)
+    position_after_move, _ = _execute(session, 'mono_getPosition', index=0)
+
+    # assert
+    assert busy_while_moving['results'] == {'busy': True}
+    assert position_while_moving['results']['wavelength'] == 420.0
+    assert busy_after_move['results'] == {'busy': False}
+    assert position_after_move['results']['wavelength'] == 520.0
+
+
+def test_acquisition_data_has_the_size_of_the_region_of_interest():
+    # arrange
+    session = ICLSimulator().session()
+    _execute(session, 'ccd_setRoi', index=0, roiIndex=1, xOrigin=0, yOrigin=0, xSize=512, ySize=64, xBin=2, yBin=16)
+
+    # act
+    response, binary_messages = _execute(session, 'ccd_getAcquisitionData', index=0)
+
+    # assert
+    roi = response['results']['acquisition'][0]['roi'][0]
+    assert binary_messages == []
+    assert len(roi['xData'][0]) == 256
+    assert np.array(roi['yData']).shape == (4, 256)
+
+
+def test_acquisition_data_is_sent_as_binary_frames_in_binary_mode():
+    # arrange
+    session = ICLSimulator().session()
+    _execute(session, 'icl_binMode', mode='all')
+    _execute(session, 'ccd_setRoi', index=0, roiIndex=1, xOrigin=0, yOrigin=0, xSize=100, ySize=10, xBin=1, yBin=1)
+
+    # act
+    response, binary_messages = _execute(session, 'ccd_getAcquisitionData', index=0)
+
+    # assert
+    roi = response['results']['acquisition'][0]['roi'][0]
+    assert 'yData' not in roi
+    x_frame, y_frame = (BinaryFrame.from_bytes(message) for message in binary_messages)
+    assert x_frame.tags == (0, 1, 1, 0)
+    assert x_frame.data().shape == (100,)
+    assert y_frame.tags == (0, 1, 1, 1)
+    assert y_frame.data().size == 100 * 10
+
+
+def test_invalid_index_and_unknown_command_are_errors():
+    # arrange
+    session = ICLSimulator().session()
+
+    # act
+    invalid_ccd, _ = _execute(session, 'ccd_getExposureTime', index=3)
+    invalid_mono, _ = _execute(session, 'mono_getPosition', index=3)
+    unknown, _ = _execute(session, 'ccd_doesNotExist', index=0)
+
+    # assert
+    assert invalid_ccd['errors'] == ['[E];-307;CCD error: invalid device index']
+    assert invalid_mono['errors'] == ['[E];-508;MONO error: invalid device index']
+    assert unknown['errors'] == ['[E];-2;ICL error: unknown command']
+
+
+async def test_device_manager_acquires_from_simulator():
+    async with ICLSimulatorServer() as server:
+        # arrange
+        device_manager = DeviceManager(start_icl=False, icl_port=str(server.port))
+        await device_manager.start()
+        async with device_manager.open_all(timeout=5) as devices:
+            ccd = devices.charge_coupled_devices[0]
+            await ccd.set_exposure_time(10)
+            await ccd.set_x_axis_conversion_type(XAxisConversionType.NONE)
+            await ccd.set_center_wavelength(546.0)
+            await ccd.set_region_of_interest(1, 412, 0, 200, 20, 1, 20)
+
+            # act
+            acquisitions = await ccd.acquire(timeout=5)
+
+        await device_manager.stop()
+
+    # assert
+    roi = acquisitions[0].regions_of_interest[0]
+    assert roi.x_data.shape == roi.y_data.shape == (1, 200)
+    assert roi.y_data.max() > roi.y_data.min()
+
+
+async def test_simulator_serves_concurrent_clients():
+    # each client acquires from its own CCD, a CCD can only run one acquisition at a time
+    async with ICLSimulatorServer(simulator=ICLSimulator(ccd_count=4)) as server:
+        # arrange
+        device_managers = [DeviceManager(start_icl=False, icl_port=str(server.port)) for _ in range(4)]
+        await asyncio.gather(*(device_manager.start() for device_manager in device_managers))
+
+        async def acquire(device_manager, ccd_index):
+            ccd = device_manager.charge_coupled_devices[ccd_index]
+            await ccd.open()
+            return await ccd.acquire(timeout=5)
+
+        # act
+        results = await asyncio.gather(
+            *(acquire(device_manager, index) for index, device_manager in enumerate(device_managers))
+        )
+
+        await asyncio.gather(*(device_manager.stop() for device_manager in device_managers))
+
+    # assert
+    assert len(results) == 4
+    assert all(result[0].regions_of_interest[0].y_data.size > 0 for result in results)
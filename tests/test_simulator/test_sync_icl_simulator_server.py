@@ -0,0 +1,49 @@
+# pylint: skip-file
+from concurrent.futures import ThreadPoolExecutor
+
+from horiba_sdk.core.x_axis_conversion_type import XAxisConversionType
+from horiba_sdk.devices import ICLSimulator
+from horiba_sdk.sync.devices import DeviceManager, ICLSimulatorServer
+
+
+def test_device_manager_acquires_from_simulator():
+    with ICLSimulatorServer() as server:
+        # arrange
+        device_manager = DeviceManager(start_icl=False, icl_port=str(server.port))
+        device_manager.start()
+        with device_manager.open_all(timeout_in_s=5) as devices:
+            ccd = devices.charge_coupled_devices[0]
+            ccd.set_exposure_time(10)
+            ccd.set_x_axis_conversion_type(XAxisConversionType.NONE)
+            ccd.set_region_of_interest(1, 0, 0, 200, 20, 1, 20)
+
+            # act
+            acquisitions = ccd.acquire(timeout_in_s=5)
+
+        device_manager.stop()
+
+    # assert
+    roi = acquisitions[0].regions_of_interest[0]
+    assert roi.x_data.shape == roi.y_data.shape == (1, 200)
+
+
+def test_simulator_serves_concurrent_clients():
+    # each client acquires from its own CCD, a CCD can only run one acquisition at a time
+    with ICLSimulatorServer(simulator=ICLSimulator(ccd_count=4)) as server:
+        # arrange
+        def acquire(client_index):
+            device_manager = DeviceManager(start_icl=False, icl_port=str(server.port))
+            device_manager.start()
+            try:
+                with device_manager.charge_coupled_devices[client_index] as ccd:
+                    return ccd.acquire(timeout_in_s=5)
+            finally:
+                device_manager.stop()
+
+        # act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(acquire, range(4)))
+
+    # assert
+    assert len(results) == 4
+    assert all(result[0].regions_of_interest[0].y_data.size > 0 for result in results)
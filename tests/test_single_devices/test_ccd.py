@@ -3,7 +3,18 @@
 # horiba_sdk/devices/fake_responses/ccd.json
 # Look at /test/conftest.py for the definition of fake_icl_exe
 
+import asyncio
+import struct
+
+import numpy as np
+import pytest
+
+from horiba_sdk.communication import BinaryFrame, Response
+from horiba_sdk.core.acquisition_data import AcquisitionData, AcquisitionRingBuffer, RegionOfInterestData
+from horiba_sdk.core.ccd_configuration import ChargeCoupledDeviceConfiguration
 from horiba_sdk.core.clean_count_mode import CleanCountMode
+from horiba_sdk.core.command_batch import batched_commands
+from horiba_sdk.core.data_retrieval_method import DataRetrievalMethod
 from horiba_sdk.core.timer_resolution import TimerResolution
 from horiba_sdk.core.x_axis_conversion_type import XAxisConversionType
 
@@ -180,3 +191,360 @@ async def test_ccd_acquisition_busy(fake_device_manager, fake_icl_exe):  # noqa:
 
         # assert
         assert not acquisition_busy
+
+
+async def test_ccd_batch_configuration(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        async with ccd.batch():
+            await ccd.set_timer_resolution(TimerResolution._1000_MICROSECONDS)
+            await ccd.set_exposure_time(100)
+            await ccd.set_gain(0)
+            await ccd.set_speed(2)
+            await ccd.set_x_axis_conversion_type(XAxisConversionType.NONE)
+
+        # assert
+        assert await ccd.get_gain_token() == 0
+
+
+async def test_ccd_batch_is_sent_in_one_request(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_batches = []
+    communicator = fake_device_manager.communicator
+    request_with_responses = communicator.request_with_responses
+
+    async def recording_request_with_responses(commands, timeout=5):
+        sent_batches.append([command.command for command in commands])
+        return await request_with_responses(commands, timeout)
+
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        monkeypatch.setattr(communicator, 'request_with_responses', recording_request_with_responses)
+
+        # act
+        async with ccd.batch():
+            await ccd.set_exposure_time(100)
+            await ccd.set_gain(0)
+            await ccd.set_speed(2)
+
+        # assert
+        assert sent_batches == [['ccd_setExposureTime', 'ccd_setGain', 'ccd_setSpeed']]
+
+
+async def test_ccd_batch_failure_raises_and_closes_the_batch(
+    fake_device_manager,
+    fake_icl_exe,  # noqa: ARG001
+    monkeypatch,
+):
+    # arrange
+    async def failing_request_with_responses(commands, timeout=5):  # noqa: ARG001
+        return [
+            Response(command.id, command.command, errors=['[E];-2;ICL error: unknown command'] if index == 1 else [])
+            for index, command in enumerate(commands)
+        ]
+
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        monkeypatch.setattr(fake_device_manager.communicator, 'request_with_responses', failing_request_with_responses)
+
+        # act
+        with pytest.raises(Exception, match='ccd_setGain'):
+            async with ccd.batch():
+                await ccd.set_exposure_time(100)
+                await ccd.set_gain(0)
+        monkeypatch.undo()
+
+        # assert
+        assert batched_commands(id(ccd)) is None
+        async with ccd.batch():
+            await ccd.set_exposure_time(100)
+
+
+async def test_ccd_getter_inside_batch_raises(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        with pytest.raises(Exception, match='cannot be used inside a batch'):
+            async with ccd.batch():
+                await ccd.get_gain_token(refresh=True)
+
+        # assert
+        assert batched_commands(id(ccd)) is None
+
+
+async def test_ccd_batch_does_not_capture_other_coroutines(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        batch_opened = asyncio.Event()
+
+        async def read_gain():
+            await batch_opened.wait()
+            return await ccd.get_gain_token(refresh=True)
+
+        gain_task = asyncio.create_task(read_gain())
+
+        # act
+        async with ccd.batch():
+            await ccd.set_exposure_time(100)
+            batch_opened.set()
+            gain = await asyncio.wait_for(gain_task, 1)
+
+        # assert
+        assert gain == 0
+
+
+async def test_ccd_data_retrieval_method(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        await ccd.set_data_retrieval_method(DataRetrievalMethod.JSON)
+        method = await ccd.get_data_retrieval_method()
+
+        # assert
+        assert method == DataRetrievalMethod.JSON
+
+
+async def test_ccd_acquisition_data_arrays_from_json(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        acquisitions = await ccd.get_acquisition_data_arrays()
+
+        # assert
+        roi = acquisitions[0].regions_of_interest[0]
+        assert acquisitions[0].acquisition_index == 1
+        assert (roi.x_origin, roi.x_size, roi.x_binning, roi.y_binning) == (0, 1000, 1, 200)
+        assert isinstance(roi.y_data, np.ndarray)
+        assert roi.x_data.shape == (1, 1000)
+        assert roi.y_data.shape == (1, 1000)
+
+
+async def test_ccd_acquisition_data_arrays_from_binary_frames(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    ccd = fake_device_manager.charge_coupled_devices[0]
+    roi = {'roiIndex': 1, 'xOrigin': 0, 'yOrigin': 0, 'xSize': 8, 'ySize': 4, 'xBinning': 1, 'yBinning': 2}
+    x_values = np.arange(8, dtype='<f4')
+    y_values = np.arange(16, dtype='<u4')
+
+    def binary_message(axis, element_type, values):
+        header = struct.pack('<HHHI4H', 0x1CE1, 2, element_type, len(values), ccd.id(), 1, 1, axis)
+        return header + values.tobytes()
+
+    async def request_with_response(command, timeout=5):  # noqa: ARG001
+        # the ICL sends the data as binary frames and only the metadata in the JSON response
+        ccd.receive_binary_frame(BinaryFrame.from_bytes(binary_message(1, 4, y_values)))
+        ccd.receive_binary_frame(BinaryFrame.from_bytes(binary_message(0, 5, x_values)))
+        return Response(command.id, command.command, {'acquisition': [{'acqIndex': 1, 'roi': [roi]}]})
+
+    monkeypatch.setattr(fake_device_manager.communicator, 'request_with_response', request_with_response)
+
+    # act
+    acquisitions = await ccd.get_acquisition_data_arrays(timeout=1)
+
+    # assert
+    roi_data = acquisitions[0].regions_of_interest[0]
+    assert roi_data.y_binning == 2
+    np.testing.assert_array_equal(roi_data.x_data, x_values.reshape(1, 8))
+    np.testing.assert_array_equal(roi_data.y_data, y_values.reshape(2, 8))
+
+
+async def test_ccd_binary_frames_waiting_for_retrieval_are_bounded(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    monkeypatch.setattr('horiba_sdk.devices.single_devices.ccd._MAX_PENDING_BINARY_FRAMES', 2)
+    ccd = fake_device_manager.charge_coupled_devices[0]
+
+    def binary_frame(value):
+        values = np.array([value], dtype='<u4')
+        return BinaryFrame.from_bytes(struct.pack('<HHHI4H', 0x1CE1, 2, 4, 1, ccd.id(), 1, 1, 1) + values.tobytes())
+
+    # act
+    for value in range(3):
+        ccd.receive_binary_frame(binary_frame(value))
+    frames = [await ccd.get_binary_frame(timeout=1) for _ in range(2)]
+
+    # assert
+    assert [frame.data()[0] for frame in frames] == [1, 2]
+
+
+async def test_ccd_settings_are_cached(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_device_manager.communicator.request_with_response
+
+    async def recording_request_with_response(command, timeout=5):
+        sent_commands.append(command.command)
+        return await request_with_response(command, timeout)
+
+    monkeypatch.setattr(fake_device_manager.communicator, 'request_with_response', recording_request_with_response)
+
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        await ccd.set_exposure_time(100)
+        cached_exposure_time = await ccd.get_exposure_time()
+        first_gain = await ccd.get_gain_token()
+        second_gain = await ccd.get_gain_token()
+        refreshed_exposure_time = await ccd.get_exposure_time(refresh=True)
+
+        # assert
+        assert cached_exposure_time == 100
+        assert first_gain == second_gain == 0
+        assert refreshed_exposure_time == 0
+        assert sent_commands.count('ccd_getGain') == 1
+        assert sent_commands.count('ccd_getExposureTime') == 1
+
+
+async def test_ccd_settings_cache_is_cleared_by_restart(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        await ccd.set_exposure_time(100)
+
+        # act
+        await ccd.restart()
+
+        # assert
+        assert await ccd.get_exposure_time() == 0
+
+
+async def test_ccd_configuration_is_indexed_by_token(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        configuration = ccd.configuration()
+
+        # assert
+        assert configuration.gains[2] == 'High Sensitivity'
+        assert configuration.speeds[127] == '500 kHz Wrap'
+        assert configuration.triggers[0].events[1].signal_types[0] == 'TTL Falling Edge'
+        assert configuration.signals[0].events[3].name == 'Shutter Open'
+        assert configuration.supports('cf_Triggers')
+        assert not configuration.supports('cf_EMCCD')
+
+
+def test_ccd_configuration_is_a_frozen_copy():
+    # arrange
+    configuration = {'gains': [{'token': 2, 'info': 'High Sensitivity'}], 'supportedFeatures': {'cf_Triggers': 'true'}}
+    ccd_configuration = ChargeCoupledDeviceConfiguration(configuration)
+
+    # act
+    configuration['gains'][0]['info'] = 'changed'
+
+    # assert
+    assert ccd_configuration.raw['gains'][0]['info'] == 'High Sensitivity'
+    with pytest.raises(TypeError):
+        ccd_configuration.raw['gains'][0]['info'] = 'changed'
+    with pytest.raises(TypeError):
+        ccd_configuration.raw['supportedFeatures']['cf_EMCCD'] = 'true'
+    with pytest.raises(AttributeError):
+        ccd_configuration.raw['gains'].append({'token': 3, 'info': 'Low Noise'})
+
+
+async def test_ccd_set_trigger_input_validates_against_configuration(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        await ccd.set_trigger_input(True, 0, 1, 1)
+
+        # assert
+        with pytest.raises(Exception, match='Trigger event 5 not found'):
+            await ccd.set_trigger_input(True, 0, 5, 0)
+        with pytest.raises(Exception, match='Signal address 3 not found'):
+            await ccd.set_signal_output(True, 3, 0, 0)
+        with pytest.raises(Exception, match='Gain token 42 not found'):
+            await ccd.set_gain(42)
+
+
+async def test_ccd_acquire(fake_device_manager, fake_icl_exe):  # noqa: ARG001
+    # arrange
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        acquisitions = await ccd.acquire(timeout=5)
+
+        # assert
+        assert acquisitions[0].acquisition_index == 1
+        assert acquisitions[0].regions_of_interest[0].y_data.shape == (1, 1000)
+
+
+async def test_ccd_acquire_waits_for_expected_duration(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    sleeps = []
+
+    async def recording_sleep(delay):
+        sleeps.append(delay)
+
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        await ccd.set_timer_resolution(TimerResolution._1000_MICROSECONDS)
+        await ccd.set_exposure_time(250)
+        await ccd.set_acquisition_count(2)
+        monkeypatch.setattr('horiba_sdk.devices.single_devices.ccd.asyncio.sleep', recording_sleep)
+
+        # act
+        await ccd.acquire()
+
+    # assert
+    assert sleeps == [0.5]
+
+
+async def test_ccd_stream(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_device_manager.communicator.request_with_response
+
+    async def recording_request_with_response(command, timeout=5):
+        sent_commands.append(command.command)
+        return await request_with_response(command, timeout)
+
+    monkeypatch.setattr(fake_device_manager.communicator, 'request_with_response', recording_request_with_response)
+
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        frames = [acquisitions async for acquisitions in ccd.stream(count=3, buffer_size=2, timeout=5)]
+
+        # assert
+        assert len(frames) == 3
+        assert frames[2][0].regions_of_interest[0].y_data.shape == (1, 1000)
+        assert sent_commands.count('ccd_setAcquisitionStart') == 3
+        assert sent_commands.count('ccd_getAcquisitionData') == 3
+        assert 'ccd_setAcquisitionAbort' not in sent_commands
+
+
+async def test_ccd_stream_aborts_when_closed_early(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_device_manager.communicator.request_with_response
+
+    async def recording_request_with_response(command, timeout=5):
+        sent_commands.append(command.command)
+        return await request_with_response(command, timeout)
+
+    monkeypatch.setattr(fake_device_manager.communicator, 'request_with_response', recording_request_with_response)
+
+    async with fake_device_manager.charge_coupled_devices[0] as ccd:
+        stream = ccd.stream(timeout=5)
+
+        # act
+        await stream.__anext__()
+        await stream.aclose()
+
+        # assert
+        assert sent_commands.count('ccd_setAcquisitionStart') == 2
+        assert sent_commands[-1] == 'ccd_setAcquisitionAbort'
+
+
+def test_acquisition_ring_buffer_reuses_its_slots():
+    # arrange
+    ring_buffer = AcquisitionRingBuffer(2)
+
+    def frame(value):
+        roi = RegionOfInterestData(1, 0, 0, 4, 1, 1, 1, np.arange(4), np.full((1, 4), value, dtype=np.uint32))
+        return [AcquisitionData(1, [roi])]
+
+    # act
+    first = ring_buffer.store(frame(1))[0].regions_of_interest[0].y_data
+    second = ring_buffer.store(frame(2))[0].regions_of_interest[0].y_data
+    third = ring_buffer.store(frame(3))[0].regions_of_interest[0].y_data
+
+    # assert
+    assert ring_buffer.frames_stored == 3
+    assert np.shares_memory(first, third)
+    assert not np.shares_memory(first, second)
+    assert (first == 3).all()
+    assert (second == 2).all()
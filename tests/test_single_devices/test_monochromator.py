@@ -1,8 +1,11 @@
 # pylint: skip-file
 # Important note: the FakeDeviceManager will return the contents of the
 # horiba_sdk/devices/fake_responses/monochromator.json
+import itertools
+
 import pytest
 
+from horiba_sdk.core.polling_schedule import PollingSchedule
 from horiba_sdk.devices.single_devices import Monochromator
 
 
@@ -175,3 +178,46 @@ async def test_monochromator_shutter_position(fake_device_manager, fake_icl_exe)
             await monochromator.get_shutter_position(Monochromator.Shutter.FIRST)
             == Monochromator.ShutterPosition.CLOSED
         )
+
+
+def test_polling_schedule_backs_off_up_to_the_maximum():
+    # arrange
+    schedule = PollingSchedule(initial_interval_s=0.01, backoff_factor=2, max_interval_s=0.05)
+
+    # act
+    intervals = list(itertools.islice(schedule.intervals(), 5))
+
+    # assert
+    assert intervals == [0.01, 0.02, 0.04, 0.05, 0.05]
+
+
+async def test_monochromator_wait_until_idle(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    busy_states = iter([True, True, False])
+
+    async def is_busy():
+        return next(busy_states)
+
+    async with fake_device_manager.monochromators[0] as monochromator:
+        monkeypatch.setattr(monochromator, 'is_busy', is_busy)
+
+        # act
+        report = await monochromator.wait_until_idle(timeout=1, schedule=PollingSchedule(initial_interval_s=0.001))
+
+    # assert
+    assert report.polls == 3
+    assert report.elapsed_s < 0.5
+    assert report.detection_latency_s <= report.elapsed_s
+
+
+async def test_monochromator_wait_until_idle_times_out(fake_device_manager, fake_icl_exe, monkeypatch):  # noqa: ARG001
+    # arrange
+    async def is_busy():
+        return True
+
+    async with fake_device_manager.monochromators[0] as monochromator:
+        monkeypatch.setattr(monochromator, 'is_busy', is_busy)
+
+        # act & assert
+        with pytest.raises(Exception, match='still busy'):
+            await monochromator.wait_until_idle(timeout=0.05)
@@ -3,7 +3,15 @@
 # horiba_sdk/devices/fake_responses/ccd.json
 # Look at /test/conftest.py for the definition of fake_icl_exe
 
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from horiba_sdk.communication import BinaryFrame, Response
 from horiba_sdk.core.clean_count_mode import CleanCountMode
+from horiba_sdk.core.command_batch import batched_commands
 from horiba_sdk.core.timer_resolution import TimerResolution
 from horiba_sdk.core.x_axis_conversion_type import XAxisConversionType
 
@@ -182,3 +190,220 @@ def test_ccd_acquisition_busy(fake_sync_icl_exe, fake_sync_device_manager):  # n
 
         # assert
         assert not acquisition_busy
+
+
+def test_ccd_batch_configuration(fake_sync_icl_exe, fake_sync_device_manager):  # noqa: ARG001
+    # arrange
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        with ccd.batch():
+            ccd.set_timer_resolution(TimerResolution._1000_MICROSECONDS)
+            ccd.set_exposure_time(100)
+            ccd.set_gain(0)
+            ccd.set_speed(2)
+            ccd.set_x_axis_conversion_type(XAxisConversionType.NONE)
+
+        # assert
+        assert ccd.get_gain_token() == 0
+
+
+def test_ccd_batch_is_sent_in_one_request(fake_sync_icl_exe, fake_sync_device_manager, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_batches = []
+    communicator = fake_sync_device_manager.communicator
+    request_with_responses = communicator.request_with_responses
+
+    def recording_request_with_responses(commands, response_timeout_s=5):
+        sent_batches.append([command.command for command in commands])
+        return request_with_responses(commands, response_timeout_s)
+
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        monkeypatch.setattr(communicator, 'request_with_responses', recording_request_with_responses)
+
+        # act
+        with ccd.batch():
+            ccd.set_exposure_time(100)
+            ccd.set_gain(0)
+            ccd.set_speed(2)
+
+        # assert
+        assert sent_batches == [['ccd_setExposureTime', 'ccd_setGain', 'ccd_setSpeed']]
+
+
+def test_ccd_batch_failure_raises_and_closes_the_batch(
+    fake_sync_icl_exe,  # noqa: ARG001
+    fake_sync_device_manager,
+    monkeypatch,
+):
+    # arrange
+    def failing_request_with_responses(commands, response_timeout_s=5):  # noqa: ARG001
+        return [
+            Response(command.id, command.command, errors=['[E];-2;ICL error: unknown command'] if index == 1 else [])
+            for index, command in enumerate(commands)
+        ]
+
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        monkeypatch.setattr(
+            fake_sync_device_manager.communicator, 'request_with_responses', failing_request_with_responses
+        )
+
+        # act
+        with pytest.raises(Exception, match='ccd_setGain'), ccd.batch():
+            ccd.set_exposure_time(100)
+            ccd.set_gain(0)
+        monkeypatch.undo()
+
+        # assert
+        assert batched_commands(id(ccd)) is None
+        with ccd.batch():
+            ccd.set_exposure_time(100)
+
+
+def test_ccd_getter_inside_batch_raises(fake_sync_icl_exe, fake_sync_device_manager):  # noqa: ARG001
+    # arrange
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        with pytest.raises(Exception, match='cannot be used inside a batch'), ccd.batch():
+            ccd.get_gain_token(refresh=True)
+
+        # assert
+        assert batched_commands(id(ccd)) is None
+
+
+def test_ccd_batch_does_not_capture_other_threads(fake_sync_icl_exe, fake_sync_device_manager):  # noqa: ARG001
+    # arrange
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd, ThreadPoolExecutor(max_workers=1) as executor:
+        # act
+        with ccd.batch():
+            ccd.set_exposure_time(100)
+            gain = executor.submit(ccd.get_gain_token, refresh=True).result(timeout=1)
+
+        # assert
+        assert gain == 0
+
+
+def test_ccd_binary_frames_waiting_for_retrieval_are_bounded(fake_sync_icl_exe, fake_sync_device_manager, monkeypatch):  # noqa: ARG001
+    # arrange
+    monkeypatch.setattr('horiba_sdk.sync.devices.single_devices.ccd._MAX_PENDING_BINARY_FRAMES', 2)
+    ccd = fake_sync_device_manager.charge_coupled_devices[0]
+
+    def binary_frame(value):
+        values = np.array([value], dtype='<u4')
+        return BinaryFrame.from_bytes(struct.pack('<HHHI4H', 0x1CE1, 2, 4, 1, ccd.id(), 1, 1, 1) + values.tobytes())
+
+    # act
+    for value in range(3):
+        ccd.receive_binary_frame(binary_frame(value))
+    frames = [ccd.get_binary_frame(timeout_in_s=1) for _ in range(2)]
+
+    # assert
+    assert [frame.data()[0] for frame in frames] == [1, 2]
+
+
+def test_ccd_settings_are_cached(fake_sync_icl_exe, fake_sync_device_manager, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_sync_device_manager.communicator.request_with_response
+
+    def recording_request_with_response(command, response_timeout_s=5):
+        sent_commands.append(command.command)
+        return request_with_response(command, response_timeout_s)
+
+    monkeypatch.setattr(fake_sync_device_manager.communicator, 'request_with_response', recording_request_with_response)
+
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        ccd.set_exposure_time(100)
+        cached_exposure_time = ccd.get_exposure_time()
+        first_gain = ccd.get_gain_token()
+        second_gain = ccd.get_gain_token()
+        refreshed_exposure_time = ccd.get_exposure_time(refresh=True)
+
+        # assert
+        assert cached_exposure_time == 100
+        assert first_gain == second_gain == 0
+        assert refreshed_exposure_time == 0
+        assert sent_commands.count('ccd_getGain') == 1
+        assert sent_commands.count('ccd_getExposureTime') == 1
+
+
+def test_ccd_settings_cache_is_cleared_by_restart(fake_sync_icl_exe, fake_sync_device_manager):  # noqa: ARG001
+    # arrange
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        ccd.set_exposure_time(100)
+
+        # act
+        ccd.restart()
+
+        # assert
+        assert ccd.get_exposure_time() == 0
+
+
+def test_ccd_set_trigger_input_validates_against_configuration(fake_sync_icl_exe, fake_sync_device_manager):  # noqa: ARG001
+    # arrange
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        ccd.set_trigger_input(True, 0, 1, 1)
+
+        # assert
+        assert ccd.configuration().speeds[127] == '500 kHz Wrap'
+        with pytest.raises(Exception, match='Trigger event 5 not found'):
+            ccd.set_trigger_input(True, 0, 5, 0)
+        with pytest.raises(Exception, match='Speed token 42 not found'):
+            ccd.set_speed(42)
+
+
+def test_ccd_acquire(fake_sync_icl_exe, fake_sync_device_manager):  # noqa: ARG001
+    # arrange
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        acquisitions = ccd.acquire(timeout_in_s=5)
+
+        # assert
+        assert acquisitions[0].acquisition_index == 1
+        assert acquisitions[0].regions_of_interest[0].y_data.shape == (1, 1000)
+
+
+def test_ccd_stream(fake_sync_icl_exe, fake_sync_device_manager, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_sync_device_manager.communicator.request_with_response
+
+    def recording_request_with_response(command, response_timeout_s=5):
+        sent_commands.append(command.command)
+        return request_with_response(command, response_timeout_s)
+
+    monkeypatch.setattr(fake_sync_device_manager.communicator, 'request_with_response', recording_request_with_response)
+
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        # act
+        frames = list(ccd.stream(count=3, buffer_size=2, timeout_in_s=5))
+
+        # assert
+        assert len(frames) == 3
+        assert frames[2][0].regions_of_interest[0].y_data.shape == (1, 1000)
+        assert sent_commands.count('ccd_setAcquisitionStart') == 3
+        assert 'ccd_setAcquisitionAbort' not in sent_commands
+
+
+def test_ccd_stream_aborts_when_closed_early(fake_sync_icl_exe, fake_sync_device_manager, monkeypatch):  # noqa: ARG001
+    # arrange
+    sent_commands = []
+    request_with_response = fake_sync_device_manager.communicator.request_with_response
+
+    def recording_request_with_response(command, response_timeout_s=5):
+        sent_commands.append(command.command)
+        return request_with_response(command, response_timeout_s)
+
+    monkeypatch.setattr(fake_sync_device_manager.communicator, 'request_with_response', recording_request_with_response)
+
+    with fake_sync_device_manager.charge_coupled_devices[0] as ccd:
+        stream = ccd.stream(timeout_in_s=5)
+
+        # act
+        next(stream)
+        stream.close()
+
+        # assert
+        assert sent_commands.count('ccd_setAcquisitionStart') == 2
+        assert sent_commands[-1] == 'ccd_setAcquisitionAbort'
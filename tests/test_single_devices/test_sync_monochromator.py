@@ -150,3 +150,18 @@ def test_monochromator_shutter_position(fake_sync_icl_exe, fake_sync_device_mana
         monochromator.close_shutter()
         # assert
         assert monochromator.get_shutter_position(Monochromator.Shutter.FIRST) == Monochromator.ShutterPosition.CLOSED
+
+
+def test_monochromator_wait_until_idle(fake_sync_icl_exe, fake_sync_device_manager, monkeypatch):  # noqa: ARG001
+    # arrange
+    busy_states = iter([True, False])
+
+    with fake_sync_device_manager.monochromators[0] as monochromator:
+        monkeypatch.setattr(monochromator, 'is_busy', lambda: next(busy_states))
+
+        # act
+        report = monochromator.wait_until_idle(timeout_in_s=1)
+
+    # assert
+    assert report.polls == 2
+    assert report.elapsed_s < 0.5
@@ -0,0 +1,81 @@
+# pylint: skip-file
+import contextlib
+import json
+import threading
+import time
+
+import pytest
+import websockets
+from websockets.sync.server import serve
+
+from horiba_sdk.communication import Command, CommunicationException
+from horiba_sdk.sync.communication import WebsocketCommunicator
+
+
+def _reply(websocket, request):
+    reply = {'id': request['id'], 'command': request['command'], 'results': {}, 'errors': []}
+    with contextlib.suppress(websockets.ConnectionClosed):
+        websocket.send(json.dumps(reply))
+
+
+@contextlib.contextmanager
+def _reordering_icl(batch_size, delays_by_command=None):
+    """ICL answering the first batch_size requests in reverse order, the delayed commands after their delay."""
+    delays_by_command = delays_by_command if delays_by_command is not None else {}
+
+    def handler(websocket):
+        held_back = []
+        for received, message in enumerate(websocket, start=1):
+            request = json.loads(message)
+            if request['command'] in delays_by_command:
+                threading.Timer(delays_by_command[request['command']], _reply, (websocket, request)).start()
+            else:
+                held_back.append(request)
+            if received >= batch_size:
+                for held_back_request in reversed(held_back):
+                    _reply(websocket, held_back_request)
+                held_back.clear()
+
+    with serve(handler, '127.0.0.1', 0) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            yield f'ws://127.0.0.1:{server.socket.getsockname()[1]}'
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def test_request_with_responses_matches_responses_arriving_out_of_order():
+    # arrange
+    commands = [Command('icl_info', {}), Command('ccd_getGain', {'index': 0}), Command('mono_isBusy', {'index': 0})]
+
+    with _reordering_icl(batch_size=len(commands)) as uri, WebsocketCommunicator(uri) as communicator:
+        # act
+        responses = communicator.request_with_responses(commands, response_timeout_s=1)
+
+    # assert
+    assert [response.id for response in responses] == [command.id for command in commands]
+    assert [response.command for response in responses] == [command.command for command in commands]
+
+
+def test_request_with_responses_timeout_discards_the_following_responses():
+    # arrange
+    commands = [
+        Command('ccd_getGain', {'index': 0}),
+        Command('icl_info', {}),
+        Command('mono_getPosition', {'index': 0}),
+    ]
+    delays_by_command = {'ccd_getGain': 0.3, 'mono_getPosition': 0.3}
+
+    with _reordering_icl(len(commands), delays_by_command) as uri, WebsocketCommunicator(uri) as communicator:
+        # act
+        with pytest.raises(CommunicationException):
+            communicator.request_with_responses(commands, response_timeout_s=0.1)
+        time.sleep(0.4)  # the late replies arrive
+        command = Command('ccd_getSpeed', {'index': 0})
+        response = communicator.request_with_response(command, response_timeout_s=1)
+
+    # assert
+    assert response.id == command.id
+    assert communicator.message_queue_statistics()['json_message_dict'].depth == 0